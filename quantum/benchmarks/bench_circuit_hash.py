@@ -0,0 +1,34 @@
+"""Micro-benchmark: structural circuit fingerprint vs. text-drawing hash.
+
+Run with:
+    poetry run python benchmarks/bench_circuit_hash.py
+"""
+
+import math
+import timeit
+
+from quantum_games.circuits import (
+    make_filter_circuit,
+    make_entangled_pair,
+    make_slots_circuit,
+    get_circuit_hash
+)
+
+CASES = {
+    "filter (1 qubit)": lambda: make_filter_circuit(5)[0],
+    "entangled (2 qubits)": lambda: make_entangled_pair(math.pi / 4)[0],
+    "slots (20 qubits)": lambda: make_slots_circuit(20, [i * 0.1 for i in range(20)])[0],
+}
+
+
+def bench(number: int = 200):
+    print(f"{'circuit':<22} {'v1 drawing (us)':>16} {'v2 structural (us)':>19} {'speedup':>8}")
+    for name, build in CASES.items():
+        circuit = build()
+        legacy = timeit.timeit(lambda: get_circuit_hash(circuit, version=1), number=number) / number
+        current = timeit.timeit(lambda: get_circuit_hash(circuit), number=number) / number
+        print(f"{name:<22} {legacy * 1e6:>16.1f} {current * 1e6:>19.1f} {legacy / current:>7.1f}x")
+
+
+if __name__ == "__main__":
+    bench()
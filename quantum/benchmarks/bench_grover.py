@@ -0,0 +1,82 @@
+"""Benchmark: Grover oracle depth and build time, legacy no-ancilla MCX vs size-aware synthesis.
+
+For each search width, one Grover iteration (oracle + diffuser) is built
+both ways and transpiled to a CX/RZ/SX basis. Depth and CX count are per
+iteration; multiply by the iteration count for a whole search.
+
+Run with:
+    poetry run python benchmarks/bench_grover.py
+    poetry run python benchmarks/bench_grover.py --min-qubits 4 --max-qubits 12
+"""
+
+import argparse
+import time
+
+from qiskit import QuantumCircuit, transpile
+
+from quantum_games.grover import (
+    build_grover_circuit,
+    card_flips,
+    grover_ancillas,
+    mcx_strategy,
+    optimal_iterations,
+    synthesize_mcx,
+)
+
+BASIS = ["cx", "rz", "sx", "x"]
+
+
+def legacy_iteration(n_qubits: int) -> QuantumCircuit:
+    """One iteration with the previous oracle: a bare ``qc.mcx`` and no ancillas."""
+    qc = QuantumCircuit(n_qubits)
+    for _ in range(2):
+        qc.x(range(n_qubits))
+        if n_qubits > 1:
+            qc.h(n_qubits - 1)
+            qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
+            qc.h(n_qubits - 1)
+        else:
+            qc.z(0)
+        qc.x(range(n_qubits))
+        qc.h(range(n_qubits))
+    return qc
+
+
+def stats(circuit: QuantumCircuit):
+    """(depth, CX count, transpile seconds) in the benchmark basis."""
+    started = time.perf_counter()
+    compiled = transpile(circuit, basis_gates=BASIS, optimization_level=1)
+    return compiled.depth(), compiled.count_ops().get("cx", 0), time.perf_counter() - started
+
+
+def bench(min_qubits: int, max_qubits: int):
+    # Load the transpiler plugins before timing anything
+    stats(legacy_iteration(2))
+
+    print(f"{'n':>3} {'strategy':>10} {'anc':>4} {'iters':>6} "
+          f"{'legacy depth':>13} {'legacy cx':>10} {'depth':>7} {'cx':>6} "
+          f"{'legacy tp ms':>13} {'tp ms':>7} {'build ms':>9} {'cached ms':>10}")
+
+    for n in range(min_qubits, max_qubits + 1):
+        legacy_depth, legacy_cx, legacy_seconds = stats(legacy_iteration(n))
+
+        synthesize_mcx.cache_clear()
+        started = time.perf_counter()
+        iteration = build_grover_circuit(n, card_flips(n, 0), iterations=1)
+        build = time.perf_counter() - started
+        started = time.perf_counter()
+        build_grover_circuit(n, card_flips(n, 0), iterations=1)
+        cached = time.perf_counter() - started
+
+        depth, cx, seconds = stats(iteration.remove_final_measurements(inplace=False))
+        print(f"{n:>3} {mcx_strategy(n - 1):>10} {grover_ancillas(n):>4} {optimal_iterations(n):>6} "
+              f"{legacy_depth:>13} {legacy_cx:>10} {depth:>7} {cx:>6} "
+              f"{legacy_seconds * 1e3:>13.1f} {seconds * 1e3:>7.1f} {build * 1e3:>9.2f} {cached * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--min-qubits", type=int, default=2)
+    parser.add_argument("--max-qubits", type=int, default=16)
+    args = parser.parse_args()
+    bench(args.min_qubits, args.max_qubits)
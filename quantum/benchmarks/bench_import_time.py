@@ -0,0 +1,94 @@
+"""Import-time budgets for the CLI and server entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in a fresh interpreter for
+each entry point and fails if its cumulative import time exceeds the budget,
+or if it pulls in a module that should only load on first use (qiskit and
+qiskit_ibm_runtime are imported lazily by the circuit builders and the
+runtime service). The best of several runs is used to smooth out noise.
+
+Run with:
+    poetry run python benchmarks/bench_import_time.py
+    poetry run python benchmarks/bench_import_time.py --top 15   # show slowest imports
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+# module -> cumulative import budget in milliseconds
+BUDGETS_MS = {
+    "quantum_games.cli": 500,
+    "quantum_games.games": 500,
+    "quantum_games.server": 900,
+}
+
+# Modules that must not be loaded just by importing an entry point
+DEFERRED = ("qiskit", "qiskit_ibm_runtime")
+
+
+def measure(module: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Args:
+        module: Dotted module name
+
+    Returns:
+        tuple: (module -> cumulative import time in microseconds, deferred modules that got loaded)
+    """
+    check = f"import sys, {module}; print(','.join(m for m in {DEFERRED!r} if m in sys.modules))"
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [str(SRC), os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", check],
+                          capture_output=True, text=True, env=env, check=True)
+
+    cumulative = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, self_us, total_us, name = (part.strip() for part in line.replace("import time:", "|").split("|"))
+        if total_us.isdigit():
+            cumulative[name] = int(total_us)
+    loaded = [m for m in proc.stdout.strip().split(",") if m]
+    return cumulative, loaded
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check entry-point import times against budgets")
+    parser.add_argument("--runs", type=int, default=3, help="Fresh-interpreter runs per module (best is kept)")
+    parser.add_argument("--top", type=int, default=0, help="Also list the N slowest imports per module")
+    args = parser.parse_args(argv)
+
+    failures = []
+    print(f"{'module':<24} {'import (ms)':>12} {'budget (ms)':>12}")
+    for module, budget in BUDGETS_MS.items():
+        runs = [measure(module) for _ in range(args.runs)]
+        cumulative, loaded = min(runs, key=lambda run: run[0].get(module, 0))
+        elapsed_ms = cumulative.get(module, 0) / 1000.0
+        print(f"{module:<24} {elapsed_ms:>12.1f} {budget:>12}")
+
+        if args.top:
+            for name, total in sorted(cumulative.items(), key=lambda item: -item[1])[1:args.top + 1]:
+                print(f"    {total / 1000.0:>8.1f}  {name}")
+
+        if elapsed_ms > budget:
+            failures.append(f"{module}: {elapsed_ms:.1f}ms exceeds {budget}ms budget")
+        if loaded:
+            failures.append(f"{module}: imports {', '.join(loaded)} eagerly")
+
+    if failures:
+        print("\nOver budget:")
+        for line in failures:
+            print(f"  {line}")
+        return 1
+
+    print("\nAll entry points within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
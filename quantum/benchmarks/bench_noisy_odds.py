@@ -0,0 +1,74 @@
+"""Benchmark: noisy odds tables on the batched density-matrix emulator.
+
+Times the odds sweep (8 filter rows + 39 entangled rows) on
+``local:noisy:<backend>``: compiling the templates against the device,
+one batched pass per game versus one pass per row, and a warm refresh that
+only samples shots from the cached distributions.
+
+Run with:
+    poetry run python benchmarks/bench_noisy_odds.py
+    poetry run python benchmarks/bench_noisy_odds.py --backend fake_kyiv --shots 8192
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from quantum_games import emulator
+from quantum_games.odds import _sweep_angles
+from quantum_games.templates import get_template
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Best wall time of ``fn`` in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def bench(backend: str, shots: int):
+    started = time.perf_counter()
+    engine = emulator.NoisyEngine(backend, seed=1)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    filter_angles, entangled_angles = _sweep_angles()
+    sweeps = [
+        (get_template("filter"), np.array([[theta] for theta in filter_angles])),
+        (get_template("entangled_pair"), np.array([[theta] for theta in entangled_angles])),
+    ]
+
+    started = time.perf_counter()
+    compiled = [engine.noise.compile(template) for template, _ in sweeps]
+    compile_ms = (time.perf_counter() - started) * 1000
+
+    batched_ms = timed(lambda: [emulator._simulate(c, values) for c, (_, values) in zip(compiled, sweeps)])
+    per_row_ms = timed(lambda: [emulator._simulate(c, row[None])
+                                for c, (_, values) in zip(compiled, sweeps) for row in values])
+
+    pubs = [(template, values) for template, values in sweeps]
+    engine.run(pubs, shots)
+    warm_ms = timed(lambda: engine.run(pubs, shots))
+
+    rows = sum(len(values) for _, values in sweeps)
+    print(f"backend {engine.name}, {rows} rows, {shots} shots/row")
+    print(f"{'load calibration':<26} {load_ms:>9.1f} ms")
+    print(f"{'compile templates':<26} {compile_ms:>9.1f} ms")
+    print(f"{'simulate, one pass/row':<26} {per_row_ms:>9.2f} ms")
+    print(f"{'simulate, batched':<26} {batched_ms:>9.2f} ms  ({per_row_ms / batched_ms:.1f}x)")
+    print(f"{'odds refresh, cached':<26} {warm_ms:>9.2f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", default="fake_sherbrooke", help="Fake backend or snapshot name")
+    parser.add_argument("--shots", type=int, default=4096, help="Shots per row")
+    args = parser.parse_args()
+    bench(args.backend, args.shots)
+
+
+if __name__ == "__main__":
+    main()
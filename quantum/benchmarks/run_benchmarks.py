@@ -0,0 +1,214 @@
+"""End-to-end benchmark suite with per-stage latency budgets.
+
+Times each stage of a play separately: circuit builders, get_circuit_hash,
+run_sampler on a local engine and on a fake (snapshot) IBM backend, the
+play_* adapters and the FastAPI endpoints through an in-process client.
+Results are compared against JSON baselines and the run fails if any stage's
+median exceeds its baseline by more than the allowed threshold.
+
+Run with:
+    poetry run python benchmarks/run_benchmarks.py              # compare
+    poetry run python benchmarks/run_benchmarks.py --update     # re-baseline
+    poetry run python benchmarks/run_benchmarks.py -k sampler   # subset
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+# Plays should measure the pipeline, not the batching window
+os.environ.setdefault("BATCH_WINDOW_MS", "0")
+os.environ.setdefault("QISKIT_BACKEND", "local:analytic")
+os.environ.setdefault("LOCAL_SEED", "1234")
+
+import qiskit
+
+from quantum_games.circuits import (
+    get_circuit_hash,
+    make_entangled_pair,
+    make_filter_circuit,
+    make_slots_circuit,
+)
+from quantum_games.games import play_entangled_wager, play_filter
+from quantum_games.service import run_sampler
+from quantum_games.templates import get_transpiled_template, make_pub
+
+BASELINE_PATH = Path(__file__).with_name("baselines.json")
+FAKE_BACKEND = "fake:fake_manila"
+
+# Allowed slowdown of a stage's median before it counts as a regression
+DEFAULT_THRESHOLD = 1.5
+
+
+def _api_client():
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    return TestClient(app)
+
+
+def build_cases() -> Dict[str, Tuple[Callable[[], object], int]]:
+    """Return stage name -> (callable, iterations)."""
+    slots_angles = [i * 0.1 for i in range(20)]
+    filter_circuit = make_filter_circuit(5)[0]
+    slots_circuit = make_slots_circuit(20, slots_angles)[0]
+
+    # Transpile once up front so the sampler stage times execution only
+    get_transpiled_template("filter", FAKE_BACKEND)
+    client = _api_client()
+
+    return {
+        "build.filter": (lambda: make_filter_circuit(5), 500),
+        "build.entangled_pair": (lambda: make_entangled_pair(math.pi / 4), 500),
+        "build.slots_20": (lambda: make_slots_circuit(20, slots_angles), 200),
+        "hash.filter": (lambda: get_circuit_hash(filter_circuit), 500),
+        "hash.slots_20": (lambda: get_circuit_hash(slots_circuit), 200),
+        "sampler.local_analytic": (lambda: run_sampler(filter_circuit, shots=1024, backend_name="local:analytic"), 200),
+        "sampler.fake_manila": (
+            lambda: run_sampler(make_pub("filter", [1.0], FAKE_BACKEND), shots=1024, backend_name=FAKE_BACKEND), 20
+        ),
+        "play.filter": (lambda: play_filter(5, 1024), 200),
+        "play.entangled_wager": (lambda: play_entangled_wager(3, 5, 1024), 200),
+        "api.root": (lambda: client.get("/"), 200),
+        "api.play_filter": (lambda: client.post("/play/filter", json={"qcount": 5, "shots": 1024}), 100),
+        "api.play_entangled_wager": (
+            lambda: client.post("/play/entangled-wager", json={"qa": 3, "qb": 5, "shots": 1024}), 100
+        ),
+    }
+
+
+def time_stage(fn: Callable[[], object], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """
+    Time one stage.
+
+    Args:
+        fn: Stage to call
+        iterations: Number of timed calls
+        warmup: Untimed calls first (caches, lazy imports)
+
+    Returns:
+        dict: median_us, p95_us, min_us and iterations
+
+    Raises:
+        RuntimeError: If an API stage answers with anything but 200
+    """
+    for _ in range(warmup):
+        _check(fn())
+
+    samples: List[float] = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        response = fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+        _check(response)
+
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 1),
+        "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 1),
+        "min_us": round(samples[0], 1),
+        "iterations": iterations,
+    }
+
+
+def _check(response: object):
+    """Fail the stage if an API call didn't succeed, so errors are never timed as plays."""
+    status = getattr(response, "status_code", None)
+    if status is not None and status != 200:
+        raise RuntimeError(f"API stage returned {status}: {response.text[:200]}")
+
+
+def compare(results: Dict[str, Dict[str, float]], baselines: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """
+    Check results against baselines.
+
+    A stage may carry its own "threshold" in the baseline file to override
+    the default. Stages without a baseline are reported but never fail.
+
+    Args:
+        results: Stage name -> timing
+        baselines: Stage name -> baseline timing
+        threshold: Default allowed median slowdown ratio
+
+    Returns:
+        list: Human-readable regressions (empty if none)
+    """
+    regressions = []
+    for name, timing in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+        limit = baseline.get("threshold", threshold)
+        ratio = timing["median_us"] / baseline["median_us"]
+        if ratio > limit:
+            regressions.append(
+                f"{name}: median {timing['median_us']:.1f}us is {ratio:.2f}x baseline "
+                f"{baseline['median_us']:.1f}us (limit {limit:.2f}x)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Quantum games benchmark suite")
+    parser.add_argument("--update", action="store_true", help="Write results as the new baselines")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="Baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed median slowdown ratio (default 1.5)")
+    parser.add_argument("-k", dest="keyword", default=None, help="Only run stages whose name contains this")
+    args = parser.parse_args(argv)
+
+    cases = build_cases()
+    if args.keyword:
+        cases = {name: case for name, case in cases.items() if args.keyword in name}
+
+    stored = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"stages": {}}
+    baselines = stored.get("stages", {})
+
+    results = {}
+    print(f"{'stage':<28} {'median (us)':>12} {'p95 (us)':>10} {'baseline':>10} {'ratio':>7}")
+    for name, (fn, iterations) in cases.items():
+        results[name] = timing = time_stage(fn, iterations)
+        baseline = baselines.get(name, {}).get("median_us")
+        ratio = f"{timing['median_us'] / baseline:>6.2f}x" if baseline else f"{'-':>7}"
+        print(f"{name:<28} {timing['median_us']:>12.1f} {timing['p95_us']:>10.1f} "
+              f"{baseline or '-':>10} {ratio}")
+
+    if args.update:
+        for name, timing in results.items():
+            # Keep hand-tuned per-stage thresholds across re-baselines
+            if "threshold" in baselines.get(name, {}):
+                timing["threshold"] = baselines[name]["threshold"]
+            baselines[name] = timing
+        stored = {
+            "environment": {
+                "python": platform.python_version(),
+                "qiskit": qiskit.__version__,
+                "machine": platform.machine(),
+            },
+            "stages": dict(sorted(baselines.items())),
+        }
+        args.baseline.write_text(json.dumps(stored, indent=2) + "\n")
+        print(f"\nWrote {len(results)} baselines to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baselines, args.threshold)
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+
+    print("\nAll stages within budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""Admission control: per-client token buckets, priority run slots and a QPU-seconds budget."""
+
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from .grover import grover_ancillas, optimal_iterations
+from .metrics import ADMISSION_BUDGET, ADMISSION_DEPTH, ADMISSION_QPU_SECONDS, ADMISSION_SHED
+from .settings import get_settings
+
+# Priority tiers, most important first, with the share of max_queue each may fill
+# before it is shed (so lower tiers are turned away while VIP and live play still get in)
+TIERS = {"vip": 1.0, "live": 0.9, "odds": 0.5, "analytics": 0.25}
+
+# Smoothing for the average slot hold time behind queue-full Retry-After
+_HOLD_EWMA = 0.2
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request is shed; the server answers 429 with Retry-After.
+
+    Args:
+        reason: "queue_full", "rate_limited" or "budget_exhausted"
+        retry_after: Seconds after which a retry could succeed
+    """
+
+    def __init__(self, reason: str, retry_after: float, message: str):
+        super().__init__(message)
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+def circuit_cost(game: str, n_qubits: int = 1) -> float:
+    """
+    Relative cost of one shot of a game's circuit: qubits times oracle rounds.
+
+    Args:
+        game: Game name ("filter", "entangled_wager", "slots" or "grover")
+        n_qubits: Reels (slots) or search qubits (grover)
+
+    Returns:
+        float: Cost units per shot
+    """
+    if game == "filter":
+        return 1.0
+    if game == "entangled_wager":
+        return 2.0
+    if game == "slots":
+        return float(n_qubits)
+    if game == "grover":
+        return float((n_qubits + grover_ancillas(n_qubits)) * max(1, optimal_iterations(n_qubits)))
+    raise ValueError(f"Unknown game '{game}'")
+
+
+class TokenBucket:
+    """
+    Token bucket refilled continuously at ``rate`` up to ``capacity``.
+
+    A full bucket admits any single request, even one costing more than the
+    capacity; the bucket then goes negative and the client waits it off.
+    """
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+
+    def refill(self, now: float) -> float:
+        if now > self.updated:
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+        return self.tokens
+
+    def shortfall(self, amount: float, now: float) -> float:
+        """Seconds until ``amount`` could be taken (0 if it can be taken now)."""
+        needed = min(amount, self.capacity) - self.refill(now)
+        if needed <= 0:
+            return 0.0
+        return needed / self.rate if self.rate > 0 else math.inf
+
+    def take(self, amount: float):
+        self.tokens -= amount
+
+
+class Slot:
+    """
+    An admitted request; ``async with`` waits for a run slot in priority order.
+
+    Returned by ``AdmissionController.admit``. Leaving the block (or calling
+    ``release`` on a slot never entered) gives the place back.
+    """
+
+    __slots__ = ("_controller", "tier", "priority", "_state", "_started")
+
+    def __init__(self, controller: "AdmissionController", tier: str):
+        self._controller = controller
+        self.tier = tier
+        self.priority = list(TIERS).index(tier)
+        self._state = "queued"
+        self._started = 0.0
+
+    async def __aenter__(self) -> "Slot":
+        await self._controller._acquire(self)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+    def release(self):
+        """Give the slot back (idempotent)."""
+        self._controller._release(self)
+
+
+class AdmissionController:
+    """
+    Decide which requests reach the sampler, and in what order.
+
+    A request is admitted only if (1) the queue (admitted requests waiting
+    for or holding a run slot) is below its tier's share of ``max_queue``,
+    (2) its client's token bucket holds ``cost`` (shots x circuit cost), and
+    (3) the QPU budget holds its estimated QPU seconds. Otherwise it is shed
+    with a Retry-After estimate. At most ``max_inflight`` admitted requests
+    run at once; the rest wait and are started highest tier first.
+
+    Must be used from inside one running event loop.
+
+    Args:
+        client_rate: Cost units per second each client's bucket refills
+        client_burst: Bucket capacity per client
+        max_inflight: Admitted requests allowed to run at once
+        max_queue: Queue depth at which VIP requests are shed (lower tiers shed earlier)
+        qpu_budget_s: QPU seconds per budget window (unlimited if None)
+        budget_window_s: Seconds over which the budget refills
+        max_clients: Client buckets kept (least recently used are dropped)
+    """
+
+    def __init__(self, client_rate: float = 100000.0, client_burst: float = 1000000.0,
+                 max_inflight: int = 256, max_queue: int = 1024, qpu_budget_s: Optional[float] = None,
+                 budget_window_s: float = 86400.0, max_clients: int = 10000):
+        self.client_rate = client_rate
+        self.client_burst = client_burst
+        self.max_inflight = max_inflight
+        self.max_queue = max_queue
+        self.max_clients = max_clients
+        self._clients: "OrderedDict[str, TokenBucket]" = OrderedDict()
+        self._budget = (TokenBucket(qpu_budget_s / budget_window_s, qpu_budget_s)
+                        if qpu_budget_s is not None else None)
+        # (priority, arrival, future) of slots waiting to run
+        self._waiters: list = []
+        self._arrivals = itertools.count()
+        self.queued = 0
+        self.running = 0
+        self._hold_s = 0.0
+        self.shed: Dict[str, int] = {}
+        self.qpu_seconds = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Admitted requests waiting for or holding a run slot."""
+        return self.queued + self.running
+
+    def admit(self, client: str, tier: str = "live", cost: float = 0.0,
+              qpu_seconds: float = 0.0) -> Slot:
+        """
+        Admit a request or shed it.
+
+        Args:
+            client: Client identity the token bucket is keyed by
+            tier: Priority tier (see TIERS)
+            cost: Token cost, normally shots x ``circuit_cost``
+            qpu_seconds: Estimated QPU seconds charged to the budget
+
+        Returns:
+            Slot: Use as ``async with slot:`` around the sampler work
+
+        Raises:
+            ValueError: If the tier is unknown
+            AdmissionRejected: If the queue, the client's bucket or the budget is exhausted
+        """
+        if tier not in TIERS:
+            raise ValueError(f"Unknown tier '{tier}'. Available: {', '.join(TIERS)}")
+        now = time.monotonic()
+
+        limit = max(1, int(self.max_queue * TIERS[tier]))
+        if self.depth >= limit:
+            # Time for the queue to drain below this tier's limit at the observed hold time
+            drain = self._hold_s * (self.depth - limit + 1) / max(self.max_inflight, 1)
+            self._reject(tier, "queue_full", drain, f"Queue is full for tier '{tier}' ({self.depth} requests)")
+
+        bucket = self._clients.get(client)
+        if bucket is None:
+            bucket = self._clients[client] = TokenBucket(self.client_rate, self.client_burst)
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(client)
+        wait = bucket.shortfall(cost, now)
+        if wait > 0:
+            self._reject(tier, "rate_limited", wait, f"Rate limit exceeded for client '{client}'")
+
+        if self._budget is not None:
+            wait = self._budget.shortfall(qpu_seconds, now)
+            if wait > 0:
+                self._reject(tier, "budget_exhausted", wait, "QPU time budget exhausted")
+            self._budget.take(qpu_seconds)
+            ADMISSION_BUDGET.set(self._budget.tokens)
+
+        bucket.take(cost)
+        self.qpu_seconds += qpu_seconds
+        ADMISSION_QPU_SECONDS.inc(qpu_seconds, tier=tier)
+        self.queued += 1
+        self._publish()
+        return Slot(self, tier)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue depth, shed counts and budget, for GET /admission."""
+        return {
+            "queued": self.queued,
+            "running": self.running,
+            "max_inflight": self.max_inflight,
+            "shed_at": {tier: max(1, int(self.max_queue * share)) for tier, share in TIERS.items()},
+            "shed": dict(self.shed),
+            "qpu_seconds": self.qpu_seconds,
+            "budget_remaining_s": (self._budget.refill(time.monotonic())
+                                   if self._budget is not None else None),
+            "clients": len(self._clients)
+        }
+
+    def _reject(self, tier: str, reason: str, retry_after: float, message: str):
+        self.shed[reason] = self.shed.get(reason, 0) + 1
+        ADMISSION_SHED.inc(tier=tier, reason=reason)
+        raise AdmissionRejected(reason, retry_after, message)
+
+    async def _acquire(self, slot: Slot):
+        if slot._state != "queued":
+            raise RuntimeError("Slot has already been used")
+        if self.running >= self.max_inflight or self._waiters:
+            future = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (slot.priority, next(self._arrivals), future))
+            self._wake()
+            try:
+                await future
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # Granted as we were cancelled: pass the slot on
+                    self._start(slot)
+                slot.release()
+                raise
+        else:
+            self.running += 1
+        self._start(slot)
+
+    def _start(self, slot: Slot):
+        if slot._state == "queued":
+            self.queued -= 1
+            slot._state = "running"
+            slot._started = time.monotonic()
+            self._publish()
+
+    def _release(self, slot: Slot):
+        if slot._state == "queued":
+            self.queued -= 1
+        elif slot._state == "running":
+            self.running -= 1
+            held = time.monotonic() - slot._started
+            self._hold_s += _HOLD_EWMA * (held - self._hold_s) if self._hold_s else held
+            self._wake()
+        slot._state = "done"
+        self._publish()
+
+    def _wake(self):
+        while self._waiters and self.running < self.max_inflight:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                self.running += 1
+                future.set_result(None)
+
+    def _publish(self):
+        ADMISSION_DEPTH.set(self.queued, state="queued")
+        ADMISSION_DEPTH.set(self.running, state="running")
+
+
+# Global controller instance
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission() -> AdmissionController:
+    """
+    Return the process-wide admission controller, configured from settings.
+
+    Uses ADMISSION_CLIENT_RATE (default 100000 cost units/s), ADMISSION_CLIENT_BURST
+    (default 1000000), ADMISSION_MAX_INFLIGHT (default 256), ADMISSION_MAX_QUEUE
+    (default 1024), ADMISSION_QPU_BUDGET_SECONDS (unlimited if not set) and
+    ADMISSION_BUDGET_WINDOW_SECONDS (default 86400).
+
+    Returns:
+        AdmissionController: The shared controller
+    """
+    global _controller
+
+    if _controller is None:
+        settings = get_settings()
+        _controller = AdmissionController(
+            client_rate=settings.admission_client_rate,
+            client_burst=settings.admission_client_burst,
+            max_inflight=settings.admission_max_inflight,
+            max_queue=settings.admission_max_queue,
+            qpu_budget_s=settings.admission_qpu_budget_seconds,
+            budget_window_s=settings.admission_budget_window_seconds,
+        )
+
+    return _controller
@@ -0,0 +1,228 @@
+"""Micro-batching scheduler that coalesces concurrent plays into shared sampler jobs."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .engines import simulate_latency
+from .metrics import observe_stage
+from .multiplex import run_multiplexed
+from .routing import run_routed
+from .service import resolve_backend_name
+from .settings import get_settings
+from .templates import run_plays
+
+# (backend_name, shots) - plays can only share a job when both match
+BatchKey = Tuple[Optional[str], int]
+
+
+class _Bucket:
+    """Plays waiting for the same backend/shots combination."""
+
+    __slots__ = ("created", "deadline", "items")
+
+    def __init__(self, created: float, deadline: float):
+        self.created = created
+        self.deadline = deadline
+        self.items: List[Tuple[Any, Future]] = []
+
+
+class SamplerBatcher:
+    """
+    Coalesce plays submitted concurrently into multi-PUB sampler jobs.
+
+    Each submitted play waits at most ``window_s`` seconds (or until
+    ``max_batch_size`` plays are queued for the same backend and shot count)
+    before the whole group is sent to the runner as a single job. Every caller
+    receives a future resolving to its own slice of the job result. Plays
+    without an explicit backend are routed per job when QISKIT_BACKENDS is set.
+
+    Plays are whatever the runner accepts: ``(game, parameter values)`` pairs
+    for the default ``templates.run_plays`` (one PUB per play) or
+    ``multiplex.run_multiplexed`` (plays packed onto disjoint qubits), or
+    circuits/PUBs for ``run_sampler``.
+
+    Args:
+        window_s: Maximum time a play waits for companions before dispatch
+        max_batch_size: Maximum number of plays per job
+        max_inflight: Maximum number of jobs running concurrently
+        runner: Callable with the ``run_sampler`` signature (defaults to ``run_plays``)
+    """
+
+    def __init__(
+        self,
+        window_s: float = 0.02,
+        max_batch_size: int = 32,
+        max_inflight: int = 4,
+        runner: Optional[Callable[..., Dict[str, Any]]] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+
+        self.window_s = max(0.0, window_s)
+        self.max_batch_size = max_batch_size
+        self._runner = runner or run_plays
+        self._cond = threading.Condition()
+        self._buckets: Dict[BatchKey, _Bucket] = {}
+        self._executor = ThreadPoolExecutor(max_workers=max_inflight, thread_name_prefix="sampler-batch")
+        self._worker: Optional[threading.Thread] = None
+        self.jobs_submitted = 0
+        self.plays_submitted = 0
+
+    def submit(self, circuit, shots: int, backend_name: Optional[str] = None) -> Future:
+        """
+        Queue a circuit for the next batch.
+
+        Args:
+            circuit: Play to run, in the form the runner accepts
+            shots: Number of shots for this play
+            backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+        Returns:
+            Future: Resolves to a dict with job_id, backend, shots, counts and batch_size
+        """
+        future: Future = Future()
+        key = (backend_name, shots)
+
+        with self._cond:
+            self._ensure_worker()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                now = time.monotonic()
+                bucket = self._buckets[key] = _Bucket(now, now + self.window_s)
+            bucket.items.append((circuit, future))
+            self.plays_submitted += 1
+            # Wake the dispatcher for a new deadline or a full batch
+            if len(bucket.items) == 1 or len(bucket.items) >= self.max_batch_size:
+                self._cond.notify()
+
+        return future
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._loop, name="sampler-batcher", daemon=True)
+            self._worker.start()
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                ready = self._take_ready()
+                while not ready:
+                    self._cond.wait(self._next_timeout())
+                    ready = self._take_ready()
+
+            for key, items in ready:
+                self.jobs_submitted += 1
+                self._executor.submit(self._dispatch, key, items)
+
+    def _next_timeout(self) -> Optional[float]:
+        if not self._buckets:
+            return None
+        deadline = min(bucket.deadline for bucket in self._buckets.values())
+        return max(0.0, deadline - time.monotonic())
+
+    def _take_ready(self) -> List[Tuple[BatchKey, List[Tuple[Any, Future]]]]:
+        now = time.monotonic()
+        ready = []
+
+        for key, bucket in list(self._buckets.items()):
+            if len(bucket.items) < self.max_batch_size and now < bucket.deadline:
+                continue
+            del self._buckets[key]
+            # Time the oldest play spent waiting for companions
+            observe_stage("batch_wait", now - bucket.created, backend=resolve_backend_name(key[0]))
+            for start in range(0, len(bucket.items), self.max_batch_size):
+                ready.append((key, bucket.items[start:start + self.max_batch_size]))
+
+        return ready
+
+    def _dispatch(self, key: BatchKey, items: List[Tuple[Any, Future]]):
+        # Drop plays whose callers gave up before the job was sent
+        items = [(circuit, future) for circuit, future in items if future.set_running_or_notify_cancel()]
+        if not items:
+            return
+
+        backend_name, shots = key
+        circuits = [circuit for circuit, _ in items]
+
+        try:
+            result = run_routed(self._runner, circuits, shots, backend_name)
+        except Exception as e:
+            for _, future in items:
+                future.set_exception(e)
+            return
+
+        counts_list = result["counts"] if len(circuits) > 1 else [result["counts"]]
+
+        for (_, future), counts in zip(items, counts_list):
+            future.set_result({
+                "job_id": result["job_id"],
+                "backend": result["backend"],
+                "shots": shots,
+                "counts": counts,
+                "batch_size": len(items)
+            })
+
+
+# Global batcher instance
+_batcher: Optional[SamplerBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_batcher() -> SamplerBatcher:
+    """
+    Return the process-wide batcher, configured from environment.
+
+    Uses BATCH_WINDOW_MS (default 20) and BATCH_MAX_SIZE (default 32). With
+    BATCH_MULTIPLEX=1, each batch is packed onto disjoint qubits of as few
+    wide circuits as possible instead of running one PUB per play.
+
+    Returns:
+        SamplerBatcher: The shared batcher instance
+    """
+    global _batcher
+
+    with _batcher_lock:
+        if _batcher is None:
+            settings = get_settings()
+            _batcher = SamplerBatcher(
+                window_s=settings.batch_window_ms / 1000.0,
+                max_batch_size=settings.batch_max_size,
+                runner=run_multiplexed if settings.batch_multiplex else run_plays,
+            )
+
+    return _batcher
+
+
+def run_batched(circuit, shots: int, backend_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a single circuit through the shared batcher and wait for its result.
+
+    Args:
+        circuit: ``(game, parameter values)`` play to run
+        shots: Number of shots
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+    Returns:
+        dict: Result with job_id, backend, shots, counts and batch_size
+    """
+    return get_batcher().submit(circuit, shots, backend_name).result()
+
+
+async def run_batched_async(circuit, shots: int, backend_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a single circuit through the shared batcher without blocking the event loop.
+
+    Args:
+        circuit: ``(game, parameter values)`` play to run
+        shots: Number of shots
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+    Returns:
+        dict: Result with job_id, backend, shots, counts and batch_size
+    """
+    result = await asyncio.wrap_future(get_batcher().submit(circuit, shots, backend_name))
+    await simulate_latency(result["backend"])
+    return result
@@ -1,12 +1,51 @@
 """Functions that build quantum circuits from parameters."""
 
 import math
-from typing import List, Dict, Any
-from qiskit import QuantumCircuit
+from typing import TYPE_CHECKING, List, Dict, Any
 import hashlib
+from .metrics import timed
 
+if TYPE_CHECKING:
+    # Builders import qiskit on first use, so modules that only need the
+    # angle mappings or hashing stay cheap to import
+    from qiskit import QuantumCircuit
 
-def make_filter_circuit(qcount: int) -> tuple[QuantumCircuit, Dict[str, Any]]:
+
+def filter_theta(qcount: int) -> float:
+    """
+    Map a quantum chip count to the filter game's RY rotation angle.
+    
+    Args:
+        qcount: Number of quantum chips
+    
+    Returns:
+        float: Rotation angle in radians
+    """
+    # Using a simple linear mapping: theta = theta_0 + alpha * qcount
+    # Clamped between theta_min and theta_max
+    theta_0 = math.pi / 4  # Base angle (45 degrees)
+    alpha = 0.1  # Scaling factor
+    theta_min = 0.0
+    theta_max = math.pi / 2  # 90 degrees max
+    
+    return max(theta_min, min(theta_max, theta_0 + alpha * qcount))
+
+
+def entangled_theta(qcount_a: int, qcount_b: int) -> float:
+    """
+    Map both players' chip counts to the Entangled Wager phase angle.
+    
+    Args:
+        qcount_a: Player A quantum chips
+        qcount_b: Player B quantum chips
+    
+    Returns:
+        float: Phase angle in radians
+    """
+    return (qcount_a - qcount_b) * 0.1 * math.pi
+
+
+def make_filter_circuit(qcount: int) -> tuple["QuantumCircuit", Dict[str, Any]]:
     """
     Build a simple filter circuit using RY rotation based on qcount.
     
@@ -20,15 +59,9 @@ def make_filter_circuit(qcount: int) -> tuple[QuantumCircuit, Dict[str, Any]]:
     Returns:
         tuple: (circuit, metadata dict with theta and qcount)
     """
-    # Calculate theta based on qcount
-    # Using a simple linear mapping: theta = theta_0 + alpha * qcount
-    # Clamped between theta_min and theta_max
-    theta_0 = math.pi / 4  # Base angle (45 degrees)
-    alpha = 0.1  # Scaling factor
-    theta_min = 0.0
-    theta_max = math.pi / 2  # 90 degrees max
+    theta = filter_theta(qcount)
     
-    theta = max(theta_min, min(theta_max, theta_0 + alpha * qcount))
+    from qiskit import QuantumCircuit
     
     # Build the circuit
     qc = QuantumCircuit(1, 1)
@@ -45,7 +78,7 @@ def make_filter_circuit(qcount: int) -> tuple[QuantumCircuit, Dict[str, Any]]:
     return qc, metadata
 
 
-def make_entangled_pair(theta: float) -> tuple[QuantumCircuit, Dict[str, Any]]:
+def make_entangled_pair(theta: float) -> tuple["QuantumCircuit", Dict[str, Any]]:
     """
     Build a circuit that creates an entangled Bell pair with parameterized rotation.
     
@@ -57,6 +90,8 @@ def make_entangled_pair(theta: float) -> tuple[QuantumCircuit, Dict[str, Any]]:
     Returns:
         tuple: (circuit, metadata dict)
     """
+    from qiskit import QuantumCircuit
+    
     qc = QuantumCircuit(2, 2)
     
     # Create Bell pair
@@ -79,7 +114,7 @@ def make_entangled_pair(theta: float) -> tuple[QuantumCircuit, Dict[str, Any]]:
     return qc, metadata
 
 
-def make_slots_circuit(n_qubits: int, angles: List[float]) -> tuple[QuantumCircuit, Dict[str, Any]]:
+def make_slots_circuit(n_qubits: int, angles: List[float]) -> tuple["QuantumCircuit", Dict[str, Any]]:
     """
     Build a multi-qubit circuit for slot machine style games.
     
@@ -96,6 +131,8 @@ def make_slots_circuit(n_qubits: int, angles: List[float]) -> tuple[QuantumCircu
     if len(angles) != n_qubits:
         raise ValueError(f"Number of angles ({len(angles)}) must match n_qubits ({n_qubits})")
     
+    from qiskit import QuantumCircuit
+    
     qc = QuantumCircuit(n_qubits, n_qubits)
     
     # Apply RY rotation to each qubit
@@ -115,26 +152,118 @@ def make_slots_circuit(n_qubits: int, angles: List[float]) -> tuple[QuantumCircu
     return qc, metadata
 
 
-def get_circuit_hash(circuit: QuantumCircuit) -> str:
+def make_hadamard_circuit(n_qubits: int = 8) -> tuple["QuantumCircuit", Dict[str, Any]]:
+    """
+    Build a circuit that measures n qubits in uniform superposition.
+    
+    Every shot yields n independent, uniformly random bits, which feed the
+    entropy pool (8 qubits = one random byte per shot).
+    
+    Args:
+        n_qubits: Number of qubits (bits per shot)
+    
+    Returns:
+        tuple: (circuit, metadata dict)
+    """
+    if n_qubits < 1:
+        raise ValueError(f"n_qubits must be at least 1 (got {n_qubits})")
+    
+    from qiskit import QuantumCircuit
+    
+    qc = QuantumCircuit(n_qubits, n_qubits)
+    qc.h(range(n_qubits))
+    qc.measure(range(n_qubits), range(n_qubits))
+    
+    metadata = {
+        "circuit_type": "hadamard",
+        "num_qubits": n_qubits
+    }
+    
+    return qc, metadata
+
+
+# Bump when the fingerprint format changes; audit records store the version
+# they were hashed with so they can still be verified later.
+CIRCUIT_HASH_VERSION = 2
+
+# Float parameters are rounded to this many decimals before hashing
+_PARAM_DECIMALS = 10
+
+
+def _normalize_param(param: Any) -> str:
+    """Render a gate parameter in a canonical, drawer-independent form."""
+    try:
+        value = round(float(param), _PARAM_DECIMALS)
+    except (TypeError, ValueError):
+        # Unbound parameter expressions (or non-scalar params) hash by name
+        return str(param)
+    
+    # Avoid distinguishing -0.0 from 0.0
+    return f"{value + 0.0:.{_PARAM_DECIMALS}f}"
+
+
+def circuit_fingerprint(circuit: "QuantumCircuit") -> str:
+    """
+    Build a canonical text fingerprint of a circuit's instruction stream.
+    
+    The fingerprint lists each instruction's gate name, fixed-precision
+    parameters and qubit/clbit indices, so it only changes when the circuit
+    itself changes (not when Qiskit's drawer does).
+    
+    Args:
+        circuit: The quantum circuit to fingerprint
+    
+    Returns:
+        str: Canonical fingerprint string
+    """
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+    clbit_index = {c: i for i, c in enumerate(circuit.clbits)}
+    
+    parts = [f"v{CIRCUIT_HASH_VERSION}", f"q{circuit.num_qubits}", f"c{circuit.num_clbits}"]
+    for instruction in circuit.data:
+        operation = instruction.operation
+        params = ",".join(_normalize_param(p) for p in operation.params)
+        qubits = ",".join(str(qubit_index[q]) for q in instruction.qubits)
+        clbits = ",".join(str(clbit_index[c]) for c in instruction.clbits)
+        parts.append(f"{operation.name}({params})[{qubits}][{clbits}]")
+    
+    return ";".join(parts)
+
+
+def get_circuit_hash(circuit: "QuantumCircuit", version: int = CIRCUIT_HASH_VERSION) -> str:
     """
     Generate a stable hash of a quantum circuit for audit purposes.
     
+    Version 2 (current) hashes the structural fingerprint from
+    circuit_fingerprint. Version 1 hashes the ASCII circuit drawing and is
+    kept only to verify audit records written before version 2.
+    
     Args:
         circuit: The quantum circuit to hash
+        version: Hash format version
     
     Returns:
         str: Hexadecimal hash string
     """
-    # Use string representation for stable hashing
-    # In Qiskit 2.x, use the circuit's string representation
-    circuit_str = str(circuit)
-    return hashlib.sha256(circuit_str.encode()).hexdigest()
+    with timed("hash"):
+        if version == 1:
+            circuit_str = str(circuit)
+        elif version == CIRCUIT_HASH_VERSION:
+            circuit_str = circuit_fingerprint(circuit)
+        else:
+            raise ValueError(f"Unknown circuit hash version: {version}")
+        
+        return hashlib.sha256(circuit_str.encode()).hexdigest()
 
 
-def make_grover_oracle(n_qubits: int, marked_state: str) -> tuple[QuantumCircuit, Dict[str, Any]]:
+def make_grover_oracle(n_qubits: int, marked_state: str) -> tuple["QuantumCircuit", Dict[str, Any]]:
     """
     Build a simple Grover oracle that marks a specific state.
     
+    The multi-controlled Z is decomposed by size (see ``grover.mcx_strategy``);
+    from 4 qubits on it borrows one or two clean ancillas, which are added
+    after the oracle qubits and not measured.
+    
     Args:
         n_qubits: Number of qubits
         marked_state: Binary string representing the marked state (e.g., "101")
@@ -145,7 +274,11 @@ def make_grover_oracle(n_qubits: int, marked_state: str) -> tuple[QuantumCircuit
     if len(marked_state) != n_qubits:
         raise ValueError(f"Marked state length ({len(marked_state)}) must match n_qubits ({n_qubits})")
     
-    qc = QuantumCircuit(n_qubits, n_qubits)
+    from qiskit import QuantumCircuit
+    from .grover import append_mcz, grover_ancillas
+    
+    n_ancillas = grover_ancillas(n_qubits)
+    qc = QuantumCircuit(n_qubits + n_ancillas, n_qubits)
     
     # Apply X gates to qubits that should be 0 in the marked state
     for i, bit in enumerate(marked_state):
@@ -153,12 +286,7 @@ def make_grover_oracle(n_qubits: int, marked_state: str) -> tuple[QuantumCircuit
             qc.x(i)
     
     # Apply multi-controlled Z gate
-    if n_qubits > 1:
-        qc.h(n_qubits - 1)
-        qc.mcx(list(range(n_qubits - 1)), n_qubits - 1)
-        qc.h(n_qubits - 1)
-    else:
-        qc.z(0)
+    append_mcz(qc, range(n_qubits), range(n_qubits, n_qubits + n_ancillas))
     
     # Undo the X gates
     for i, bit in enumerate(marked_state):
@@ -171,7 +299,8 @@ def make_grover_oracle(n_qubits: int, marked_state: str) -> tuple[QuantumCircuit
     metadata = {
         "marked_state": marked_state,
         "circuit_type": "grover_oracle",
-        "num_qubits": n_qubits
+        "num_qubits": n_qubits,
+        "num_ancillas": n_ancillas
     }
     
     return qc, metadata
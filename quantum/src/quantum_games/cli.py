@@ -1,8 +1,18 @@
 """Simple CLI to test quantum games."""
 
 import argparse
+import asyncio
 import json
-from .games import play_filter, play_entangled_wager
+import sys
+from itertools import islice
+from .games import play_filter, play_entangled_wager, play_batch, validate_play
+from .ledger import AuditLedger
+from .loadtest import format_report, parse_mix, run_loadtest
+from .results import to_jsonable
+from .routing import get_router
+from .settings import get_settings
+from .simulation import format_table, run_sweep
+from .verify import verify_ledger
 
 
 def main():
@@ -21,6 +31,57 @@ def main():
     entangled_parser.add_argument("--qb", type=int, required=True, help="Player B quantum chips")
     entangled_parser.add_argument("--shots", type=int, default=None, help="Number of shots (default from env)")
     
+    # Bulk JSONL command
+    batch_parser = subparsers.add_parser("batch", help="Play JSONL plays from stdin, streaming JSONL results to stdout")
+    batch_parser.add_argument("--shots", type=int, default=None, help="Shots for plays that don't set their own (default from env)")
+    batch_parser.add_argument("--chunk-size", type=int, default=500, help="Plays per sampler job")
+    batch_parser.add_argument("--backend", default=None, help="Backend to use (default QISKIT_BACKEND)")
+    
+    # Audit ledger commands
+    audit_parser = subparsers.add_parser("audit", help="Query the audit ledger")
+    audit_parser.add_argument("--dir", default=get_settings().audit_ledger_dir, help="Ledger directory (default AUDIT_LEDGER_DIR)")
+    audit_commands = audit_parser.add_subparsers(dest="audit_command")
+    export_parser = audit_commands.add_parser("export", help="Stream plays in a time range as JSONL")
+    export_parser.add_argument("--start", default=None, help="ISO timestamp (UTC), inclusive")
+    export_parser.add_argument("--end", default=None, help="ISO timestamp (UTC), exclusive")
+    find_parser = audit_commands.add_parser("find", help="Look up plays by job ID or circuit hash")
+    find_group = find_parser.add_mutually_exclusive_group(required=True)
+    find_group.add_argument("--job-id", default=None, help="Sampler job ID")
+    find_group.add_argument("--hash", default=None, help="Circuit hash")
+    verify_parser = audit_commands.add_parser("verify", help="Replay every record and report mismatches as JSONL")
+    verify_parser.add_argument("--workers", type=int, default=None, help="Worker processes (default CPU count)")
+    verify_parser.add_argument("--checkpoint", default=None, help="Checkpoint file to resume from and update")
+    verify_parser.add_argument("--report", default=None, help="Mismatch report file (appended; default stdout)")
+    verify_parser.add_argument("--chunk-size", type=int, default=5000, help="Records per work unit")
+    
+    # Monte Carlo payout simulation command
+    simulate_parser = subparsers.add_parser("simulate", help="Simulate RTP, variance and risk of ruin")
+    simulate_parser.add_argument("--game", choices=["filter", "entangled_wager"], default="filter", help="Game to simulate")
+    simulate_parser.add_argument("--rounds", type=int, default=100000, help="Rounds per grid point")
+    simulate_parser.add_argument("--shots", type=int, nargs="+", default=[1024], help="Shot counts to sweep")
+    simulate_parser.add_argument("--qmin", type=int, default=1, help="Smallest qcount in the grid")
+    simulate_parser.add_argument("--qmax", type=int, default=20, help="Largest qcount in the grid")
+    simulate_parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    simulate_parser.add_argument("--seed", type=int, default=None, help="RNG seed")
+    simulate_parser.add_argument("--json", action="store_true", help="Print JSON instead of a table")
+    
+    # API load test command
+    loadtest_parser = subparsers.add_parser("loadtest", help="Load-test a running server's play endpoints")
+    loadtest_parser.add_argument("--url", default="http://localhost:8000", help="Server base URL")
+    loadtest_parser.add_argument("--duration", type=float, default=30.0, help="Seconds of measured load")
+    loadtest_parser.add_argument("--warmup", type=float, default=5.0, help="Seconds of unmeasured load first")
+    loadtest_parser.add_argument("--concurrency", type=int, default=16, help="Virtual users, or in-flight limit with --rate")
+    loadtest_parser.add_argument("--rate", type=float, default=None, help="Open loop: arrivals per second (closed loop if not set)")
+    loadtest_parser.add_argument("--arrivals", choices=["poisson", "uniform"], default="poisson", help="Open-loop arrival gaps")
+    loadtest_parser.add_argument("--mix", default="filter=1,entangled_wager=1", help="Request mix, e.g. filter=3,entangled_wager=1")
+    loadtest_parser.add_argument("--shots", type=int, default=None, help="Shots per play (default from the server)")
+    loadtest_parser.add_argument("--api-key", dest="api_keys", action="append", default=None,
+                                 help="API key from ADMISSION_API_KEYS, sent as a Bearer token (repeat to spread plays over several)")
+    loadtest_parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    loadtest_parser.add_argument("--seed", type=int, default=None, help="RNG seed for the mix, bets and arrivals")
+    loadtest_parser.add_argument("--hgrm", default=None, help="Write the overall latency distribution as .hgrm (ms)")
+    loadtest_parser.add_argument("--json", action="store_true", help="Print JSON, with histogram buckets, instead of a table")
+    
     args = parser.parse_args()
     
     if not args.command:
@@ -28,15 +89,49 @@ def main():
         return
     
     try:
+        if args.command in ("filter", "entangled", "batch"):
+            wait_for_routes()
+        
         if args.command == "filter":
             print(f"Playing Filter game with qcount={args.qcount}, shots={args.shots or 'default'}...")
             result = play_filter(args.qcount, args.shots)
-            print(json.dumps(result, indent=2))
+            print(json.dumps(result, indent=2, default=to_jsonable))
         
         elif args.command == "entangled":
             print(f"Playing Entangled Wager: Player A={args.qa}, Player B={args.qb}, shots={args.shots or 'default'}...")
             result = play_entangled_wager(args.qa, args.qb, args.shots)
-            print(json.dumps(result, indent=2))
+            print(json.dumps(result, indent=2, default=to_jsonable))
+        
+        elif args.command == "batch":
+            run_batch(sys.stdin, sys.stdout, args.shots, args.chunk_size, args.backend)
+        
+        elif args.command == "audit":
+            if not args.dir or not args.audit_command:
+                print("Usage: audit --dir DIR {export,find,verify} (or set AUDIT_LEDGER_DIR)")
+                return 1
+            if args.audit_command == "verify":
+                return run_verify(args)
+            ledger = AuditLedger(args.dir, read_only=True)
+            try:
+                if args.audit_command == "export":
+                    ledger.export(sys.stdout, args.start, args.end)
+                else:
+                    records = ledger.find_by_job_id(args.job_id) if args.job_id else ledger.find_by_circuit_hash(args.hash)
+                    for record in records:
+                        print(json.dumps(record, default=to_jsonable))
+            finally:
+                ledger.close()
+        
+        elif args.command == "simulate":
+            results = run_sweep(
+                args.game, args.shots, args.rounds,
+                qcounts=range(args.qmin, args.qmax + 1),
+                seed=args.seed, workers=args.workers
+            )
+            print(json.dumps(results, indent=2, default=to_jsonable) if args.json else format_table(results))
+        
+        elif args.command == "loadtest":
+            return run_load(args)
     
     except Exception as e:
         print(f"Error: {e}")
@@ -47,5 +142,98 @@ def main():
     return 0
 
 
+def wait_for_routes():
+    """Wait for the router's first status poll (if routing is on), so one-shot plays aren't sent to the fallback."""
+    router = get_router()
+    if router is not None:
+        router.wait_ready(router.poll_interval_s)
+
+
+def run_verify(args) -> int:
+    """Run ``audit verify``; exits non-zero if any record mismatches."""
+    report = open(args.report, "a") if args.report else sys.stdout
+    
+    def progress(checkpoint):
+        print(f"\rverified {checkpoint['records']} records, {checkpoint['mismatches']} mismatches",
+              end="", file=sys.stderr, flush=True)
+    
+    try:
+        summary = verify_ledger(args.dir, report, workers=args.workers, checkpoint_path=args.checkpoint,
+                                chunk_records=args.chunk_size, progress=progress)
+    finally:
+        if report is not sys.stdout:
+            report.close()
+    
+    rate = summary["records"] / summary["elapsed_s"] if summary["elapsed_s"] else 0.0
+    print(f"\nverified {summary['records']} records ({rate:.0f}/s), {summary['mismatches']} mismatches",
+          file=sys.stderr)
+    return 1 if summary["mismatches"] else 0
+
+
+def run_load(args) -> int:
+    """Run ``loadtest``; exits non-zero if no play succeeded."""
+    mode = f"open loop at {args.rate:g}/s" if args.rate else "closed loop"
+    print(f"Load testing {args.url} for {args.duration:g}s ({mode}, concurrency {args.concurrency})...",
+          file=sys.stderr)
+    
+    report = asyncio.run(run_loadtest(
+        args.url, duration_s=args.duration, concurrency=args.concurrency, rate=args.rate,
+        mix=parse_mix(args.mix), shots=args.shots, warmup_s=args.warmup, api_keys=args.api_keys,
+        timeout_s=args.timeout, arrivals=args.arrivals, seed=args.seed
+    ))
+    summary = report.summary()
+    total = report.total()
+    
+    if args.hgrm:
+        with open(args.hgrm, "w") as f:
+            total.write_percentiles(f)
+    if args.json:
+        summary["histogram"] = total.to_dict()
+        print(json.dumps(summary, indent=2))
+    else:
+        print(format_report(summary))
+    return 0 if total.count else 1
+
+
+def run_batch(lines, out, shots=None, chunk_size=500, backend_name=None):
+    """
+    Play JSONL plays and write one JSONL result per input line, in order.
+    
+    Each chunk of ``chunk_size`` plays runs as one sampler job and its results
+    are flushed before the next chunk is read, so output streams as it goes.
+    Lines that aren't valid plays produce an ``{"error": ..., "line": n}`` record.
+    
+    Args:
+        lines: Iterable of input lines, e.g. ``{"game": "filter", "qcount": 5}``
+        out: Writable text stream
+        shots: Shots for plays that don't set their own
+        chunk_size: Plays per sampler job
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+    """
+    numbered = ((n, line) for n, line in enumerate(lines, 1) if line.strip())
+    
+    while True:
+        chunk = list(islice(numbered, chunk_size))
+        if not chunk:
+            break
+        
+        records, plays = [], []
+        for n, line in chunk:
+            try:
+                play = json.loads(line)
+                validate_play(play)
+                plays.append(play)
+                records.append(None)
+            except json.JSONDecodeError as e:
+                records.append({"error": f"Invalid JSON: {e}", "line": n})
+            except ValueError as e:
+                records.append({"error": str(e), "line": n})
+        
+        results = iter(play_batch(plays, shots, backend_name))
+        for record in records:
+            out.write(json.dumps(record if record is not None else next(results), default=to_jsonable) + "\n")
+        out.flush()
+
+
 if __name__ == "__main__":
     exit(main())
@@ -0,0 +1,397 @@
+"""Noise-aware local engine: batched density-matrix simulation with a device's calibration."""
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .engines import LOCAL_PREFIX, LocalEngine, _counts_from_probabilities, _pack_values
+from .results import Counts
+from .settings import get_settings
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# Widest active (post-layout) register the density matrix is built for: 4^10 entries per row
+MAX_NOISY_QUBITS = 10
+
+# Gates the transpiler leaves that take no time on hardware
+_VIRTUAL = ("rz", "p", "id", "z", "s", "sdg", "t", "tdg")
+_IGNORED = ("barrier", "delay")
+
+
+class _Op:
+    """One physical gate of a compiled circuit, with its noise."""
+
+    __slots__ = ("operation", "qubits", "matrix", "params", "depolarizing", "relaxation")
+
+    def __init__(self, operation, qubits: List[int], depolarizing: float,
+                 relaxation: List[Tuple[int, float, float]]):
+        self.operation = operation
+        self.qubits = qubits
+        # Bound gates have one shared matrix; parameterized ones are built per row
+        self.params = [p for p in operation.params if hasattr(p, "parameters")]
+        self.matrix = None if self.params else operation.to_matrix()[None]
+        self.depolarizing = depolarizing
+        # (qubit, damping gamma, coherence factor) for the gate's duration
+        self.relaxation = relaxation
+
+
+class _Compiled:
+    """A circuit transpiled to the device and reduced to its active qubits."""
+
+    __slots__ = ("ops", "n_qubits", "measure_map", "readout", "parameters")
+
+    def __init__(self, ops: List[_Op], n_qubits: int, measure_map: Dict[int, int],
+                 readout: Dict[int, float], parameters: list):
+        self.ops = ops
+        self.n_qubits = n_qubits
+        self.measure_map = measure_map
+        self.readout = readout
+        self.parameters = parameters
+
+
+class NoiseModel:
+    """
+    Gate, relaxation and readout errors from a backend's calibration.
+
+    Each physical gate is followed by a depolarizing channel matching its
+    reported error and by amplitude/phase damping for its duration (from the
+    qubit's T1/T2); measurements flip with the reported readout error. Idle
+    time between gates is not modelled.
+
+    Args:
+        target: Transpiler target carrying the calibration
+        name: Backend name
+        version: Calibration timestamp (part of the distribution cache key)
+    """
+
+    def __init__(self, target, name: str, version: str):
+        self.target = target
+        self.name = name
+        self.version = version
+        self._pass_manager = None
+
+    @classmethod
+    def from_backend(cls, name: str) -> "NoiseModel":
+        """
+        Load a calibration: a fake provider backend ("fake_sherbrooke") or a
+        BACKEND_SNAPSHOT_DIR snapshot of a real device ("ibm_kyiv").
+        """
+        if name.startswith("fake_"):
+            from qiskit.providers.exceptions import QiskitBackendNotFoundError
+            from qiskit_ibm_runtime.fake_provider import FakeProviderForBackendV2
+
+            try:
+                backend = FakeProviderForBackendV2().backend(name)
+            except QiskitBackendNotFoundError:
+                raise ValueError(
+                    f"No calibration for '{name}': not a fake provider backend (e.g. fake_sherbrooke)"
+                ) from None
+            properties = backend.properties()
+            return cls(backend.target, name, properties.last_update_date.isoformat() if properties else "")
+
+        from .snapshots import get_snapshot_store
+
+        store = get_snapshot_store()
+        snapshot = store.load(name) if store is not None else None
+        if snapshot is None:
+            raise ValueError(
+                f"No calibration for '{name}': use a fake provider backend (e.g. fake_sherbrooke) "
+                f"or a snapshot in BACKEND_SNAPSHOT_DIR"
+            )
+        return cls(snapshot.target, name, snapshot.version)
+
+    def compile(self, circuit: "QuantumCircuit") -> _Compiled:
+        """Transpile a circuit onto the device and attach each gate's noise."""
+        if self._pass_manager is None:
+            from qiskit.transpiler import generate_preset_pass_manager
+
+            self._pass_manager = generate_preset_pass_manager(optimization_level=1, target=self.target)
+        physical = self._pass_manager.run(circuit)
+
+        index = {q: i for i, q in enumerate(physical.qubits)}
+        instructions = [inst for inst in physical.data if inst.operation.name not in _IGNORED]
+        active = sorted({index[q] for inst in instructions for q in inst.qubits})
+        if len(active) > MAX_NOISY_QUBITS:
+            raise ValueError(
+                f"Circuit uses {len(active)} device qubits; the noisy engine supports up to {MAX_NOISY_QUBITS}"
+            )
+        local = {q: i for i, q in enumerate(active)}
+        clbits = {c: i for i, c in enumerate(physical.clbits)}
+
+        ops, measure_map, readout = [], {}, {}
+        for inst in instructions:
+            name = inst.operation.name
+            qubits = [index[q] for q in inst.qubits]
+            if name == "measure":
+                measure_map[local[qubits[0]]] = clbits[inst.clbits[0]]
+                readout[local[qubits[0]]] = self._error("measure", qubits)
+                continue
+            if not hasattr(inst.operation, "to_matrix"):
+                raise ValueError(f"The noisy engine can't simulate '{name}'")
+
+            if name in _VIRTUAL:
+                depolarizing, relaxation = 0.0, []
+            else:
+                dim = 2 ** len(qubits)
+                depolarizing = min(1.0, self._error(name, qubits) * dim / (dim - 1))
+                relaxation = self._relaxation(name, qubits, local)
+            ops.append(_Op(inst.operation, [local[q] for q in qubits], depolarizing, relaxation))
+
+        return _Compiled(ops, len(active), measure_map, readout, list(circuit.parameters))
+
+    def _properties(self, name: str, qubits: Sequence[int]):
+        try:
+            return self.target[name][tuple(qubits)]
+        except KeyError:
+            return None
+
+    def _error(self, name: str, qubits: Sequence[int]) -> float:
+        properties = self._properties(name, qubits)
+        return float(properties.error) if properties is not None and properties.error else 0.0
+
+    def _relaxation(self, name: str, qubits: Sequence[int], local: Dict[int, int]) -> List[Tuple[int, float, float]]:
+        properties = self._properties(name, qubits)
+        duration = properties.duration if properties is not None and properties.duration else 0.0
+        if not duration:
+            return []
+
+        channels = []
+        for q in qubits:
+            qubit = self.target.qubit_properties[q] if self.target.qubit_properties else None
+            t1 = getattr(qubit, "t1", None)
+            t2 = getattr(qubit, "t2", None)
+            gamma = 1.0 - np.exp(-duration / t1) if t1 else 0.0
+            coherence = np.exp(-duration / t2) if t2 else 1.0
+            if gamma or coherence < 1.0:
+                channels.append((local[q], gamma, coherence))
+        return channels
+
+
+class NoisyEngine(LocalEngine):
+    """
+    Local engine that simulates circuits under a real device's noise.
+
+    Circuits are transpiled onto the device (once per circuit structure) and
+    evolved as density matrices over the qubits they touch. A parameter sweep
+    is simulated in one pass with every row stacked along a batch axis, so
+    a whole odds grid costs about as much as one play. Noisy outcome
+    distributions are cached per (circuit, calibration, parameter row) and
+    later plays only sample shots from them.
+
+    Args:
+        backend: Calibration source for NoiseModel.from_backend (uses NOISY_BACKEND if not specified)
+        seed: Seed for the shot sampler (uses LOCAL_SEED from env if not specified)
+    """
+
+    kind = "noisy"
+
+    def __init__(self, backend: Optional[str] = None, seed: Optional[int] = None):
+        super().__init__(seed)
+        settings = get_settings()
+        self.noise = NoiseModel.from_backend(backend or settings.noisy_backend)
+        self.name = f"{LOCAL_PREFIX}{self.kind}:{self.noise.name}"
+        self.cache_size = settings.noisy_cache_size
+        # circuit key -> compiled circuit; (circuit key, row) -> distribution
+        self._compiled: "OrderedDict[tuple, _Compiled]" = OrderedDict()
+        self._distributions: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+
+    def distributions(self, circuit: "QuantumCircuit", values: Optional[np.ndarray] = None) -> Tuple[np.ndarray, _Compiled]:
+        """
+        Noisy outcome distributions for each parameter row, from the cache where possible.
+
+        Args:
+            circuit: Circuit with final measurements (parameterized or bound)
+            values: Parameter rows, shape (rows, parameters); one empty row if not given
+
+        Returns:
+            tuple: (probabilities of shape (rows, 2^active qubits), compiled circuit)
+        """
+        key = self._circuit_key(circuit)
+        compiled = self._compiled.get(key)
+        if compiled is None:
+            compiled = self._compiled[key] = self.noise.compile(circuit)
+            if len(self._compiled) > self.cache_size:
+                self._compiled.popitem(last=False)
+
+        if values is None:
+            if compiled.parameters:
+                raise ValueError(f"Circuit has unbound parameters: {sorted(p.name for p in compiled.parameters)}")
+            values = np.zeros((1, 0))
+        elif compiled.parameters:
+            values = np.asarray(values, dtype=float).reshape(-1, len(compiled.parameters))
+
+        row_keys = [(key, row.tobytes()) for row in values]
+        missing = [i for i, row_key in enumerate(row_keys) if row_key not in self._distributions]
+        if missing:
+            # One batched pass over every row not seen before (duplicates simulated once)
+            unique = list(OrderedDict((row_keys[i], i) for i in missing).values())
+            for i, probs in zip(unique, _simulate(compiled, values[unique])):
+                self._distributions[row_keys[i]] = probs
+            while len(self._distributions) > self.cache_size:
+                self._distributions.popitem(last=False)
+
+        return np.stack([self._distributions[row_key] for row_key in row_keys]), compiled
+
+    def probabilities(self, circuit: "QuantumCircuit") -> np.ndarray:
+        """Noisy distribution over the circuit's active device qubits."""
+        return self.distributions(circuit)[0][0]
+
+    def sample_counts(self, circuit: "QuantumCircuit", shots: int) -> Counts:
+        probs, compiled = self.distributions(circuit)
+        return _counts_from_probabilities(probs[0], compiled.measure_map, circuit.num_clbits, shots, self.rng)
+
+    def sample_memory(self, circuit: "QuantumCircuit", shots: int) -> np.ndarray:
+        probs, compiled = self.distributions(circuit)
+        outcomes = self.rng.choice(probs.shape[1], size=shots, p=probs[0] / probs[0].sum())
+
+        values = np.zeros(shots, dtype=np.int64)
+        for qubit, clbit in compiled.measure_map.items():
+            values |= ((outcomes >> qubit) & 1) << clbit
+        return _pack_values(values, circuit.num_clbits)
+
+    def run_pub(self, pub, shots: int):
+        if not isinstance(pub, tuple):
+            return self.sample_counts(pub, shots)
+
+        circuit = pub[0]
+        values = np.asarray(pub[1] if len(pub) > 1 and pub[1] is not None else [], dtype=float)
+        if len(pub) > 2 and pub[2] is not None:
+            shots = pub[2]
+
+        probs, compiled = self.distributions(circuit, values if values.size else None)
+        counts = [_counts_from_probabilities(p, compiled.measure_map, circuit.num_clbits, shots, self.rng)
+                  for p in probs]
+        return counts if values.ndim > 1 else counts[0]
+
+    @staticmethod
+    def _circuit_key(circuit: "QuantumCircuit") -> tuple:
+        """Structural key: the same template object or an identical rebuild share cache entries."""
+        qubits = {q: i for i, q in enumerate(circuit.qubits)}
+        clbits = {c: i for i, c in enumerate(circuit.clbits)}
+        return (circuit.num_qubits, circuit.num_clbits) + tuple(
+            (inst.operation.name,
+             tuple(qubits[q] for q in inst.qubits),
+             tuple(clbits[c] for c in inst.clbits),
+             tuple(str(p) for p in inst.operation.params))
+            for inst in circuit.data
+        )
+
+
+def _simulate(compiled: _Compiled, values: np.ndarray) -> np.ndarray:
+    """
+    Evolve |0...0><0...0| through the compiled circuit for every parameter row at once.
+
+    Returns:
+        np.ndarray: (rows, 2^n) outcome probabilities, qubit 0 least significant,
+                    with readout errors applied
+    """
+    n = compiled.n_qubits
+    rows = max(len(values), 1)
+    # Axes: batch, then row bits and column bits, most significant qubit first
+    rho = np.zeros((rows,) + (2,) * (2 * n), dtype=complex)
+    rho[(slice(None),) + (0,) * (2 * n)] = 1.0
+
+    bindings = [dict(zip(compiled.parameters, row)) for row in values]
+    for op in compiled.ops:
+        matrix = op.matrix if op.matrix is not None else _row_matrices(op, bindings)
+        rho = _apply_unitary(rho, matrix, op.qubits, n)
+        if op.depolarizing:
+            rho = _depolarize(rho, op.qubits, n, op.depolarizing)
+        for qubit, gamma, coherence in op.relaxation:
+            _relax(rho, qubit, n, gamma, coherence)
+
+    # Diagonal of each row's density matrix
+    probs = np.einsum("bii->bi", rho.reshape(rows, 2 ** n, 2 ** n)).real.copy()
+    probs = probs.reshape((rows,) + (2,) * n)
+    for qubit, error in compiled.readout.items():
+        if error:
+            axis = 1 + n - 1 - qubit
+            zero = np.take(probs, 0, axis=axis)
+            one = np.take(probs, 1, axis=axis)
+            probs = np.stack([(1 - error) * zero + error * one, error * zero + (1 - error) * one], axis=axis)
+
+    probs = np.clip(probs.reshape(rows, 2 ** n), 0.0, None)
+    return probs / probs.sum(axis=1, keepdims=True)
+
+
+def _row_matrices(op: _Op, bindings: List[Dict[Any, float]]) -> np.ndarray:
+    """(rows, d, d) matrices of a parameterized gate, one per parameter row."""
+    params = [[float(p.bind({k: v for k, v in binding.items() if k in p.parameters}))
+               if hasattr(p, "parameters") else p
+               for p in op.operation.params]
+              for binding in bindings]
+    name = op.operation.name
+    if name in ("rz", "p") and len(params[0]) == 1:
+        # Diagonal phase gates (the transpiler turns every game parameter into these)
+        theta = np.array([row[0] for row in params])
+        matrices = np.zeros((len(theta), 2, 2), dtype=complex)
+        if name == "rz":
+            matrices[:, 0, 0] = np.exp(-0.5j * theta)
+            matrices[:, 1, 1] = np.exp(0.5j * theta)
+        else:
+            matrices[:, 0, 0] = 1.0
+            matrices[:, 1, 1] = np.exp(1j * theta)
+        return matrices
+
+    gate = type(op.operation)
+    return np.stack([gate(*row).to_matrix() for row in params])
+
+
+def _apply_unitary(rho: np.ndarray, matrix: np.ndarray, qubits: List[int], n: int) -> np.ndarray:
+    """rho -> U rho U^dagger on ``qubits`` (little-endian in U, like Qiskit), batched over rows."""
+    k = len(qubits)
+    rows = rho.shape[0]
+    # Axis of each gate qubit, most significant (last qarg) first
+    row_axes = [1 + n - 1 - q for q in reversed(qubits)]
+    col_axes = [1 + 2 * n - 1 - q for q in reversed(qubits)]
+
+    front = list(range(1, k + 1))
+    moved = np.moveaxis(rho, row_axes, front)
+    shape = moved.shape
+    moved = (matrix @ moved.reshape(rows, 2 ** k, -1)).reshape(shape)
+    rho = np.moveaxis(moved, front, row_axes)
+
+    back = list(range(2 * n + 1 - k, 2 * n + 1))
+    moved = np.moveaxis(rho, col_axes, back)
+    shape = moved.shape
+    moved = (moved.reshape(rows, -1, 2 ** k) @ np.conj(np.swapaxes(matrix, 1, 2))).reshape(shape)
+    return np.moveaxis(moved, back, col_axes)
+
+
+def _depolarize(rho: np.ndarray, qubits: List[int], n: int, strength: float) -> np.ndarray:
+    """rho -> (1 - p) rho + p Tr_q(rho) (x) I/d on ``qubits``."""
+    letters = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXY"
+    row = [letters[i] for i in range(n)]
+    col = [letters[n + i] for i in range(n)]
+    axes = [n - 1 - q for q in qubits]
+
+    traced_col = list(col)
+    for a in axes:
+        traced_col[a] = row[a]
+    kept = "".join(r for i, r in enumerate(row) if i not in axes) + "".join(
+        c for i, c in enumerate(col) if i not in axes)
+    reduced = np.einsum("Z" + "".join(row) + "".join(traced_col) + "->Z" + kept, rho)
+
+    eyes = ",".join(row[a] + col[a] for a in axes)
+    spread = np.einsum(f"Z{kept},{eyes}->Z{''.join(row)}{''.join(col)}", reduced, *[np.eye(2)] * len(axes))
+    return (1.0 - strength) * rho + (strength / 2 ** len(qubits)) * spread
+
+
+def _relax(rho: np.ndarray, qubit: int, n: int, gamma: float, coherence: float):
+    """Amplitude damping (gamma) and dephasing (coherence factor) on one qubit, in place."""
+    r = 1 + n - 1 - qubit
+    c = 1 + 2 * n - 1 - qubit
+
+    def at(i, j):
+        index = [slice(None)] * rho.ndim
+        index[r], index[c] = i, j
+        return tuple(index)
+
+    if gamma:
+        rho[at(0, 0)] += gamma * rho[at(1, 1)]
+        rho[at(1, 1)] *= 1.0 - gamma
+    if coherence < 1.0:
+        rho[at(0, 1)] *= coherence
+        rho[at(1, 0)] *= coherence
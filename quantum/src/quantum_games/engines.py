@@ -0,0 +1,421 @@
+"""Local sampling engines that stand in for IBM backends in dev, CI and load tests."""
+
+import asyncio
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .results import Counts
+from .settings import get_settings
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+LOCAL_PREFIX = "local:"
+IBM_PREFIX = "ibm:"
+FAKE_PREFIX = "fake:"
+SNAPSHOT_PREFIX = "snapshot:"
+
+# Above this many qubits, product-state circuits are sampled qubit by qubit
+# instead of materializing the full 2^n distribution.
+MAX_DENSE_QUBITS = 16
+
+
+async def simulate_latency(backend_name: str):
+    """
+    Wait LOCAL_LATENCY_MS after a local engine's job, as a stand-in for QPU time.
+
+    Awaited by the async play paths once the result is back, so load tests
+    see queue-like latency without a sampler worker thread being held.
+
+    Args:
+        backend_name: Backend that ran the job
+    """
+    latency_ms = get_settings().local_latency_ms
+    if latency_ms > 0 and backend_name.startswith(LOCAL_PREFIX):
+        await asyncio.sleep(latency_ms / 1000)
+
+
+def parse_backend_spec(spec: str) -> Tuple[str, str]:
+    """
+    Split a QISKIT_BACKEND value into its kind and name.
+
+    Args:
+        spec: Backend spec such as "local:analytic", "fake:fake_manila",
+              "snapshot:ibm_kyiv", "ibm:ibm_kyiv" or a bare IBM backend name
+
+    Returns:
+        tuple: ("local", "fake", "snapshot" or "ibm", engine/backend name)
+    """
+    if spec.startswith(LOCAL_PREFIX):
+        return "local", spec[len(LOCAL_PREFIX):]
+    if spec.startswith(FAKE_PREFIX):
+        return "fake", spec[len(FAKE_PREFIX):]
+    if spec.startswith(SNAPSHOT_PREFIX):
+        return "snapshot", spec[len(SNAPSHOT_PREFIX):]
+    if spec.startswith(IBM_PREFIX):
+        return "ibm", spec[len(IBM_PREFIX):]
+    return "ibm", spec
+
+
+class LocalEngine:
+    """
+    Base class for in-process engines that sample circuits without a QPU.
+
+    Subclasses implement ``probabilities`` and inherit shot sampling plus the
+    ``run_sampler`` result shape (job_id, backend, shots, counts).
+
+    Args:
+        seed: Seed for the shot sampler (uses LOCAL_SEED from env if not specified)
+    """
+
+    kind = ""
+
+    def __init__(self, seed: Optional[int] = None):
+        if seed is None:
+            seed = get_settings().local_seed
+        self.rng = np.random.default_rng(seed)
+        self.name = LOCAL_PREFIX + self.kind
+
+    def probabilities(self, circuit: "QuantumCircuit") -> np.ndarray:
+        """Exact outcome distribution over the circuit's qubits (little-endian)."""
+        raise NotImplementedError
+
+    def sample_counts(self, circuit: "QuantumCircuit", shots: int) -> Counts:
+        """
+        Sample measurement counts for one circuit.
+
+        Args:
+            circuit: Bound circuit with final measurements
+            shots: Number of shots
+
+        Returns:
+            Counts: Outcome histogram, a Mapping keyed like ``BitArray.get_counts()``
+        """
+        if circuit.parameters:
+            raise ValueError(f"Circuit has unbound parameters: {sorted(p.name for p in circuit.parameters)}")
+
+        probs = self.probabilities(circuit)
+        return _counts_from_probabilities(probs, _measure_map(circuit), circuit.num_clbits, shots, self.rng)
+
+    def sample_memory(self, circuit: "QuantumCircuit", shots: int) -> np.ndarray:
+        """
+        Sample per-shot outcomes for one circuit.
+
+        Args:
+            circuit: Bound circuit with final measurements
+            shots: Number of shots
+
+        Returns:
+            np.ndarray: uint8 array of shape (shots, bytes), packed big-endian
+                        like ``BitArray.array``
+        """
+        if circuit.parameters:
+            raise ValueError(f"Circuit has unbound parameters: {sorted(p.name for p in circuit.parameters)}")
+
+        probs = self.probabilities(circuit)
+        outcomes = self.rng.choice(len(probs), size=shots, p=probs / probs.sum())
+
+        values = np.zeros(shots, dtype=np.int64)
+        for qubit, clbit in _measure_map(circuit).items():
+            values |= ((outcomes >> qubit) & 1) << clbit
+        return _pack_values(values, circuit.num_clbits)
+
+    def run_pub(self, pub, shots: int):
+        """
+        Sample a circuit or a ``(circuit, parameter_values[, shots])`` PUB.
+
+        Args:
+            pub: Bound circuit, or PUB tuple as accepted by SamplerV2
+            shots: Default number of shots
+
+        Returns:
+            Counts or list: Counts, or one Counts per row for a parameter sweep
+        """
+        bound, shots, sweep = _bind_pub(pub, shots)
+        counts = [self.sample_counts(circuit, shots) for circuit in bound]
+        return counts if sweep else counts[0]
+
+    def run(self, circuits: List[Any], shots: int, memory: bool = False) -> Dict[str, Any]:
+        """
+        Run circuits and return results in the same shape as ``run_sampler``.
+
+        Args:
+            circuits: Circuits or PUB tuples to sample
+            shots: Number of shots per circuit (a PUB's own shots take precedence)
+            memory: Return per-shot outcomes instead of sampling counts separately
+                (one array per sweep row, like counts)
+
+        Returns:
+            dict: Results with job_id, backend name, shots, and counts
+        """
+        output = {
+            "job_id": f"local-{uuid.uuid4().hex}",
+            "backend": self.name,
+            "shots": shots
+        }
+
+        if memory:
+            # Counts are derived from the same shots so both views agree
+            memory_list, counts_list = [], []
+            for pub in circuits:
+                bound, pub_shots, sweep = _bind_pub(pub, shots)
+                memory_rows = [self.sample_memory(circuit, pub_shots) for circuit in bound]
+                counts_rows = [_counts_from_memory(m, c.num_clbits) for m, c in zip(memory_rows, bound)]
+                memory_list.append(memory_rows if sweep else memory_rows[0])
+                counts_list.append(counts_rows if sweep else counts_rows[0])
+            output["memory"] = memory_list[0] if len(memory_list) == 1 else memory_list
+        else:
+            counts_list = [self.run_pub(pub, shots) for pub in circuits]
+
+        output["counts"] = counts_list[0] if len(counts_list) == 1 else counts_list
+        return output
+
+
+class AnalyticEngine(LocalEngine):
+    """
+    Closed-form engine for the game circuits.
+
+    Circuits made only of single-qubit gates (filter, slots) are product
+    states, so each qubit's outcome probability is computed on its own.
+    Entangling circuits (Bell pair, Grover oracle) are evolved with a small
+    NumPy statevector over the instruction stream. Wide circuits are split
+    into independent qubit blocks (e.g. many plays packed side by side) and
+    each block is simulated and sampled on its own.
+    """
+
+    kind = "analytic"
+
+    def sample_counts(self, circuit: "QuantumCircuit", shots: int) -> Counts:
+        if circuit.num_qubits <= MAX_DENSE_QUBITS:
+            return super().sample_counts(circuit, shots)
+        return _counts_from_memory(self.sample_memory(circuit, shots), circuit.num_clbits)
+
+    def probabilities(self, circuit: "QuantumCircuit") -> np.ndarray:
+        p_one = _product_marginals(circuit)
+        if p_one is None:
+            return _numpy_statevector(circuit)
+
+        # Outer product of per-qubit distributions, qubit 0 least significant
+        probs = np.ones(1)
+        for p in p_one:
+            probs = np.kron(np.array([1.0 - p, p]), probs)
+        return probs
+
+    def sample_memory(self, circuit: "QuantumCircuit", shots: int) -> np.ndarray:
+        if circuit.parameters:
+            raise ValueError(f"Circuit has unbound parameters: {sorted(p.name for p in circuit.parameters)}")
+
+        measure_map = _measure_map(circuit)
+        # Columns run from the highest clbit to clbit 0 (big-endian)
+        bits = np.zeros((shots, circuit.num_clbits), dtype=bool)
+
+        for block in _independent_blocks(circuit):
+            measured = [(j, measure_map[q]) for j, q in enumerate(block) if q in measure_map]
+            if not measured:
+                continue
+
+            probs = _numpy_statevector(circuit, block)
+            outcomes = self.rng.choice(len(probs), size=shots, p=probs / probs.sum())
+            for j, clbit in measured:
+                bits[:, circuit.num_clbits - 1 - clbit] = (outcomes >> j) & 1
+
+        return _pack_bits(bits)
+
+
+class StatevectorEngine(LocalEngine):
+    """Engine that uses Qiskit's reference Statevector for any circuit."""
+
+    kind = "statevector"
+
+    def probabilities(self, circuit: "QuantumCircuit") -> np.ndarray:
+        from qiskit.quantum_info import Statevector
+
+        unitary_part = circuit.remove_final_measurements(inplace=False)
+        return Statevector(unitary_part).probabilities()
+
+
+ENGINES = {
+    AnalyticEngine.kind: AnalyticEngine,
+    StatevectorEngine.kind: StatevectorEngine,
+}
+
+_engine_cache: Dict[str, LocalEngine] = {}
+
+
+def get_engine(name: str) -> LocalEngine:
+    """
+    Get a local engine by name (e.g. "analytic", "statevector" or "noisy:fake_sherbrooke").
+
+    Args:
+        name: Engine name, without the "local:" prefix; "noisy[:<backend>]"
+              simulates with that backend's calibration (NOISY_BACKEND by default)
+
+    Returns:
+        LocalEngine: The shared engine instance
+    """
+    if name not in _engine_cache:
+        kind, _, backend = name.partition(":")
+        if kind == "noisy":
+            # Imported here: the emulator pulls in the transpiler and fake backends
+            from .emulator import NoisyEngine
+            _engine_cache[name] = NoisyEngine(backend or None)
+        elif name not in ENGINES:
+            raise ValueError(f"Unknown local engine '{name}'. Available: {', '.join(sorted([*ENGINES, 'noisy']))}")
+        else:
+            _engine_cache[name] = ENGINES[name]()
+
+    return _engine_cache[name]
+
+
+def _bind_pub(pub, shots: int) -> Tuple[List["QuantumCircuit"], int, bool]:
+    """Bound circuits for a circuit or PUB, the shots to take, and whether it's a parameter sweep."""
+    if not isinstance(pub, tuple):
+        return [pub], shots, False
+
+    circuit = pub[0]
+    values = np.asarray(pub[1] if len(pub) > 1 and pub[1] is not None else [], dtype=float)
+    if len(pub) > 2 and pub[2] is not None:
+        shots = pub[2]
+
+    if values.ndim <= 1:
+        return [circuit.assign_parameters(values) if values.size else circuit], shots, False
+
+    rows = values.reshape(-1, values.shape[-1])
+    return [circuit.assign_parameters(row) for row in rows], shots, True
+
+
+def _measure_map(circuit: "QuantumCircuit") -> Dict[int, int]:
+    """Map measured qubit index -> clbit index."""
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+    clbit_index = {c: i for i, c in enumerate(circuit.clbits)}
+
+    mapping = {}
+    for instruction in circuit.data:
+        if instruction.operation.name == "measure":
+            mapping[qubit_index[instruction.qubits[0]]] = clbit_index[instruction.clbits[0]]
+    return mapping
+
+
+def _product_marginals(circuit: "QuantumCircuit") -> Optional[np.ndarray]:
+    """
+    Per-qubit probability of measuring 1 if the circuit is a product state.
+
+    Returns None when any gate acts on more than one qubit.
+    """
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+    states = np.zeros((circuit.num_qubits, 2), dtype=complex)
+    states[:, 0] = 1.0
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name in ("measure", "barrier"):
+            continue
+        if len(instruction.qubits) != 1:
+            return None
+        q = qubit_index[instruction.qubits[0]]
+        states[q] = operation.to_matrix() @ states[q]
+
+    return np.abs(states[:, 1]) ** 2
+
+
+def _independent_blocks(circuit: "QuantumCircuit") -> List[List[int]]:
+    """Group qubits that are linked by multi-qubit gates (union-find)."""
+    parent = list(range(circuit.num_qubits))
+
+    def find(q):
+        while parent[q] != q:
+            parent[q] = parent[parent[q]]
+            q = parent[q]
+        return q
+
+    qubit_index = {q: i for i, q in enumerate(circuit.qubits)}
+    for instruction in circuit.data:
+        if instruction.operation.name in ("measure", "barrier") or len(instruction.qubits) < 2:
+            continue
+        qubits = [find(qubit_index[q]) for q in instruction.qubits]
+        for q in qubits[1:]:
+            parent[q] = qubits[0]
+
+    blocks: Dict[int, List[int]] = {}
+    for q in range(circuit.num_qubits):
+        blocks.setdefault(find(q), []).append(q)
+    return list(blocks.values())
+
+
+def _numpy_statevector(circuit: "QuantumCircuit", block: Optional[List[int]] = None) -> np.ndarray:
+    """
+    Evolve |0...0> through the circuit's gates and return outcome probabilities.
+
+    If ``block`` is given, only those qubits (which must not interact with the
+    rest of the circuit) are simulated; outcome bit j is qubit ``block[j]``.
+    """
+    if block is None:
+        block = list(range(circuit.num_qubits))
+    n = len(block)
+    local_index = {circuit.qubits[q]: j for j, q in enumerate(block)}
+
+    # Axis k of the tensor holds qubit n-1-k (Qiskit's little-endian order)
+    state = np.zeros([2] * n, dtype=complex)
+    state[(0,) * n] = 1.0
+
+    for instruction in circuit.data:
+        operation = instruction.operation
+        if operation.name in ("measure", "barrier"):
+            continue
+
+        if instruction.qubits[0] not in local_index:
+            continue
+
+        qubits = [local_index[q] for q in instruction.qubits]
+        k = len(qubits)
+        # Gate matrix rows/cols are little-endian in its qargs; reverse to match axes
+        gate = operation.to_matrix().reshape([2] * (2 * k))
+        axes = [n - 1 - q for q in reversed(qubits)]
+        state = np.tensordot(gate, state, axes=(list(range(k, 2 * k)), axes))
+        state = np.moveaxis(state, list(range(k)), axes)
+
+    return np.abs(state.reshape(-1)) ** 2
+
+
+def _counts_from_probabilities(probs: np.ndarray, measure_map: Dict[int, int], num_clbits: int,
+                               shots: int, rng: np.random.Generator) -> Counts:
+    """Draw shots from a qubit distribution and histogram them by measured clbits."""
+    probs = probs / probs.sum()
+    outcomes = rng.multinomial(shots, probs)
+    hit = np.nonzero(outcomes)[0]
+
+    # Project qubit outcomes onto the classical register
+    values = np.zeros(len(hit), dtype=np.int64)
+    for qubit, clbit in measure_map.items():
+        values |= ((hit >> qubit) & 1) << clbit
+
+    # Sorts the values, and merges qubit outcomes that land on the same
+    # clbit value (unmeasured qubits)
+    values, inverse = np.unique(values, return_inverse=True)
+    occurrences = np.bincount(inverse, weights=outcomes[hit], minlength=len(values)).astype(np.int64)
+
+    return Counts(values.astype(np.uint64), occurrences, num_clbits)
+
+
+def _pack_bits(bits: np.ndarray) -> np.ndarray:
+    """Pack (shots, num_bits) big-endian booleans into BitArray-style bytes."""
+    num_bits = bits.shape[1]
+    pad = (-num_bits) % 8
+    if pad:
+        # BitArray pads the most significant byte on the left
+        bits = np.concatenate([np.zeros((bits.shape[0], pad), dtype=bool), bits], axis=1)
+    return np.packbits(bits, axis=1)
+
+
+def _pack_values(values: np.ndarray, num_bits: int) -> np.ndarray:
+    """Pack integer outcomes into BitArray-style bytes."""
+    num_bytes = max(1, (num_bits + 7) // 8)
+    as_bytes = values.astype(">u8").view(np.uint8).reshape(-1, 8)
+    return np.ascontiguousarray(as_bytes[:, 8 - num_bytes:])
+
+
+def _counts_from_memory(memory: np.ndarray, num_bits: int) -> Counts:
+    """Histogram packed per-shot outcomes."""
+    return Counts.from_memory(memory, num_bits)
@@ -0,0 +1,224 @@
+"""Quantum entropy reservoir refilled in the background from Hadamard circuits."""
+
+import threading
+from collections import deque
+from typing import Callable, Deque, List, Optional, Tuple
+
+import numpy as np
+
+from .circuits import make_hadamard_circuit
+from .service import run_sampler
+from .settings import get_settings
+
+
+class EntropyExhausted(Exception):
+    """Raised when the pool cannot supply the requested bytes in time."""
+
+
+class EntropyDraw:
+    """Random bytes drawn from the pool plus the jobs that produced them."""
+
+    __slots__ = ("data", "job_ids", "backend")
+
+    def __init__(self, data: bytes, job_ids: List[str], backend: Optional[str]):
+        self.data = data
+        self.job_ids = job_ids
+        self.backend = backend
+
+
+class EntropyPool:
+    """
+    Ring buffer of measured quantum random bytes with high/low watermarks.
+
+    A background thread runs large-shot Hadamard circuits whenever the pool
+    drops below ``low_watermark`` bytes, until it holds at least
+    ``high_watermark``. Draws are served straight from the buffer, and every
+    draw reports the job IDs its bytes came from.
+
+    Args:
+        capacity: Ring buffer size in bytes
+        low_watermark: Refill when fewer bytes than this are available
+        high_watermark: Stop refilling once this many bytes are available
+        shots: Shots per refill job (one byte per shot)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+        runner: Callable with the ``run_sampler`` signature (defaults to it)
+    """
+
+    # 8 qubits -> one byte per shot
+    QUBITS = 8
+
+    def __init__(
+        self,
+        capacity: int = 65536,
+        low_watermark: Optional[int] = None,
+        high_watermark: Optional[int] = None,
+        shots: int = 8192,
+        backend_name: Optional[str] = None,
+        runner: Optional[Callable] = None,
+    ):
+        self.capacity = capacity
+        self.low_watermark = capacity // 4 if low_watermark is None else low_watermark
+        self.high_watermark = (capacity * 9) // 10 if high_watermark is None else high_watermark
+        if not 0 <= self.low_watermark < self.high_watermark <= capacity:
+            raise ValueError("Watermarks must satisfy 0 <= low < high <= capacity")
+
+        self.shots = shots
+        self.backend_name = backend_name
+        self._runner = runner or run_sampler
+        self._circuit, _ = make_hadamard_circuit(self.QUBITS)
+
+        self._buffer = np.zeros(capacity, dtype=np.uint8)
+        # Absolute (monotonic) read/write positions; index = position % capacity
+        self._read = 0
+        self._write = 0
+        # (job_id, start, end) absolute ranges still (partly) in the buffer
+        self._segments: Deque[Tuple[str, int, int]] = deque()
+        self._backend: Optional[str] = None
+
+        self._cond = threading.Condition()
+        self._refill_needed = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_error: Optional[str] = None
+        self.jobs_run = 0
+
+    @property
+    def available(self) -> int:
+        """Number of unread bytes in the pool."""
+        return self._write - self._read
+
+    def start(self):
+        """Start the background refill thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopped.clear()
+        self._refill_needed.set()
+        self._thread = threading.Thread(target=self._refill_loop, name="entropy-refill", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background refill thread."""
+        self._stopped.set()
+        self._refill_needed.set()
+
+    def draw(self, n_bytes: int, timeout: float = 0.0) -> EntropyDraw:
+        """
+        Take random bytes from the pool.
+
+        Args:
+            n_bytes: Number of bytes to draw
+            timeout: Seconds to wait for a refill if the pool is short (0 = don't wait)
+
+        Returns:
+            EntropyDraw: The bytes and the job IDs that produced them
+        """
+        if n_bytes < 1 or n_bytes > self.capacity:
+            raise ValueError(f"n_bytes must be between 1 and {self.capacity}")
+
+        with self._cond:
+            if self.available < n_bytes:
+                self._refill_needed.set()
+                if timeout <= 0 or not self._cond.wait_for(lambda: self.available >= n_bytes, timeout):
+                    raise EntropyExhausted(
+                        f"Entropy pool has {self.available} bytes, {n_bytes} requested"
+                    )
+
+            start, end = self._read, self._read + n_bytes
+            data = self._take(start, end)
+            job_ids = [job_id for job_id, s, e in self._segments if s < end and e > start]
+            self._read = end
+            while self._segments and self._segments[0][2] <= self._read:
+                self._segments.popleft()
+
+            if self.available < self.low_watermark:
+                self._refill_needed.set()
+
+            return EntropyDraw(data, job_ids, self._backend)
+
+    def refill_once(self) -> int:
+        """
+        Run one Hadamard job and append its bytes to the pool.
+
+        Returns:
+            int: Number of bytes added
+        """
+        result = self._runner([self._circuit], shots=self.shots, backend_name=self.backend_name, memory=True)
+        data = np.asarray(result["memory"], dtype=np.uint8).reshape(-1)
+
+        with self._cond:
+            data = data[:self.capacity - self.available]
+            if len(data):
+                start = self._write
+                self._put(start, data)
+                self._write = start + len(data)
+                self._segments.append((result["job_id"], start, self._write))
+                self._backend = result["backend"]
+                self.jobs_run += 1
+                self._cond.notify_all()
+
+        return len(data)
+
+    def _refill_loop(self):
+        while not self._stopped.is_set():
+            self._refill_needed.wait()
+            if self._stopped.is_set():
+                return
+
+            try:
+                while self.available < self.high_watermark and not self._stopped.is_set():
+                    if self.refill_once() == 0:
+                        break
+                self.last_error = None
+                self._refill_needed.clear()
+            except Exception as e:
+                # Keep serving what's buffered; retry after a pause
+                self.last_error = str(e)
+                self._stopped.wait(5.0)
+
+            if self.available < self.low_watermark:
+                self._refill_needed.set()
+
+    def _take(self, start: int, end: int) -> bytes:
+        i, j = start % self.capacity, end % self.capacity
+        if i < j or end - start == 0:
+            return self._buffer[i:j].tobytes()
+        return self._buffer[i:].tobytes() + self._buffer[:j].tobytes()
+
+    def _put(self, start: int, data: np.ndarray):
+        i = start % self.capacity
+        first = min(len(data), self.capacity - i)
+        self._buffer[i:i + first] = data[:first]
+        self._buffer[:len(data) - first] = data[first:]
+
+
+# Global entropy pool
+_pool: Optional[EntropyPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_entropy_pool() -> EntropyPool:
+    """
+    Return the process-wide entropy pool, started and configured from environment.
+
+    Uses ENTROPY_POOL_BYTES (default 65536), ENTROPY_LOW_WATERMARK,
+    ENTROPY_HIGH_WATERMARK, ENTROPY_SHOTS (default 8192) and ENTROPY_BACKEND
+    (defaults to QISKIT_BACKEND).
+
+    Returns:
+        EntropyPool: The shared pool
+    """
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            settings = get_settings()
+            _pool = EntropyPool(
+                capacity=settings.entropy_pool_bytes,
+                low_watermark=settings.entropy_low_watermark,
+                high_watermark=settings.entropy_high_watermark,
+                shots=settings.entropy_shots,
+                backend_name=settings.entropy_backend,
+            )
+        _pool.start()
+
+    return _pool
@@ -1,9 +1,113 @@
 """Game adapters that map gameplay to circuits and compute outcomes."""
 
-from typing import Dict, Any, Optional
+import asyncio
+import math
+import secrets
+from functools import partial
+from typing import Dict, Any, List, Mapping, Optional, Sequence
 from datetime import datetime
-from .circuits import make_filter_circuit, make_entangled_pair, get_circuit_hash
-from .service import run_sampler, get_default_shots
+import numpy as np
+from .circuits import entangled_theta, filter_theta, CIRCUIT_HASH_VERSION
+from .templates import make_pub, template_hash
+from .service import get_default_shots, get_executor, resolve_backend_name, run_sampler
+from .batching import run_batched, run_batched_async
+from .engines import simulate_latency
+from .entropy import get_entropy_pool
+from .ledger import get_audit_ledger
+from .routing import run_routed
+from .metrics import PLAYS, timed
+from .paytable import MAX_REEL_ANGLE, MAX_REELS, Paytable
+from .grover import card_flips, optimal_iterations, success_probability
+from .results import Counts
+from .settings import get_settings
+
+
+# Widest Find the Card deck (1024 cards) on an ideal simulator; noisy backends are
+# capped at FIND_CARD_MAX_QUBITS because deeper searches are mostly noise there
+MAX_DECK_QUBITS = 10
+
+# Local engines that sample the ideal distribution
+_IDEAL_ENGINES = ("local:analytic", "local:statevector")
+
+# Share of the fair payout returned on a correct Find the Card guess
+FIND_CARD_RETURN = 0.95
+
+
+def _recorded(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Queue a game response in the audit ledger (if enabled) and return it."""
+    ledger = get_audit_ledger()
+    if ledger is not None:
+        ledger.append(response, compute_payout(response, 1.0))
+    return response
+
+
+def filter_outcome(counts: Mapping[str, int]) -> str:
+    """
+    Decide a Filter round from its counts.
+    
+    Args:
+        counts: Measurement counts (Counts or a bitstring dict)
+    
+    Returns:
+        str: "win" if |1⟩ was measured more often than |0⟩, else "lose"
+    """
+    counts = Counts.from_dict(counts, 1)
+    ones = counts.ones(0)
+    return "win" if ones > counts.shots - ones else "lose"
+
+
+def entangled_outcome(counts: Mapping[str, int]) -> str:
+    """
+    Decide an Entangled Wager round from its counts.
+    
+    Correlated results (00/11) favour player A, anti-correlated (01/10) player B.
+    
+    Args:
+        counts: Measurement counts (Counts or a bitstring dict)
+    
+    Returns:
+        str: "player_a_wins", "player_b_wins" or "tie"
+    """
+    counts = Counts.from_dict(counts, 2)
+    correlated = counts.even_parity()
+    anticorrelated = counts.shots - correlated
+    
+    if correlated > anticorrelated:
+        return "player_a_wins"
+    if anticorrelated > correlated:
+        return "player_b_wins"
+    return "tie"
+
+
+def _filter_result(qcount: int, shots: int, theta: float,
+                   circuit_hash: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn sampler output for a filter circuit into the game response."""
+    counts = result["counts"]
+    
+    win_probability = counts.ones(0) / shots
+    outcome = filter_outcome(counts)
+    PLAYS.inc(game="filter", backend=result["backend"], outcome=outcome)
+    
+    # Build response
+    return _recorded({
+        "game_type": "filter",
+        "outcome": outcome,
+        "win_probability": win_probability,
+        "counts": counts,
+        "shots": shots,
+        "params": {
+            "qcount": qcount,
+            "theta": theta,
+            "theta_degrees": math.degrees(theta)
+        },
+        "audit": {
+            "job_id": result["job_id"],
+            "backend": result["backend"],
+            "circuit_hash": circuit_hash,
+            "circuit_hash_version": CIRCUIT_HASH_VERSION,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    })
 
 
 def play_filter(qcount: int, shots: Optional[int] = None) -> Dict[str, Any]:
@@ -23,41 +127,71 @@ def play_filter(qcount: int, shots: Optional[int] = None) -> Dict[str, Any]:
     if shots is None:
         shots = get_default_shots()
     
-    # Build the circuit
-    circuit, circuit_metadata = make_filter_circuit(qcount)
-    circuit_hash = get_circuit_hash(circuit)
+    with timed("play", game="filter"):
+        # The bet only binds a value into the cached, pre-transpiled template
+        theta = filter_theta(qcount)
+        circuit_hash = template_hash("filter", (theta,))
+        
+        # Run on quantum backend (coalesced with concurrent plays)
+        result = run_batched(("filter", [theta]), shots)
+        return _filter_result(qcount, shots, theta, circuit_hash, result)
+
+
+async def play_filter_async(qcount: int, shots: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play the Filter game without blocking the event loop.
     
-    # Run on quantum backend
-    result = run_sampler(circuit, shots=shots)
-    counts = result["counts"]
+    Same as play_filter, but awaits the sampler job instead of waiting on it.
     
-    # Determine outcome
-    # Win if measured |1⟩, lose if measured |0⟩
-    ones_count = counts.get("1", 0)
-    zeros_count = counts.get("0", 0)
+    Args:
+        qcount: Number of quantum chips to bet
+        shots: Number of measurement shots (uses default if not specified)
+    
+    Returns:
+        dict: Game result with outcome, counts, job_id, audit info
+    """
+    if shots is None:
+        shots = get_default_shots()
+    
+    with timed("play", game="filter"):
+        theta = filter_theta(qcount)
+        circuit_hash = template_hash("filter", (theta,))
+        
+        result = await run_batched_async(("filter", [theta]), shots)
+        return _filter_result(qcount, shots, theta, circuit_hash, result)
+
+
+def _entangled_result(qcount_a: int, qcount_b: int, shots: int, theta: float,
+                      circuit_hash: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn sampler output for an entangled pair into the game response."""
+    counts = result["counts"]
     
-    win_probability = ones_count / shots
-    outcome = "win" if ones_count > zeros_count else "lose"
+    correlation_strength = counts.even_parity() / shots
+    outcome = entangled_outcome(counts)
+    winner = {"player_a_wins": "player_a", "player_b_wins": "player_b"}.get(outcome, "tie")
+    PLAYS.inc(game="entangled_wager", backend=result["backend"], outcome=outcome)
     
-    # Build response
-    return {
-        "game_type": "filter",
+    return _recorded({
+        "game_type": "entangled_wager",
         "outcome": outcome,
-        "win_probability": win_probability,
+        "winner": winner,
+        "correlation_strength": correlation_strength,
         "counts": counts,
         "shots": shots,
         "params": {
-            "qcount": qcount,
-            "theta": circuit_metadata["theta"],
-            "theta_degrees": circuit_metadata["theta_degrees"]
+            "qcount_a": qcount_a,
+            "qcount_b": qcount_b,
+            "theta": theta,
+            "theta_degrees": math.degrees(theta)
         },
         "audit": {
             "job_id": result["job_id"],
             "backend": result["backend"],
             "circuit_hash": circuit_hash,
+            "circuit_hash_version": CIRCUIT_HASH_VERSION,
             "timestamp": datetime.utcnow().isoformat()
         }
-    }
+    })
 
 
 def play_entangled_wager(qcount_a: int, qcount_b: int, shots: Optional[int] = None) -> Dict[str, Any]:
@@ -78,52 +212,502 @@ def play_entangled_wager(qcount_a: int, qcount_b: int, shots: Optional[int] = No
     if shots is None:
         shots = get_default_shots()
     
-    # Calculate theta based on both players' bets
-    import math
-    theta = (qcount_a - qcount_b) * 0.1 * math.pi
+    with timed("play", game="entangled_wager"):
+        # The phase only binds a value into the cached, pre-transpiled template
+        theta = entangled_theta(qcount_a, qcount_b)
+        circuit_hash = template_hash("entangled_pair", (theta,))
+        
+        # Run on quantum backend (coalesced with concurrent plays)
+        result = run_batched(("entangled_pair", [theta]), shots)
+        return _entangled_result(qcount_a, qcount_b, shots, theta, circuit_hash, result)
+
+
+async def play_entangled_wager_async(qcount_a: int, qcount_b: int, shots: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play the Entangled Wager game without blocking the event loop.
     
-    # Build the circuit
-    circuit, circuit_metadata = make_entangled_pair(theta)
-    circuit_hash = get_circuit_hash(circuit)
+    Args:
+        qcount_a: Player A's quantum chip bet
+        qcount_b: Player B's quantum chip bet
+        shots: Number of measurement shots
     
-    # Run on quantum backend
-    result = run_sampler(circuit, shots=shots)
+    Returns:
+        dict: Game result with outcomes for both players
+    """
+    if shots is None:
+        shots = get_default_shots()
+    
+    with timed("play", game="entangled_wager"):
+        theta = entangled_theta(qcount_a, qcount_b)
+        circuit_hash = template_hash("entangled_pair", (theta,))
+        
+        result = await run_batched_async(("entangled_pair", [theta]), shots)
+        return _entangled_result(qcount_a, qcount_b, shots, theta, circuit_hash, result)
+
+
+def slots_outcome(counts: Mapping[str, int], paytable: Paytable) -> Dict[str, Any]:
+    """
+    Decide a Slots round from its counts.
+    
+    The paytable is evaluated once per distinct outcome, not once per shot.
+    
+    Args:
+        counts: Measurement counts over the reels (Counts or a bitstring dict)
+        paytable: Payout rules
+    
+    Returns:
+        dict: outcome ("win" if the spins returned more than the bet, else
+              "lose"), return_multiplier, winning_shots and jackpots
+    """
+    score = paytable.evaluate(counts)
+    return {"outcome": "win" if score["return_multiplier"] > 1.0 else "lose", **score}
+
+
+def slots_angles(n_reels: int, angles: Optional[Sequence[float]] = None) -> List[float]:
+    """
+    Per-reel rotation angles for a slots round, checked against the house limits.
+    
+    Args:
+        n_reels: Number of reels
+        angles: One RY angle per reel in [0, pi/2] (fair reels, pi/2, if not specified)
+    
+    Returns:
+        list: Angles as floats
+    
+    Raises:
+        ValueError: If the reel count or angles are out of range
+    """
+    if not 1 <= n_reels <= MAX_REELS:
+        raise ValueError(f"n_reels must be between 1 and {MAX_REELS} (got {n_reels})")
+    if angles is None:
+        return [MAX_REEL_ANGLE] * n_reels
+    if len(angles) != n_reels:
+        raise ValueError(f"Number of angles ({len(angles)}) must match n_reels ({n_reels})")
+    if any(not 0.0 <= angle <= MAX_REEL_ANGLE for angle in angles):
+        raise ValueError("Reel angles must be between 0 and pi/2")
+    return [float(angle) for angle in angles]
+
+
+def _slots_paytable(n_reels: int, paytable: Optional[Paytable]) -> Paytable:
+    """
+    Resolve the paytable for a round, defaulting to the house rules.
+    
+    Ledger records are verified against ``Paytable.default``, so custom rules
+    are refused while the audit ledger is enabled.
+    
+    Raises:
+        ValueError: If a custom paytable is given with the audit ledger enabled
+    """
+    default = Paytable.default(n_reels)
+    if paytable is None or paytable == default:
+        return default
+    if get_audit_ledger() is not None:
+        raise ValueError("Custom paytables can't be verified from the audit ledger; "
+                         "use the default paytable while AUDIT_LEDGER_DIR is set")
+    return paytable
+
+
+def _slots_result(angles: List[float], shots: int, paytable: Paytable,
+                  circuit_hash: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn sampler output for a slots circuit into the game response."""
     counts = result["counts"]
     
-    # Analyze correlations
-    correlated = counts.get("00", 0) + counts.get("11", 0)
-    anticorrelated = counts.get("01", 0) + counts.get("10", 0)
+    score = slots_outcome(counts, paytable)
+    PLAYS.inc(game="slots", backend=result["backend"], outcome=score["outcome"])
+    
+    return _recorded({
+        "game_type": "slots",
+        **score,
+        "counts": counts,
+        "shots": shots,
+        "params": {
+            "n_reels": len(angles),
+            "angles": angles,
+            "angles_degrees": [math.degrees(angle) for angle in angles]
+        },
+        "audit": {
+            "job_id": result["job_id"],
+            "backend": result["backend"],
+            "circuit_hash": circuit_hash,
+            "circuit_hash_version": CIRCUIT_HASH_VERSION,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    })
+
+
+def play_slots(n_reels: int, angles: Optional[Sequence[float]] = None, shots: Optional[int] = None,
+               paytable: Optional[Paytable] = None) -> Dict[str, Any]:
+    """
+    Play the Slots game.
+    
+    Each reel is a qubit rotated by its angle and measured; every shot is one
+    spin, paid from the paytable. The round returns the average pay per unit
+    bet over all spins.
     
-    correlation_strength = correlated / shots
+    Args:
+        n_reels: Number of reels (qubits)
+        angles: Per-reel angles in [0, pi/2] (pi/2 for every reel if not specified)
+        shots: Number of spins (uses default if not specified)
+        paytable: Payout rules (``Paytable.default(n_reels)`` if not specified;
+                  custom rules are refused while the audit ledger is enabled)
     
-    # Determine winner based on correlation
-    if correlated > anticorrelated:
-        outcome = "player_a_wins"
-        winner = "player_a"
-    elif anticorrelated > correlated:
-        outcome = "player_b_wins"
-        winner = "player_b"
+    Returns:
+        dict: Game result with outcome, return_multiplier, counts, audit info
+    """
+    if shots is None:
+        shots = get_default_shots()
+    angles = slots_angles(n_reels, angles)
+    paytable = _slots_paytable(n_reels, paytable)
+    
+    with timed("play", game="slots"):
+        circuit_hash = template_hash("slots", tuple(angles), n_reels)
+        
+        result = run_batched(("slots", angles), shots)
+        return _slots_result(angles, shots, paytable, circuit_hash, result)
+
+
+async def play_slots_async(n_reels: int, angles: Optional[Sequence[float]] = None, shots: Optional[int] = None,
+                           paytable: Optional[Paytable] = None) -> Dict[str, Any]:
+    """
+    Play the Slots game without blocking the event loop.
+    
+    Args:
+        n_reels: Number of reels (qubits)
+        angles: Per-reel angles in [0, pi/2] (pi/2 for every reel if not specified)
+        shots: Number of spins (uses default if not specified)
+        paytable: Payout rules (``Paytable.default(n_reels)`` if not specified;
+                  custom rules are refused while the audit ledger is enabled)
+    
+    Returns:
+        dict: Game result with outcome, return_multiplier, counts, audit info
+    """
+    if shots is None:
+        shots = get_default_shots()
+    angles = slots_angles(n_reels, angles)
+    paytable = _slots_paytable(n_reels, paytable)
+    
+    with timed("play", game="slots"):
+        circuit_hash = template_hash("slots", tuple(angles), n_reels)
+        
+        result = await run_batched_async(("slots", angles), shots)
+        return _slots_result(angles, shots, paytable, circuit_hash, result)
+
+
+def find_card_outcome(counts: Mapping[str, int], guess: int, card: int) -> Dict[str, Any]:
+    """
+    Decide a Find the Card round from its counts.
+    
+    The card the search found is the most frequently measured outcome (the
+    lowest one on a tie). The bet is settled against the hidden card; a
+    search that doesn't reveal it is void and the bet is returned, so the
+    house never pays out on noise.
+    
+    Args:
+        counts: Measurement counts over the search qubits (Counts or a bitstring dict)
+        guess: The player's card
+        card: The hidden (marked) card
+    
+    Returns:
+        dict: found_card and outcome ("void" if the search missed the hidden
+              card, else "win" if it is the guessed card, else "lose")
+    """
+    counts = Counts.from_dict(counts)
+    found = int(counts.outcomes[int(np.argmax(counts.occurrences))])
+    if found != card:
+        outcome = "void"
     else:
-        outcome = "tie"
-        winner = "tie"
+        outcome = "win" if guess == card else "lose"
+    return {"outcome": outcome, "found_card": found}
+
+
+def _find_card_result(n_qubits: int, guess: int, card: int, shots: int,
+                      circuit_hash: str, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Turn sampler output for a Grover search into the game response."""
+    counts = result["counts"]
+    iterations = optimal_iterations(n_qubits)
     
-    return {
-        "game_type": "entangled_wager",
-        "outcome": outcome,
-        "winner": winner,
-        "correlation_strength": correlation_strength,
+    decision = find_card_outcome(counts, guess, card)
+    PLAYS.inc(game="find_the_card", backend=result["backend"], outcome=decision["outcome"])
+    
+    return _recorded({
+        "game_type": "find_the_card",
+        **decision,
+        "search_success": counts.count(card) / shots,
+        "success_probability": success_probability(n_qubits, iterations),
         "counts": counts,
         "shots": shots,
         "params": {
-            "qcount_a": qcount_a,
-            "qcount_b": qcount_b,
-            "theta": circuit_metadata["theta"],
-            "theta_degrees": circuit_metadata["theta_degrees"]
+            "n_qubits": n_qubits,
+            "guess": guess,
+            "marked_card": card,
+            "iterations": iterations
         },
         "audit": {
             "job_id": result["job_id"],
             "backend": result["backend"],
             "circuit_hash": circuit_hash,
+            "circuit_hash_version": CIRCUIT_HASH_VERSION,
+            "timestamp": datetime.utcnow().isoformat()
+        }
+    })
+
+
+def max_deck_qubits(backend_name: Optional[str] = None) -> int:
+    """
+    Widest Find the Card deck the search stays reliable on for a backend.
+    
+    Ideal local engines allow MAX_DECK_QUBITS; hardware, fake and noisy
+    backends (or routing across several backends) are capped at
+    FIND_CARD_MAX_QUBITS.
+    
+    Args:
+        backend_name: Backend to use (uses QISKIT_BACKEND, or QISKIT_BACKENDS when routing, if not specified)
+    
+    Returns:
+        int: Largest n_qubits accepted
+    """
+    settings = get_settings()
+    if backend_name is None and settings.qiskit_backends:
+        backends = [name.strip() for name in settings.qiskit_backends.split(",")]
+    else:
+        backends = [resolve_backend_name(backend_name)]
+    
+    if all(name in _IDEAL_ENGINES for name in backends):
+        return MAX_DECK_QUBITS
+    return max(1, min(MAX_DECK_QUBITS, settings.find_card_max_qubits))
+
+
+def validate_find_card(n_qubits: int, guess: int):
+    """
+    Check a Find the Card bet against the deck sizes the backend supports.
+    
+    Raises:
+        ValueError: If the deck size or the guess is out of range
+    """
+    max_qubits = max_deck_qubits()
+    if not 1 <= n_qubits <= max_qubits:
+        raise ValueError(f"n_qubits must be between 1 and {max_qubits} on this backend (got {n_qubits})")
+    if not 0 <= guess < 2 ** n_qubits:
+        raise ValueError(f"Guess must be between 0 and {2 ** n_qubits - 1} (got {guess})")
+
+
+def _deal_card(n_qubits: int, guess: int, card: Optional[int]) -> int:
+    """Check a Find the Card bet and draw the hidden card if none is given."""
+    validate_find_card(n_qubits, guess)
+    return secrets.randbelow(2 ** n_qubits) if card is None else card
+
+
+def play_find_card(n_qubits: int, guess: int, shots: Optional[int] = None,
+                   card: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play Find the Card.
+    
+    The house hides one card of a 2^n_qubits deck and marks it in a Grover
+    oracle; the search runs for the optimal number of iterations and the most
+    frequently measured card is revealed. The player wins if they guessed the
+    hidden card and the search revealed it; a search that misses the hidden
+    card voids the round.
+    
+    Args:
+        n_qubits: Deck size as a number of qubits (2 to 1024 cards; capped by max_deck_qubits)
+        guess: The player's card, 0 to 2^n_qubits - 1
+        shots: Number of measurement shots (uses default if not specified)
+        card: The hidden card (drawn at random if not specified)
+    
+    Returns:
+        dict: Game result with outcome, found and marked card, counts, audit info
+    """
+    if shots is None:
+        shots = get_default_shots()
+    card = _deal_card(n_qubits, guess, card)
+    
+    with timed("play", game="find_the_card"):
+        # The card only binds oracle angles into the cached, pre-transpiled search
+        flips = card_flips(n_qubits, card)
+        circuit_hash = template_hash("grover", tuple(flips), n_qubits)
+        
+        result = run_batched(("grover", flips), shots)
+        return _find_card_result(n_qubits, guess, card, shots, circuit_hash, result)
+
+
+async def play_find_card_async(n_qubits: int, guess: int, shots: Optional[int] = None,
+                               card: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Play Find the Card without blocking the event loop.
+    
+    Args:
+        n_qubits: Deck size as a number of qubits (2 to 1024 cards; capped by max_deck_qubits)
+        guess: The player's card, 0 to 2^n_qubits - 1
+        shots: Number of measurement shots (uses default if not specified)
+        card: The hidden card (drawn at random if not specified)
+    
+    Returns:
+        dict: Game result with outcome, found and marked card, counts, audit info
+    """
+    if shots is None:
+        shots = get_default_shots()
+    card = _deal_card(n_qubits, guess, card)
+    
+    with timed("play", game="find_the_card"):
+        flips = card_flips(n_qubits, card)
+        circuit_hash = template_hash("grover", tuple(flips), n_qubits)
+        
+        result = await run_batched_async(("grover", flips), shots)
+        return _find_card_result(n_qubits, guess, card, shots, circuit_hash, result)
+
+
+# Required integer fields per batch play type
+_PLAY_FIELDS = {"filter": ("qcount",), "entangled_wager": ("qa", "qb")}
+
+
+def validate_play(play: Dict[str, Any]):
+    """
+    Check that a batch play names a known game and has its integer fields.
+    
+    Args:
+        play: Play dict as accepted by play_batch
+    
+    Raises:
+        ValueError: If the play is malformed
+    """
+    if not isinstance(play, dict):
+        raise ValueError("Play must be an object")
+    
+    game = play.get("game")
+    if game not in _PLAY_FIELDS:
+        raise ValueError(f"Unknown game '{game}'. Use 'filter' or 'entangled_wager'")
+    
+    for field in _PLAY_FIELDS[game] + ("shots",):
+        value = play.get(field)
+        if field == "shots" and value is None:
+            continue
+        if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+            raise ValueError(f"'{game}' play requires a positive integer '{field}'")
+
+
+def play_batch(plays: Sequence[Dict[str, Any]], shots: Optional[int] = None,
+               backend_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Play many rounds of mixed games in a single sampler job.
+    
+    Plays of the same game and shot count become one parameter-sweep PUB
+    (one row per play), and all PUBs go out in one job with per-PUB shots.
+    
+    Args:
+        plays: Play dicts, either ``{"game": "filter", "qcount": ...}`` or
+               ``{"game": "entangled_wager", "qa": ..., "qb": ...}``, each with
+               optional "shots" and an optional "id" echoed back in its result
+        shots: Shots for plays that don't specify any (uses default if not specified)
+        backend_name: Backend to use (routed per QISKIT_BACKENDS, or QISKIT_BACKEND, if not specified)
+    
+    Returns:
+        list: Game results in the same order as ``plays``
+    
+    Raises:
+        ValueError: If any play is malformed (nothing is run)
+    """
+    if not plays:
+        return []
+    
+    default_shots = shots or get_default_shots()
+    
+    with timed("play_batch"):
+        # (template game, shots) -> [(play index, theta)]
+        groups: Dict[tuple, List[tuple]] = {}
+        for index, play in enumerate(plays):
+            try:
+                validate_play(play)
+            except ValueError as e:
+                raise ValueError(f"Play {index}: {e}")
+            
+            play_shots = play.get("shots") or default_shots
+            if play["game"] == "filter":
+                theta = filter_theta(play["qcount"])
+                groups.setdefault(("filter", play_shots), []).append((index, theta))
+            else:
+                theta = entangled_theta(play["qa"], play["qb"])
+                groups.setdefault(("entangled_pair", play_shots), []).append((index, theta))
+        
+        def run_pubs(_, shots, backend_name):
+            # Templates are transpiled for whichever backend the job is routed to
+            pubs = []
+            for (template, play_shots), rows in groups.items():
+                circuit, values = make_pub(template, [[theta] for _, theta in rows], backend_name)
+                pubs.append((circuit, values, play_shots))
+            return run_sampler(pubs, shots=shots, backend_name=backend_name)
+        
+        widest = [(template, [0.0]) for template, _ in groups]
+        result = run_routed(run_pubs, widest, default_shots, backend_name)
+        counts_per_pub = result["counts"] if len(groups) > 1 else [result["counts"]]
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(plays)
+        for ((template, play_shots), rows), counts_list in zip(groups.items(), counts_per_pub):
+            for (index, theta), counts in zip(rows, counts_list):
+                play = plays[index]
+                play_result = {"job_id": result["job_id"], "backend": result["backend"], "counts": counts}
+                circuit_hash = template_hash(template, (theta,))
+                if template == "filter":
+                    response = _filter_result(play["qcount"], play_shots, theta, circuit_hash, play_result)
+                else:
+                    response = _entangled_result(play["qa"], play["qb"], play_shots, theta, circuit_hash, play_result)
+                if "id" in play:
+                    response["id"] = play["id"]
+                results[index] = response
+        
+        return results
+
+
+async def play_batch_async(plays: Sequence[Dict[str, Any]], shots: Optional[int] = None,
+                           backend_name: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Async version of play_batch that waits for the job in the bounded executor.
+    
+    Args:
+        plays: Play dicts as accepted by play_batch
+        shots: Shots for plays that don't specify any (uses default if not specified)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+    
+    Returns:
+        list: Game results in the same order as ``plays``
+    """
+    loop = asyncio.get_running_loop()
+    results = await loop.run_in_executor(get_executor(), partial(play_batch, plays, shots, backend_name))
+    if results:
+        await simulate_latency(results[0]["audit"]["backend"])
+    return results
+
+
+def draw_random_bits(n_bits: int, timeout: float = 0.0) -> Dict[str, Any]:
+    """
+    Draw uniformly random bits from the quantum entropy pool.
+    
+    Bits come from pre-measured Hadamard circuits, so no QPU job runs on the
+    request path. The audit block lists the job IDs the bits came from.
+    
+    Args:
+        n_bits: Number of random bits (rounded up to whole bytes internally)
+        timeout: Seconds to wait for a refill if the pool is short
+    
+    Returns:
+        dict: Random bits as bitstring, hex and integer value, plus audit info
+    """
+    if n_bits < 1:
+        raise ValueError(f"n_bits must be at least 1 (got {n_bits})")
+    
+    draw = get_entropy_pool().draw((n_bits + 7) // 8, timeout=timeout)
+    
+    # Keep only the lowest n_bits of the drawn bytes
+    value = int.from_bytes(draw.data, "big") & ((1 << n_bits) - 1)
+    
+    return {
+        "n_bits": n_bits,
+        "bits": format(value, f"0{n_bits}b"),
+        "hex": format(value, f"0{(n_bits + 3) // 4}x"),
+        "value": value,
+        "audit": {
+            "source": "entropy_pool",
+            "job_ids": draw.job_ids,
+            "backend": draw.backend,
             "timestamp": datetime.utcnow().isoformat()
         }
     }
@@ -160,4 +744,16 @@ def compute_payout(game_result: Dict[str, Any], bet_amount: float) -> float:
             return bet_amount * 2.0
         return 0.0
     
+    elif game_type == "find_the_card":
+        # One card in 2^n_qubits: the house keeps 5%; a missed search returns the bet
+        if game_result["outcome"] == "void":
+            return bet_amount
+        if game_result["outcome"] == "win":
+            return bet_amount * FIND_CARD_RETURN * 2 ** game_result["params"]["n_qubits"]
+        return 0.0
+    
+    elif game_type == "slots":
+        # Spins pay from the paytable; the round returns their average
+        return bet_amount * game_result["return_multiplier"]
+    
     return 0.0
@@ -0,0 +1,200 @@
+"""Grover search circuits: size-aware multi-controlled gates, cached synthesis and iteration math."""
+
+import math
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Sequence
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# Widest search the builders support (a 65536-card deck)
+MAX_GROVER_QUBITS = 16
+
+# Ancilla qubits each MCX decomposition needs
+MCX_ANCILLAS = {"native": 0, "noaux": 0, "one_clean": 1, "two_clean": 2}
+
+# From this many controls, two clean ancillas give a shallower ladder than one
+_TWO_ANCILLA_CONTROLS = 5
+
+# From this many controls, the H-P ancilla-free synthesis is shallower than V24's
+_HP24_CONTROLS = 7
+
+
+def mcx_strategy(num_ctrl: int, max_ancillas: int = 2) -> str:
+    """
+    Choose how to decompose a multi-controlled X gate.
+
+    Up to two controls are a plain CX/CCX. Wider gates use the Khattar-Gidney
+    ladders of relative-phase Toffolis, which need one or two clean ancillas
+    and grow by about 6 CX per control. The ancilla-free decompositions grow
+    quadratically (about 1500 CX at 15 controls against 84). Two ancillas
+    are shallower from five controls on. The ancilla-free synthesis is only
+    used when no ancilla is allowed.
+
+    Args:
+        num_ctrl: Number of control qubits
+        max_ancillas: Most clean ancilla qubits the circuit may add
+
+    Returns:
+        str: "native", "one_clean", "two_clean" or "noaux"
+    """
+    if num_ctrl <= 2:
+        return "native"
+    if max_ancillas >= 2 and num_ctrl >= _TWO_ANCILLA_CONTROLS:
+        return "two_clean"
+    if max_ancillas >= 1:
+        return "one_clean"
+    return "noaux"
+
+
+@lru_cache(maxsize=None)
+def synthesize_mcx(num_ctrl: int, strategy: str) -> "QuantumCircuit":
+    """
+    Decompose an MCX gate, once per (controls, strategy).
+
+    Args:
+        num_ctrl: Number of control qubits
+        strategy: Decomposition from ``mcx_strategy``
+
+    Returns:
+        QuantumCircuit: Controls first, then the target, then any ancillas
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.synthesis import (
+        synth_mcx_1_clean_kg24,
+        synth_mcx_2_clean_kg24,
+        synth_mcx_noaux_hp24,
+        synth_mcx_noaux_v24,
+    )
+
+    if strategy == "native":
+        if num_ctrl > 2:
+            raise ValueError(f"Native MCX supports at most 2 controls (got {num_ctrl})")
+        qc = QuantumCircuit(num_ctrl + 1)
+        if num_ctrl == 0:
+            qc.x(0)
+        elif num_ctrl == 1:
+            qc.cx(0, 1)
+        else:
+            qc.ccx(0, 1, 2)
+        return qc
+    if strategy == "one_clean":
+        return synth_mcx_1_clean_kg24(num_ctrl)
+    if strategy == "two_clean":
+        return synth_mcx_2_clean_kg24(num_ctrl)
+    if strategy == "noaux":
+        return synth_mcx_noaux_hp24(num_ctrl) if num_ctrl >= _HP24_CONTROLS else synth_mcx_noaux_v24(num_ctrl)
+    raise ValueError(f"Unknown MCX strategy '{strategy}'. Available: {', '.join(MCX_ANCILLAS)}")
+
+
+def append_mcz(qc: "QuantumCircuit", qubits: Sequence[int], ancillas: Sequence[int] = ()):
+    """
+    Append a multi-controlled Z over ``qubits`` (phase-flips the all-ones state).
+
+    Args:
+        qc: Circuit to append to
+        qubits: Qubits of the MCZ; the last one is the MCX target
+        ancillas: Clean ancilla qubits the decomposition may use
+    """
+    qubits = list(qubits)
+    if len(qubits) == 1:
+        qc.z(qubits[0])
+        return
+    if len(qubits) == 2:
+        qc.cz(qubits[0], qubits[1])
+        return
+
+    strategy = mcx_strategy(len(qubits) - 1, len(ancillas))
+    target = qubits[-1]
+    qc.h(target)
+    qc.compose(synthesize_mcx(len(qubits) - 1, strategy),
+               qubits=qubits + list(ancillas)[:MCX_ANCILLAS[strategy]], inplace=True)
+    qc.h(target)
+
+
+def grover_ancillas(n_qubits: int, max_ancillas: int = 2) -> int:
+    """Ancilla qubits a Grover circuit over ``n_qubits`` adds."""
+    return MCX_ANCILLAS[mcx_strategy(n_qubits - 1, max_ancillas)] if n_qubits > 2 else 0
+
+
+def optimal_iterations(n_qubits: int, n_marked: int = 1) -> int:
+    """
+    Grover iterations that maximize the chance of measuring a marked state.
+
+    Args:
+        n_qubits: Search register width (2^n_qubits states)
+        n_marked: Number of marked states
+
+    Returns:
+        int: Iteration count k maximizing sin^2((2k+1) * theta)
+    """
+    theta = math.asin(math.sqrt(n_marked / 2 ** n_qubits))
+    return max(0, round(math.pi / (4 * theta) - 0.5))
+
+
+def success_probability(n_qubits: int, iterations: int, n_marked: int = 1) -> float:
+    """Ideal probability of measuring a marked state after ``iterations`` rounds."""
+    theta = math.asin(math.sqrt(n_marked / 2 ** n_qubits))
+    return math.sin((2 * iterations + 1) * theta) ** 2
+
+
+def card_flips(n_qubits: int, card: int) -> List[float]:
+    """
+    Oracle angles that mark a card: pi on every qubit whose bit is 0.
+
+    Bit i of ``card`` is qubit i (clbit i of the measured outcome).
+    """
+    if not 0 <= card < 2 ** n_qubits:
+        raise ValueError(f"Card must be between 0 and {2 ** n_qubits - 1} (got {card})")
+    return [0.0 if (card >> i) & 1 else math.pi for i in range(n_qubits)]
+
+
+def build_grover_circuit(n_qubits: int, flips: Sequence, iterations: int = None,
+                         max_ancillas: int = 2) -> "QuantumCircuit":
+    """
+    Build a Grover search for one marked state.
+
+    The oracle conjugates an MCZ with RX(flip) on each qubit. RX(pi) is X up
+    to global phase, so binding ``card_flips`` marks that card, and passing a
+    ParameterVector gives one template for every card of the deck.
+
+    Args:
+        n_qubits: Search register width
+        flips: Per-qubit oracle angles (floats or parameters)
+        iterations: Oracle + diffuser rounds (optimal if not specified)
+        max_ancillas: Most clean ancillas the MCZ decompositions may add
+
+    Returns:
+        QuantumCircuit: Search qubits, then ancillas; only the search qubits are measured
+    """
+    if not 1 <= n_qubits <= MAX_GROVER_QUBITS:
+        raise ValueError(f"n_qubits must be between 1 and {MAX_GROVER_QUBITS} (got {n_qubits})")
+    if len(flips) != n_qubits:
+        raise ValueError(f"Number of flips ({len(flips)}) must match n_qubits ({n_qubits})")
+    if iterations is None:
+        iterations = optimal_iterations(n_qubits)
+
+    from qiskit import QuantumCircuit
+
+    data = list(range(n_qubits))
+    ancillas = list(range(n_qubits, n_qubits + grover_ancillas(n_qubits, max_ancillas)))
+    qc = QuantumCircuit(n_qubits + len(ancillas), n_qubits)
+
+    qc.h(data)
+    for _ in range(iterations):
+        # Oracle: phase-flip the marked state
+        for q in data:
+            qc.rx(flips[q], q)
+        append_mcz(qc, data, ancillas)
+        for q in data:
+            qc.rx(flips[q], q)
+
+        # Diffuser: reflect about the uniform superposition
+        qc.h(data)
+        qc.x(data)
+        append_mcz(qc, data, ancillas)
+        qc.x(data)
+        qc.h(data)
+
+    qc.measure(data, data)
+    return qc
@@ -0,0 +1,163 @@
+"""In-memory ticket store for submit-then-poll play execution."""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, Optional
+
+from .settings import get_settings
+
+PENDING = "pending"
+DONE = "done"
+FAILED = "failed"
+
+
+class JobQueueFull(Exception):
+    """Raised when too many tickets are pending to accept another."""
+
+
+class JobTicket:
+    """State of a single submitted play."""
+
+    __slots__ = ("id", "status", "created_at", "finished_at", "result", "error", "_done")
+
+    def __init__(self):
+        self.id = uuid.uuid4().hex
+        self.status = PENDING
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[str] = None
+        self._done = asyncio.Event()
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize the ticket for API responses."""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "result": self.result,
+            "error": self.error
+        }
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the ticket finishes.
+
+        Args:
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            bool: True if the ticket finished, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+
+class JobStore:
+    """
+    Track plays submitted as background tasks until clients collect them.
+
+    Finished tickets are kept for ``ttl_s`` seconds and the store holds at most
+    ``max_pending`` unfinished tickets, so memory stays bounded under load.
+
+    Args:
+        ttl_s: How long finished tickets stay retrievable
+        max_pending: Maximum number of unfinished tickets
+    """
+
+    def __init__(self, ttl_s: float = 600.0, max_pending: int = 10000):
+        self.ttl_s = ttl_s
+        self.max_pending = max_pending
+        self._tickets: "OrderedDict[str, JobTicket]" = OrderedDict()
+        self._pending = 0
+        self._tasks = set()
+
+    def submit(self, play: Awaitable[Dict[str, Any]]) -> JobTicket:
+        """
+        Start a play in the background and return its ticket.
+
+        Must be called from inside the running event loop.
+
+        Args:
+            play: Awaitable producing the game result
+
+        Returns:
+            JobTicket: The new ticket (status "pending")
+        """
+        self._evict()
+        if self._pending >= self.max_pending:
+            if asyncio.iscoroutine(play):
+                play.close()
+            raise JobQueueFull(f"Too many pending jobs ({self._pending})")
+
+        ticket = JobTicket()
+        self._tickets[ticket.id] = ticket
+        self._pending += 1
+
+        task = asyncio.ensure_future(self._run(ticket, play))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return ticket
+
+    def get(self, job_id: str) -> Optional[JobTicket]:
+        """Look up a ticket by id (None if unknown or expired)."""
+        self._evict()
+        return self._tickets.get(job_id)
+
+    @property
+    def pending(self) -> int:
+        """Number of unfinished tickets."""
+        return self._pending
+
+    async def _run(self, ticket: JobTicket, play: Awaitable[Dict[str, Any]]):
+        try:
+            ticket.result = await play
+            ticket.status = DONE
+        except Exception as e:
+            ticket.error = str(e)
+            ticket.status = FAILED
+        finally:
+            ticket.finished_at = time.time()
+            self._pending -= 1
+            ticket._done.set()
+
+    def _evict(self):
+        # Tickets are ordered by creation, so expired finished ones cluster at the front
+        cutoff = time.time() - self.ttl_s
+        for job_id in list(self._tickets):
+            ticket = self._tickets[job_id]
+            if ticket.created_at >= cutoff:
+                break
+            if ticket.finished_at is not None and ticket.finished_at < cutoff:
+                del self._tickets[job_id]
+
+
+# Global job store
+_store: Optional[JobStore] = None
+
+
+def get_job_store() -> JobStore:
+    """
+    Return the process-wide job store, configured from environment.
+
+    Uses JOB_TTL_SECONDS (default 600) and JOB_MAX_PENDING (default 10000).
+
+    Returns:
+        JobStore: The shared store
+    """
+    global _store
+
+    if _store is None:
+        _store = JobStore(
+            ttl_s=get_settings().job_ttl_seconds,
+            max_pending=get_settings().job_max_pending,
+        )
+
+    return _store
@@ -0,0 +1,725 @@
+"""Append-only binary audit ledger of plays with memory-mapped lookup indexes."""
+
+import atexit
+import hashlib
+import json
+import logging
+import mmap
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .grover import optimal_iterations
+from .metrics import timed
+from .results import Counts
+from .settings import get_settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: segments left by stopped writers stay unsealed
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+SEGMENT_MAGIC = b"QAL1"
+
+# Held while a writer claims a segment or checks for orphaned ones
+WRITERS_LOCK = "writers.lock"
+
+# length, timestamp_us, game, outcome, hash version, clbits, shots, param a, param b,
+# theta, payout per unit bet, circuit hash, job_id length, backend length, counts entries
+# (saturating; the entry count is derived from the record length)
+_HEADER = struct.Struct("<IqBBBBIhhdd32sBBH")
+_COUNT = struct.Struct("<II")
+_COUNT_DTYPE = np.dtype([("key", "<u4"), ("value", "<u4")])
+_CRC = struct.Struct("<I")
+_CARD = struct.Struct("<I")
+
+GAMES = ("filter", "entangled_wager", "slots", "find_the_card")
+OUTCOMES = ("lose", "win", "player_a_wins", "player_b_wins", "tie", "void")
+
+# Sorted per-segment indexes, loaded with np.load(mmap_mode="r")
+TIME_INDEX_DTYPE = np.dtype([("ts", "<i8"), ("offset", "<u8")])
+KEY_INDEX_DTYPE = np.dtype([("key", "<u8"), ("offset", "<u8")])
+
+Timestamp = Union[datetime, float, int, str, None]
+
+
+def encode_record(play: Dict[str, Any], payout: float) -> bytes:
+    """
+    Encode a game result into one ledger record.
+
+    Args:
+        play: Result dict from a play_* function
+        payout: Payout per unit bet (``compute_payout(play, 1.0)``)
+
+    Returns:
+        bytes: Length-prefixed record with a trailing CRC32
+
+    Raises:
+        ValueError: If the outcomes are wider than the 32-bit count keys
+    """
+    audit = play["audit"]
+    params = play["params"]
+    game = play["game_type"]
+    extra = b""
+    if game == "filter":
+        param_a, param_b, theta = params["qcount"], 0, params["theta"]
+    elif game == "slots":
+        # Per-reel angles follow the backend name, one float64 per reel
+        param_a, param_b, theta = params["n_reels"], 0, 0.0
+        extra = np.asarray(params["angles"], dtype="<f8").tobytes()
+    elif game == "find_the_card":
+        # The hidden card follows the backend name
+        param_a, param_b, theta = params["n_qubits"], params["guess"], 0.0
+        extra = _CARD.pack(params["marked_card"])
+    else:
+        param_a, param_b, theta = params["qcount_a"], params["qcount_b"], params["theta"]
+
+    counts = Counts.from_dict(play["counts"])
+    n_bits = counts.num_bits
+    if n_bits > 32:
+        raise ValueError(f"Cannot record {n_bits}-bit outcomes (max 32)")
+    job_id = str(audit["job_id"]).encode()
+    backend = str(audit["backend"]).encode()
+    # Packed straight from the outcome arrays, without formatting bitstrings
+    entries = np.empty(len(counts), dtype=_COUNT_DTYPE)
+    entries["key"] = counts.outcomes
+    entries["value"] = counts.occurrences
+    body = entries.tobytes()
+
+    length = _HEADER.size + len(job_id) + len(backend) + len(extra) + len(body) + _CRC.size
+    header = _HEADER.pack(
+        length, to_epoch_us(audit["timestamp"]), GAMES.index(game), OUTCOMES.index(play["outcome"]),
+        audit.get("circuit_hash_version", 1), n_bits, play["shots"], param_a, param_b,
+        theta, payout, bytes.fromhex(audit["circuit_hash"]), len(job_id), len(backend), min(len(counts), 0xFFFF)
+    )
+    record = header + job_id + backend + extra + body
+    return record + _CRC.pack(zlib.crc32(record))
+
+
+def decode_record(buffer, offset: int = 0) -> Dict[str, Any]:
+    """
+    Decode the record starting at ``offset``.
+
+    Args:
+        buffer: bytes, mmap or memoryview holding the record
+        offset: Byte offset of the record
+
+    Returns:
+        dict: Result-shaped dict (game_type, outcome, counts, shots, params,
+              audit) plus ``payout_per_unit``
+
+    Raises:
+        ValueError: If the record is truncated or fails its checksum
+    """
+    if offset + _HEADER.size > len(buffer):
+        raise ValueError(f"Truncated record at offset {offset}")
+
+    (length, ts, game, outcome, version, n_bits, shots, param_a, param_b, theta, payout,
+     circuit_hash, job_len, backend_len, _) = _HEADER.unpack_from(buffer, offset)
+
+    end = offset + length
+    if length < _HEADER.size + _CRC.size or end > len(buffer):
+        raise ValueError(f"Truncated record at offset {offset}")
+    if zlib.crc32(buffer[offset:end - _CRC.size]) != _CRC.unpack_from(buffer, end - _CRC.size)[0]:
+        raise ValueError(f"Checksum mismatch at offset {offset}")
+
+    pos = offset + _HEADER.size
+    job_id = bytes(buffer[pos:pos + job_len]).decode()
+    pos += job_len
+    backend = bytes(buffer[pos:pos + backend_len]).decode()
+    pos += backend_len
+
+    if GAMES[game] == "slots":
+        angles = np.frombuffer(buffer, dtype="<f8", count=param_a, offset=pos).tolist()
+        pos += 8 * param_a
+    elif GAMES[game] == "find_the_card":
+        card = _CARD.unpack_from(buffer, pos)[0]
+        pos += _CARD.size
+
+    counts = {}
+    for _ in range((end - _CRC.size - pos) // _COUNT.size):
+        key, value = _COUNT.unpack_from(buffer, pos)
+        counts[format(key, f"0{n_bits}b")] = value
+        pos += _COUNT.size
+
+    if GAMES[game] == "filter":
+        params = {"qcount": param_a, "theta": theta}
+    elif GAMES[game] == "slots":
+        params = {"n_reels": param_a, "angles": angles}
+    elif GAMES[game] == "find_the_card":
+        params = {"n_qubits": param_a, "guess": param_b, "marked_card": card,
+                  "iterations": optimal_iterations(param_a)}
+    else:
+        params = {"qcount_a": param_a, "qcount_b": param_b, "theta": theta}
+
+    return {
+        "game_type": GAMES[game],
+        "outcome": OUTCOMES[outcome],
+        "counts": counts,
+        "shots": shots,
+        "params": params,
+        "payout_per_unit": payout,
+        "audit": {
+            "job_id": job_id,
+            "backend": backend,
+            "circuit_hash": circuit_hash.hex(),
+            "circuit_hash_version": version,
+            "timestamp": datetime.fromtimestamp(ts / 1e6, timezone.utc).replace(tzinfo=None).isoformat()
+        }
+    }
+
+
+def record_length(buffer, offset: int) -> int:
+    """Length in bytes of the record starting at ``offset``."""
+    return _HEADER.unpack_from(buffer, offset)[0]
+
+
+def to_epoch_us(value: Timestamp) -> int:
+    """Convert an ISO string (naive = UTC), datetime or epoch seconds to epoch microseconds."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return int(value.timestamp() * 1_000_000)
+    return int(float(value) * 1_000_000)
+
+
+def index_key(value: Union[str, bytes]) -> int:
+    """64-bit index key for a job ID or hex circuit hash."""
+    if isinstance(value, str):
+        value = value.encode()
+    return int.from_bytes(hashlib.blake2b(value, digest_size=8).digest(), "little")
+
+
+class _Segment:
+    """One segment file and its sorted indexes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._map: Optional[mmap.mmap] = None
+        self._indexes: Dict[str, np.ndarray] = {}
+
+    @property
+    def number(self) -> int:
+        return int(os.path.basename(self.path).split("-")[1].split(".")[0])
+
+    def index_path(self, kind: str) -> str:
+        return self.path[:-len(".log")] + f".{kind}.npy"
+
+    def has_index(self) -> bool:
+        return all(os.path.exists(self.index_path(kind)) for kind in ("time", "job", "hash"))
+
+    def index(self, kind: str) -> np.ndarray:
+        if kind not in self._indexes:
+            self._indexes[kind] = np.load(self.index_path(kind), mmap_mode="r")
+        return self._indexes[kind]
+
+    def data(self):
+        if self._map is None:
+            with open(self.path, "rb") as f:
+                self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map
+
+    def build_index(self, entries: List[Tuple[int, int, int, int]], persist: bool = True):
+        """Build sorted time/job/hash indexes from (ts, job key, hash key, offset) entries."""
+        rows = np.array(entries, dtype=np.uint64).reshape(-1, 4)
+        for kind, column, dtype in (("time", 0, TIME_INDEX_DTYPE), ("job", 1, KEY_INDEX_DTYPE),
+                                    ("hash", 2, KEY_INDEX_DTYPE)):
+            index = np.empty(len(rows), dtype=dtype)
+            index[dtype.names[0]] = rows[:, column].astype(dtype[0])
+            index["offset"] = rows[:, 3]
+            index = index[np.argsort(index[dtype.names[0]], kind="stable")]
+            if not persist:
+                self._indexes[kind] = index
+                continue
+            tmp = self.index_path(kind) + ".tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, index)
+            os.replace(tmp, self.index_path(kind))
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._indexes.clear()
+
+
+def _try_lock(f) -> bool:
+    """Take an exclusive lock on an open segment if no live writer holds it."""
+    if fcntl is None:
+        return False
+    try:
+        fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return False
+    return True
+
+
+def _scan(buffer, start: int = len(SEGMENT_MAGIC)) -> Tuple[List[Tuple[int, int, int, int]], int]:
+    """Read index entries from a segment buffer; returns (entries, end of last valid record)."""
+    entries = []
+    offset = start
+    while offset < len(buffer):
+        try:
+            record = decode_record(buffer, offset)
+        except ValueError:
+            break
+        entries.append((
+            to_epoch_us(record["audit"]["timestamp"]),
+            index_key(record["audit"]["job_id"]),
+            index_key(record["audit"]["circuit_hash"]),
+            offset
+        ))
+        offset += record_length(buffer, offset)
+    return entries, offset
+
+
+class AuditLedger:
+    """
+    Segmented, append-only binary log of every play.
+
+    ``append`` only queues the play; a background writer encodes records,
+    appends them to the active segment and fsyncs in batches every
+    ``fsync_interval_s``. When a segment reaches ``segment_bytes`` it is
+    sealed and gets sorted time, job_id and circuit_hash indexes stored as
+    ``.npy`` files, which queries memory-map and binary-search, so a lookup
+    costs O(log n) per segment without loading the ledger. The active
+    segment is indexed in memory.
+
+    Records are visible to queries once written (within one writer batch);
+    a crash can lose at most the records queued since the last fsync.
+
+    Several processes may write to one directory (e.g. server workers): each
+    appends only to segments it claimed itself and holds an exclusive lock
+    on its active segment. A writer's queries see other live writers'
+    segments as they were when it opened the ledger. Unsealed segments whose
+    writer has stopped are sealed by the next writer to open the directory.
+
+    Args:
+        directory: Directory holding the segment files
+        segment_bytes: Seal and index a segment once it reaches this size
+        fsync_interval_s: Maximum time between fsyncs of queued records
+        read_only: Open for queries only, e.g. alongside a live writer; nothing
+                   on disk is modified and unsealed segments are indexed in memory
+    """
+
+    def __init__(self, directory: str, segment_bytes: int = 64 * 1024 * 1024, fsync_interval_s: float = 0.2,
+                 read_only: bool = False):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        self.fsync_interval_s = fsync_interval_s
+        self.read_only = read_only
+        if not read_only:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.RLock()
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.last_error: Optional[str] = None
+
+        self._sealed: List[_Segment] = []
+        self._active: Optional[_Segment] = None
+        self._active_file = None
+        self._active_entries: List[Tuple[int, int, int, int]] = []
+        # column (1 = job, 2 = hash) -> key -> entries, for the unindexed active segment
+        self._active_keys: Dict[int, Dict[int, list]] = {1: {}, 2: {}}
+        self._open_segments()
+
+    # Writing
+
+    def append(self, play: Dict[str, Any], payout: float = 0.0):
+        """
+        Queue a play for the ledger without blocking on disk.
+
+        Args:
+            play: Result dict from a play_* function
+            payout: Payout per unit bet
+        """
+        if self._closed or self.read_only:
+            raise RuntimeError("Audit ledger is closed" if self._closed else "Audit ledger is read-only")
+        self._ensure_writer()
+        self._queue.put((play, payout))
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is written and fsynced."""
+        if self._thread is None or not self._thread.is_alive():
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        """Flush, stop the writer and release files."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+        with self._lock:
+            if self._active_file is not None:
+                if not self._active_entries:
+                    # Don't leave an empty segment behind for every restart
+                    os.remove(self._active.path)
+                    self._active = None
+                self._active_file.close()
+                self._active_file = None
+            for segment in self._sealed + [self._active]:
+                if segment is not None:
+                    segment.close()
+
+    def _ensure_writer(self):
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._write_loop, name="audit-ledger", daemon=True)
+                    self._thread.start()
+
+    def _write_loop(self):
+        last_sync = time.monotonic()
+        dirty = False
+
+        while True:
+            timeout = max(0.0, self.fsync_interval_s - (time.monotonic() - last_sync)) if dirty else None
+            try:
+                items = [self._queue.get(timeout=timeout)]
+            except queue.Empty:
+                items = []
+            # Drain whatever else is waiting into the same batch
+            while True:
+                try:
+                    items.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            waiters, stop = [], False
+            plays = []
+            for item in items:
+                if item is None:
+                    stop = True
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                else:
+                    plays.append(item)
+
+            try:
+                if plays:
+                    with timed("audit_write"):
+                        self._write(plays)
+                    dirty = True
+                if dirty and (waiters or stop or time.monotonic() - last_sync >= self.fsync_interval_s):
+                    with self._lock:
+                        os.fsync(self._active_file.fileno())
+                    last_sync, dirty = time.monotonic(), False
+            except Exception as e:
+                # Keep the writer alive; the error is surfaced for health checks
+                self.last_error = str(e)
+
+            for waiter in waiters:
+                waiter.set()
+            if stop:
+                return
+
+    def _write(self, plays: List[Tuple[Dict[str, Any], float]]):
+        # Encode the whole batch first, so one bad play can't take its neighbours with it
+        encoded = []
+        for play, payout in plays:
+            try:
+                audit = play["audit"]
+                encoded.append((encode_record(play, payout), (
+                    to_epoch_us(audit["timestamp"]), index_key(str(audit["job_id"])), index_key(audit["circuit_hash"])
+                )))
+            except (KeyError, TypeError, ValueError, struct.error) as e:
+                self.last_error = f"Skipped unrecordable play: {e}"
+                logger.warning("Skipping play the audit ledger can't record: %s", e)
+
+        with self._lock:
+            chunk, keys = [], []
+            offset = self._active_file.tell()
+            for record, key in encoded:
+                chunk.append(record)
+                keys.append(key + (offset,))
+                offset += len(record)
+
+                if offset >= self.segment_bytes:
+                    self._write_chunk(chunk, keys)
+                    self._seal_active()
+                    self._start_segment()
+                    chunk, keys, offset = [], [], self._active_file.tell()
+
+            self._write_chunk(chunk, keys)
+            self._active_file.flush()
+
+    def _write_chunk(self, chunk: List[bytes], entries: List[Tuple[int, int, int, int]]):
+        # Index entries only once their bytes are in the segment
+        self._active_file.write(b"".join(chunk))
+        for entry in entries:
+            self._track(entry)
+
+    # Segment management
+
+    def _segment_path(self, number: int) -> str:
+        return os.path.join(self.directory, f"segment-{number:06d}.log")
+
+    def _segment_files(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(n for n in os.listdir(self.directory) if n.startswith("segment-") and n.endswith(".log"))
+
+    def _open_segments(self):
+        segments = [_Segment(os.path.join(self.directory, n)) for n in self._segment_files()]
+
+        if self.read_only:
+            for segment in segments:
+                if not segment.has_index():
+                    segment.build_index(_scan(segment.data())[0], persist=False)
+                self._sealed.append(segment)
+            return
+
+        with self._writers_lock():
+            for segment in segments:
+                if not segment.has_index():
+                    self._index_unsealed(segment)
+                self._sealed.append(segment)
+        self._start_segment()
+
+    def _index_unsealed(self, segment: _Segment):
+        """Seal a segment whose writer has stopped, or index a live writer's segment in memory."""
+        with open(segment.path, "r+b") as f:
+            if not _try_lock(f):
+                segment.build_index(_scan(segment.data())[0], persist=False)
+                return
+
+            # Orphaned: drop a torn tail from a crash and seal it
+            data = f.read()
+            entries, end = _scan(data) if data.startswith(SEGMENT_MAGIC) else ([], 0)
+            if end == 0:
+                f.seek(0)
+                f.write(SEGMENT_MAGIC)
+                end = len(SEGMENT_MAGIC)
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+            segment.build_index(entries)
+
+    def _start_segment(self):
+        """Claim the next free segment number and lock it as this writer's active segment."""
+        with self._writers_lock():
+            names = self._segment_files()
+            number = int(names[-1].split("-")[1].split(".")[0]) + 1 if names else 1
+            path = self._segment_path(number)
+            self._active_file = os.fdopen(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY | os.O_APPEND), "ab")
+            if fcntl is not None:
+                fcntl.flock(self._active_file, fcntl.LOCK_EX)
+            self._active_file.write(SEGMENT_MAGIC)
+            self._active_file.flush()
+        self._active = _Segment(path)
+        self._reset_active_index()
+
+    def _seal_active(self):
+        self._active_file.flush()
+        os.fsync(self._active_file.fileno())
+        # Index before closing releases the lock, so no other writer takes it for orphaned
+        self._active.build_index(self._active_entries)
+        self._active_file.close()
+        self._sealed.append(self._active)
+        self._active, self._active_file = None, None
+        self._reset_active_index()
+
+    @contextmanager
+    def _writers_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, WRITERS_LOCK), "a") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _track(self, entry: Tuple[int, int, int, int]):
+        self._active_entries.append(entry)
+        for column in (1, 2):
+            self._active_keys[column].setdefault(entry[column], []).append(entry)
+
+    def _reset_active_index(self):
+        self._active_entries = []
+        self._active_keys = {1: {}, 2: {}}
+
+    # Queries
+
+    def _active_records(self, entries: List[Tuple[int, int, int, int]]) -> Iterator[Dict[str, Any]]:
+        """Read records of the active segment with positional reads (it isn't mapped yet)."""
+        if not entries:
+            return
+        with self._lock:
+            path = self._active.path
+        with open(path, "rb") as f:
+            for entry in entries:
+                header = os.pread(f.fileno(), _HEADER.size, entry[3])
+                yield decode_record(header + os.pread(f.fileno(), record_length(header, 0) - _HEADER.size,
+                                                      entry[3] + _HEADER.size))
+
+    def _active_entries_where(self, predicate) -> List[Tuple[int, int, int, int]]:
+        with self._lock:
+            return [entry for entry in self._active_entries if predicate(entry)]
+
+    def _key_lookup(self, kind: str, column: int, key: int) -> Iterator[Dict[str, Any]]:
+        for segment in list(self._sealed):
+            index = segment.index(kind)
+            lo, hi = np.searchsorted(index["key"], key, "left"), np.searchsorted(index["key"], key, "right")
+            for offset in index["offset"][lo:hi]:
+                yield decode_record(segment.data(), int(offset))
+
+        with self._lock:
+            entries = list(self._active_keys[column].get(key, ()))
+        yield from self._active_records(entries)
+
+    def find_by_job_id(self, job_id: str) -> List[Dict[str, Any]]:
+        """All plays recorded for a sampler job (batched plays share one job)."""
+        return [r for r in self._key_lookup("job", 1, index_key(job_id)) if r["audit"]["job_id"] == job_id]
+
+    def find_by_circuit_hash(self, circuit_hash: str) -> List[Dict[str, Any]]:
+        """All plays whose circuit has the given audit hash."""
+        return [r for r in self._key_lookup("hash", 2, index_key(circuit_hash))
+                if r["audit"]["circuit_hash"] == circuit_hash]
+
+    def find_by_time(self, start: Timestamp = None, end: Timestamp = None) -> Iterator[Dict[str, Any]]:
+        """
+        Stream plays with start <= timestamp < end, in time order per segment.
+
+        Args:
+            start: Range start (ISO string, datetime or epoch seconds; None = beginning)
+            end: Range end, exclusive (None = now)
+
+        Yields:
+            dict: Decoded play records
+        """
+        lo_us = to_epoch_us(start) if start is not None else np.iinfo(np.int64).min
+        hi_us = to_epoch_us(end) if end is not None else np.iinfo(np.int64).max
+
+        for segment in list(self._sealed):
+            index = segment.index("time")
+            if not len(index) or index["ts"][0] >= hi_us or index["ts"][-1] < lo_us:
+                continue
+            lo, hi = np.searchsorted(index["ts"], lo_us, "left"), np.searchsorted(index["ts"], hi_us, "left")
+            for offset in index["offset"][lo:hi]:
+                yield decode_record(segment.data(), int(offset))
+
+        entries = self._active_entries_where(lambda entry: lo_us <= entry[0] < hi_us)
+        yield from self._active_records(sorted(entries))
+
+    def export(self, out, start: Timestamp = None, end: Timestamp = None) -> int:
+        """
+        Stream plays in a time range to ``out`` as JSON lines.
+
+        Args:
+            out: Writable text stream
+            start: Range start (None = beginning)
+            end: Range end, exclusive (None = now)
+
+        Returns:
+            int: Number of records written
+        """
+        written = 0
+        for record in self.find_by_time(start, end):
+            out.write(json.dumps(record) + "\n")
+            written += 1
+        return written
+
+    def iter_chunks(self, start: Tuple[int, int] = (0, 0),
+                    max_records: int = 10000) -> Iterator[Tuple[int, int, int, bytes]]:
+        """
+        Stream raw records in ledger order, in chunks of whole records.
+
+        Used for bulk processing: chunks are cheap to hand to worker
+        processes, and (segment, end offset) is a resumable position.
+
+        Args:
+            start: (segment number, byte offset) to resume from; (0, 0) = beginning
+            max_records: Maximum records per chunk
+
+        Yields:
+            tuple: (segment number, start offset, end offset, record bytes)
+        """
+        with self._lock:
+            segments = list(self._sealed)
+            if self._active is not None:
+                self._active_file.flush()
+                segments.append(self._active)
+
+        for segment in segments:
+            if segment.number < start[0]:
+                continue
+            with open(segment.path, "rb") as f:
+                data = f.read()
+            offset = max(start[1], len(SEGMENT_MAGIC)) if segment.number == start[0] else len(SEGMENT_MAGIC)
+
+            while offset < len(data):
+                chunk_start, n = offset, 0
+                while n < max_records and offset + _HEADER.size <= len(data):
+                    length = record_length(data, offset)
+                    if offset + length > len(data):
+                        break
+                    offset += length
+                    n += 1
+                if n == 0:
+                    # Torn tail of an unsealed segment
+                    break
+                yield segment.number, chunk_start, offset, data[chunk_start:offset]
+
+    def segments(self) -> List[str]:
+        """Paths of all segment files, oldest first."""
+        paths = [segment.path for segment in self._sealed]
+        if self._active is not None:
+            paths.append(self._active.path)
+        return paths
+
+
+# Global ledger instance
+_ledger: Optional[AuditLedger] = None
+_ledger_lock = threading.Lock()
+
+
+def get_audit_ledger() -> Optional[AuditLedger]:
+    """
+    Return the process-wide audit ledger, or None if auditing is disabled.
+
+    Enabled by setting AUDIT_LEDGER_DIR. AUDIT_SEGMENT_MB (default 64) sets
+    the segment size and AUDIT_FSYNC_INTERVAL_MS (default 200) the maximum
+    delay between fsyncs.
+
+    Returns:
+        AuditLedger: The shared ledger, or None
+    """
+    global _ledger
+
+    settings = get_settings()
+    directory = settings.audit_ledger_dir
+    if not directory:
+        return None
+
+    with _ledger_lock:
+        if _ledger is None:
+            _ledger = AuditLedger(
+                directory,
+                segment_bytes=int(settings.audit_segment_mb * 1024 * 1024),
+                fsync_interval_s=settings.audit_fsync_interval_ms / 1000.0,
+            )
+            atexit.register(_ledger.close)
+
+    return _ledger
@@ -0,0 +1,385 @@
+"""Async load generator for the API: closed- or open-loop plays with HDR-style latency histograms."""
+
+import asyncio
+import math
+import random
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, TextIO, Tuple
+
+if TYPE_CHECKING:
+    import httpx
+
+# Endpoint of each game a request mix can include
+ENDPOINTS = {
+    "filter": "/play/filter",
+    "entangled_wager": "/play/entangled-wager",
+}
+
+# Bets drawn for each request (matches the API's qcount/qa/qb bounds)
+MAX_QCOUNT = 20
+
+
+class LatencyHistogram:
+    """
+    Log-linear latency histogram in the HdrHistogram layout.
+
+    Values (integer microseconds) are counted in buckets whose width grows
+    with magnitude, so every recorded value is kept to ``significant_digits``
+    decimal digits of precision over any range in fixed memory, and
+    percentiles are read off the bucket counts.
+
+    Args:
+        significant_digits: Decimal digits of precision kept (1-5)
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        if not 1 <= significant_digits <= 5:
+            raise ValueError("significant_digits must be between 1 and 5")
+        self.significant_digits = significant_digits
+        # Values below sub_count are exact; above, each power of two is split into half that many buckets
+        self._sub_bits = math.ceil(math.log2(2 * 10 ** significant_digits))
+        self._sub_count = 1 << self._sub_bits
+        self._half = self._sub_count >> 1
+        self._counts: List[int] = []
+        self.count = 0
+        self.max = 0
+        self._sum = 0
+        self._sum_squares = 0
+
+    def record(self, value_us: int, count: int = 1):
+        """Count a value (microseconds; negative values are recorded as 0)."""
+        value_us = max(0, int(value_us))
+        index = self._index(value_us)
+        if index >= len(self._counts):
+            self._counts.extend([0] * (index + 1 - len(self._counts)))
+        self._counts[index] += count
+        self.count += count
+        self.max = max(self.max, value_us)
+        self._sum += value_us * count
+        self._sum_squares += value_us * value_us * count
+
+    def merge(self, other: "LatencyHistogram"):
+        """Add another histogram's counts (same precision) into this one."""
+        if other.significant_digits != self.significant_digits:
+            raise ValueError("Histograms must have the same precision to merge")
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for index, n in enumerate(other._counts):
+            self._counts[index] += n
+        self.count += other.count
+        self.max = max(self.max, other.max)
+        self._sum += other._sum
+        self._sum_squares += other._sum_squares
+
+    @property
+    def mean(self) -> float:
+        return self._sum / self.count if self.count else 0.0
+
+    @property
+    def stddev(self) -> float:
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(0.0, self._sum_squares / self.count - self.mean ** 2))
+
+    def percentile(self, percentile: float) -> int:
+        """
+        Value at a percentile (0-100), as the highest value equivalent to its bucket.
+
+        Returns:
+            int: Microseconds (0 for an empty histogram)
+        """
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * percentile / 100.0))
+        seen = 0
+        for index, n in enumerate(self._counts):
+            seen += n
+            if seen >= target:
+                return min(self._highest(index), self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[int, int]]:
+        """Non-empty buckets as (highest equivalent value in microseconds, count)."""
+        return [(self._highest(index), n) for index, n in enumerate(self._counts) if n]
+
+    def write_percentiles(self, out: TextIO, scale: float = 1000.0, ticks_per_half_distance: int = 5):
+        """
+        Write the percentile distribution in HdrHistogram's ``.hgrm`` text format.
+
+        The output loads in HdrHistogram's plotter and other .hgrm tools.
+
+        Args:
+            out: Writable text stream
+            scale: Divisor applied to microsecond values (1000 writes milliseconds)
+            ticks_per_half_distance: Rows per halving of the distance to 100%
+        """
+        out.write(f"{'Value':>12} {'Percentile':>14} {'TotalCount':>10} {'1/(1-Percentile)':>14}\n\n")
+
+        percentile = 0.0
+        while self.count:
+            value = self.percentile(percentile)
+            total = sum(n for index, n in enumerate(self._counts) if self._lowest(index) <= value)
+            if percentile >= 100.0 or total >= self.count:
+                out.write(f"{self.max / scale:>12.3f} {1.0:>14.12f} {self.count:>10d}\n")
+                break
+            inverse = 1.0 / (1.0 - percentile / 100.0)
+            out.write(f"{value / scale:>12.3f} {percentile / 100.0:>14.12f} {total:>10d} {inverse:>14.2f}\n")
+            # HdrHistogram's tick spacing: halve the step each time the distance to 100% halves
+            half_distance = 2 ** (math.floor(math.log2(100.0 / (100.0 - percentile))) + 1)
+            percentile += 100.0 / (half_distance * ticks_per_half_distance)
+
+        out.write(f"#[Mean    = {self.mean / scale:>12.3f}, StdDeviation   = {self.stddev / scale:>12.3f}]\n")
+        out.write(f"#[Max     = {self.max / scale:>12.3f}, Total count    = {self.count:>12d}]\n")
+        out.write(f"#[Buckets = {len(self._counts):>12d}, SubBuckets     = {self._sub_count:>12d}]\n")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Summary plus raw buckets, for JSON export."""
+        return {
+            "unit": "us",
+            "significant_digits": self.significant_digits,
+            "count": self.count,
+            "mean": self.mean,
+            "max": self.max,
+            "buckets": self.buckets()
+        }
+
+    def _index(self, value: int) -> int:
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self._sub_bits
+        return (shift + 1) * self._half + (value >> shift) - self._half
+
+    def _lowest(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift = (index - self._sub_count) // self._half + 1
+        return ((index - self._sub_count) % self._half + self._half) << shift
+
+    def _highest(self, index: int) -> int:
+        if index < self._sub_count:
+            return index
+        shift = (index - self._sub_count) // self._half + 1
+        return self._lowest(index) + (1 << shift) - 1
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    """
+    Parse a request mix such as "filter=3,entangled_wager=1" into normalized weights.
+
+    Raises:
+        ValueError: If a game is unknown or the weights don't add up to something positive
+    """
+    weights = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        if name not in ENDPOINTS:
+            raise ValueError(f"Unknown game '{name}' in mix. Available: {', '.join(ENDPOINTS)}")
+        weights[name] = float(weight) if weight else 1.0
+        if weights[name] < 0:
+            raise ValueError(f"Negative weight for '{name}' in mix")
+
+    total = sum(weights.values())
+    if total <= 0:
+        raise ValueError("Request mix weights must add up to more than 0")
+    return {name: weight / total for name, weight in weights.items()}
+
+
+class LoadReport:
+    """
+    Results of a load test: latencies of successful plays and counts of failures.
+
+    Latency runs from when a request was due to be sent (its scheduled
+    arrival in an open loop), so time spent queued behind the concurrency
+    limit is included rather than hidden (no coordinated omission).
+
+    ``elapsed_s`` is the measured send window, so throughput is plays sent in
+    the window over its length; ``drain_s`` is how long the last of them
+    took to return after it closed.
+    """
+
+    def __init__(self, significant_digits: int = 3):
+        self.significant_digits = significant_digits
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, Dict[str, int]] = {}
+        self.sent: Dict[str, int] = {}
+        self.elapsed_s = 0.0
+        self.drain_s = 0.0
+
+    def record(self, game: str, latency_s: float, error: Optional[str] = None):
+        self.sent[game] = self.sent.get(game, 0) + 1
+        if error is not None:
+            errors = self.errors.setdefault(game, {})
+            errors[error] = errors.get(error, 0) + 1
+            return
+        if game not in self.histograms:
+            self.histograms[game] = LatencyHistogram(self.significant_digits)
+        self.histograms[game].record(round(latency_s * 1e6))
+
+    def total(self) -> LatencyHistogram:
+        """Latencies of every game's successful plays."""
+        merged = LatencyHistogram(self.significant_digits)
+        for histogram in self.histograms.values():
+            merged.merge(histogram)
+        return merged
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput, latency percentiles (ms) and error rates, overall and per game."""
+        def stats(sent: int, histogram: LatencyHistogram, errors: Dict[str, int]) -> Dict[str, Any]:
+            failed = sum(errors.values())
+            return {
+                "requests": sent,
+                "ok": histogram.count,
+                "errors": dict(sorted(errors.items())),
+                "error_rate": failed / sent if sent else 0.0,
+                "throughput_rps": histogram.count / self.elapsed_s if self.elapsed_s else 0.0,
+                "latency_ms": {
+                    "p50": histogram.percentile(50) / 1000,
+                    "p95": histogram.percentile(95) / 1000,
+                    "p99": histogram.percentile(99) / 1000,
+                    "max": histogram.max / 1000,
+                    "mean": histogram.mean / 1000
+                }
+            }
+
+        all_errors: Dict[str, int] = {}
+        for errors in self.errors.values():
+            for kind, n in errors.items():
+                all_errors[kind] = all_errors.get(kind, 0) + n
+
+        return {
+            "elapsed_s": self.elapsed_s,
+            "drain_s": self.drain_s,
+            **stats(sum(self.sent.values()), self.total(), all_errors),
+            "games": {
+                game: stats(sent, self.histograms.get(game, LatencyHistogram(self.significant_digits)),
+                            self.errors.get(game, {}))
+                for game, sent in sorted(self.sent.items())
+            }
+        }
+
+
+def format_report(summary: Dict[str, Any]) -> str:
+    """Render a load test summary as a plain-text table."""
+    header = (f"{'game':<16} {'requests':>9} {'ok':>8} {'err %':>7} {'req/s':>9} "
+              f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+    lines = [f"elapsed {summary['elapsed_s']:.1f}s (+{summary['drain_s']:.1f}s drain)", header, "-" * len(header)]
+
+    rows = list(summary["games"].items()) + [("total", summary)]
+    for game, stats in rows:
+        latency = stats["latency_ms"]
+        lines.append(f"{game:<16} {stats['requests']:>9} {stats['ok']:>8} {stats['error_rate'] * 100:>7.2f} "
+                     f"{stats['throughput_rps']:>9.1f} {latency['p50']:>9.2f} {latency['p95']:>9.2f} "
+                     f"{latency['p99']:>9.2f} {latency['max']:>9.2f}")
+
+    if summary["errors"]:
+        lines.append("errors: " + ", ".join(f"{kind}={n}" for kind, n in summary["errors"].items()))
+    return "\n".join(lines)
+
+
+async def run_loadtest(url: str, duration_s: float = 10.0, concurrency: int = 16, rate: Optional[float] = None,
+                       mix: Optional[Dict[str, float]] = None, shots: Optional[int] = None, warmup_s: float = 0.0,
+                       api_keys: Optional[Sequence[str]] = None, timeout_s: float = 30.0, arrivals: str = "poisson",
+                       seed: Optional[int] = None, transport: Optional["httpx.AsyncBaseTransport"] = None,
+                       significant_digits: int = 3) -> LoadReport:
+    """
+    Drive play endpoints for ``duration_s`` and measure every response.
+
+    Without ``rate`` the loop is closed: ``concurrency`` virtual users each
+    send their next play as soon as the last one returns, which finds the
+    maximum throughput. With ``rate`` the loop is open: plays arrive at
+    ``rate`` per second whether or not earlier ones have returned (at most
+    ``concurrency`` in flight; the rest wait and the wait counts as latency),
+    which shows the latency a given load would see.
+
+    Args:
+        url: Server base URL, e.g. "http://localhost:8000"
+        duration_s: Seconds of measured load
+        concurrency: Virtual users (closed loop) or in-flight limit (open loop)
+        rate: Arrivals per second for an open loop (closed loop if not specified)
+        mix: Weight per game (see ``parse_mix``); filter only if not specified
+        shots: Shots per play (server default if not specified)
+        warmup_s: Seconds of load sent first and left out of the report
+        api_keys: Keys from the server's ADMISSION_API_KEYS to spread plays over, sent as
+                  ``Authorization: Bearer`` (admission buckets are per key; per peer without keys)
+        timeout_s: Per-request timeout
+        arrivals: "poisson" (exponential gaps) or "uniform" (fixed gaps) for an open loop
+        seed: Seed for the mix, bets and arrival gaps
+        transport: httpx transport, e.g. ``httpx.ASGITransport(app)`` to test in-process
+        significant_digits: Histogram precision
+
+    Returns:
+        LoadReport: Latency histograms and error counts of the measured window
+    """
+    import httpx
+
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    if rate is not None and rate <= 0:
+        raise ValueError("rate must be positive")
+    if arrivals not in ("poisson", "uniform"):
+        raise ValueError("arrivals must be 'poisson' or 'uniform'")
+
+    mix = mix or {"filter": 1.0}
+    games, weights = list(mix), list(mix.values())
+    rng = random.Random(seed)
+    report = LoadReport(significant_digits)
+
+    def next_play() -> Tuple[str, Dict[str, Any], Dict[str, str]]:
+        game = rng.choices(games, weights)[0]
+        if game == "filter":
+            body = {"qcount": rng.randint(1, MAX_QCOUNT)}
+        else:
+            body = {"qa": rng.randint(1, MAX_QCOUNT), "qb": rng.randint(1, MAX_QCOUNT)}
+        if shots is not None:
+            body["shots"] = shots
+        return game, body, ({"Authorization": f"Bearer {rng.choice(api_keys)}"} if api_keys else {})
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, transport=transport, timeout=timeout_s, limits=limits) as client:
+        started = time.perf_counter()
+        measure_from = started + warmup_s
+        end = measure_from + duration_s
+
+        async def send(game: str, body: Dict[str, Any], headers: Dict[str, str], due: float):
+            error = None
+            try:
+                response = await client.post(ENDPOINTS[game], json=body, headers=headers)
+                if response.status_code != 200:
+                    error = str(response.status_code)
+            except httpx.TimeoutException:
+                error = "timeout"
+            except httpx.TransportError:
+                error = "connection"
+            if due >= measure_from:
+                report.record(game, time.perf_counter() - due, error)
+
+        if rate is None:
+            async def user():
+                while time.perf_counter() < end:
+                    await send(*next_play(), time.perf_counter())
+
+            await asyncio.gather(*(user() for _ in range(concurrency)))
+        else:
+            in_flight = asyncio.Semaphore(concurrency)
+            pending = set()
+
+            async def arrival(play, due):
+                async with in_flight:
+                    await send(*play, due)
+
+            due = started
+            while due < end:
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                task = asyncio.ensure_future(arrival(next_play(), due))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+                due += rng.expovariate(rate) if arrivals == "poisson" else 1.0 / rate
+            if pending:
+                await asyncio.gather(*pending)
+
+        report.elapsed_s = end - measure_from
+        report.drain_s = max(0.0, time.perf_counter() - end)
+
+    return report
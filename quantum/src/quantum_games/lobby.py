@@ -0,0 +1,350 @@
+"""Matchmaking lobby that pairs Entangled Wager players and settles each tick as one job."""
+
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .games import play_batch_async
+from .metrics import LOBBY_PLAYERS, observe_stage
+from .settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Bets accepted by the lobby (matches the Entangled Wager API bounds)
+MIN_QCOUNT = 1
+MAX_QCOUNT = 20
+
+
+def validate_qcount(qcount: Any) -> int:
+    """
+    Check a lobby bet.
+
+    Raises:
+        ValueError: If the bet isn't an integer between MIN_QCOUNT and MAX_QCOUNT
+    """
+    if not isinstance(qcount, int) or isinstance(qcount, bool) or not MIN_QCOUNT <= qcount <= MAX_QCOUNT:
+        raise ValueError(f"qcount must be an integer between {MIN_QCOUNT} and {MAX_QCOUNT}")
+    return qcount
+
+
+class LobbyFull(Exception):
+    """Raised when the lobby already holds its maximum number of waiting players."""
+
+
+class LobbyPlayer:
+    """
+    A player waiting in (or settled by) the lobby.
+
+    Args:
+        qcount: Quantum chips the player bets
+        bracket: Stake bracket the player queues in
+    """
+
+    __slots__ = ("id", "qcount", "bracket", "joined_at", "_result")
+
+    def __init__(self, qcount: int, bracket: int):
+        self.id = uuid.uuid4().hex
+        self.qcount = qcount
+        self.bracket = bracket
+        self.joined_at = time.monotonic()
+        self._result: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    @property
+    def done(self) -> bool:
+        return self._result.done()
+
+    async def wait(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Wait for this player's match result (or timeout notice).
+
+        Args:
+            timeout: Seconds to wait (None waits until the lobby settles the player)
+
+        Returns:
+            dict: Event with "event" set to "result" or "timeout"
+
+        Raises:
+            asyncio.TimeoutError: If ``timeout`` passes first
+            Exception: The error the match's sampler job failed with
+        """
+        return await asyncio.wait_for(asyncio.shield(self._result), timeout)
+
+    def _settle(self, event: Dict[str, Any]):
+        if not self._result.done():
+            self._result.set_result(event)
+
+    def _fail(self, error: BaseException):
+        if not self._result.done():
+            self._result.set_exception(error)
+            # Don't log "exception never retrieved" if the player already left
+            self._result.exception()
+
+
+Pair = Tuple[LobbyPlayer, LobbyPlayer]
+
+
+class Lobby:
+    """
+    Pair Entangled Wager players as they arrive and settle matches in batches.
+
+    Players queue per stake bracket (``bracket_width`` qcounts wide). Every
+    ``tick_s`` seconds each bracket is paired off in qcount order, so stakes
+    are as close as possible; in an odd-sized bracket the newest arrival
+    waits for the next tick. All pairs from a tick are played in a single
+    ``play_batch`` job (one sweep row per pair) and each player's future
+    receives the result from their side.
+
+    Players still unpaired after ``timeout_s`` are dropped with a timeout
+    event, and at most ``max_waiting`` players queue at once, so memory stays
+    bounded however many connect. Settled players are not kept.
+
+    Must be used from inside one running event loop.
+
+    Args:
+        tick_s: Seconds between matchmaking ticks
+        timeout_s: Longest a player may wait for an opponent
+        max_waiting: Maximum number of queued players
+        bracket_width: Number of qcounts per stake bracket
+        shots: Shots per match (uses DEFAULT_SHOTS if not specified)
+        runner: Async ``play_batch``-like callable (plays, shots) -> results
+    """
+
+    def __init__(self, tick_s: float = 0.05, timeout_s: float = 60.0, max_waiting: int = 10000,
+                 bracket_width: int = 5, shots: Optional[int] = None,
+                 runner: Optional[Callable[..., Awaitable[List[Dict[str, Any]]]]] = None):
+        if bracket_width < 1:
+            raise ValueError(f"bracket_width must be at least 1 (got {bracket_width})")
+
+        self.tick_s = tick_s
+        self.timeout_s = timeout_s
+        self.max_waiting = max_waiting
+        self.bracket_width = bracket_width
+        self.shots = shots
+        self._runner = runner or play_batch_async
+        # bracket -> player id -> player, in arrival order
+        self._brackets: Dict[int, "OrderedDict[str, LobbyPlayer]"] = {}
+        self._waiting = 0
+        self._task: Optional[asyncio.Task] = None
+        self._settling = set()
+        self.matches = 0
+        self.jobs = 0
+
+    def bracket(self, qcount: int) -> int:
+        """Stake bracket of a bet."""
+        return (qcount - MIN_QCOUNT) // self.bracket_width
+
+    def join(self, qcount: int) -> LobbyPlayer:
+        """
+        Queue a player and make sure matchmaking is running.
+
+        Args:
+            qcount: Quantum chips the player bets (1-20)
+
+        Returns:
+            LobbyPlayer: The queued player; ``await player.wait()`` for the result
+
+        Raises:
+            ValueError: If the bet is out of range
+            LobbyFull: If ``max_waiting`` players are already queued
+        """
+        validate_qcount(qcount)
+        if self._waiting >= self.max_waiting:
+            LOBBY_PLAYERS.inc(result="rejected")
+            raise LobbyFull(f"Lobby is full ({self._waiting} players waiting)")
+
+        player = LobbyPlayer(qcount, self.bracket(qcount))
+        self._brackets.setdefault(player.bracket, OrderedDict())[player.id] = player
+        self._waiting += 1
+        self.start()
+        return player
+
+    def leave(self, player_id: str) -> bool:
+        """
+        Take a player out of the queue (e.g. their connection closed).
+
+        Returns:
+            bool: True if the player was still waiting
+        """
+        for queue in self._brackets.values():
+            player = queue.pop(player_id, None)
+            if player is not None:
+                self._waiting -= 1
+                player._settle({"event": "left", "player_id": player_id})
+                LOBBY_PLAYERS.inc(result="left")
+                return True
+        return False
+
+    @property
+    def waiting(self) -> int:
+        """Number of queued players."""
+        return self._waiting
+
+    def match(self) -> List[Pair]:
+        """
+        Expire idle players and pair off every bracket.
+
+        Returns:
+            list: (player_a, player_b) pairs, removed from the queue
+        """
+        self._expire()
+
+        pairs = []
+        for queue in self._brackets.values():
+            if len(queue) < 2:
+                continue
+            players = list(queue.values())
+            if len(players) % 2:
+                # The newest arrival sits out until the next tick
+                players.pop()
+            players.sort(key=lambda p: (p.qcount, p.joined_at))
+            for a, b in zip(players[::2], players[1::2]):
+                del queue[a.id], queue[b.id]
+                pairs.append((a, b))
+
+        self._waiting -= 2 * len(pairs)
+        return pairs
+
+    async def settle(self, pairs: Sequence[Pair]):
+        """
+        Play matched pairs in one sampler job and deliver each side's result.
+
+        Args:
+            pairs: Pairs from ``match``
+        """
+        if not pairs:
+            return
+
+        now = time.monotonic()
+        for a, b in pairs:
+            observe_stage("lobby_wait", now - a.joined_at, game="entangled_wager")
+            observe_stage("lobby_wait", now - b.joined_at, game="entangled_wager")
+
+        plays = [{"game": "entangled_wager", "qa": a.qcount, "qb": b.qcount, "id": uuid.uuid4().hex}
+                 for a, b in pairs]
+        self.jobs += 1
+        try:
+            results = await self._runner(plays, self.shots)
+        except Exception as e:
+            logger.warning("Lobby job for %d matches failed: %s", len(pairs), e)
+            for a, b in pairs:
+                a._fail(e)
+                b._fail(e)
+            return
+
+        self.matches += len(pairs)
+        LOBBY_PLAYERS.inc(2 * len(pairs), result="matched")
+        for (a, b), play, result in zip(pairs, plays, results):
+            a._settle(_side_event(result, play["id"], a, b, "player_a"))
+            b._settle(_side_event(result, play["id"], b, a, "player_b"))
+
+    def start(self):
+        """Start the matchmaking loop in the running event loop (idempotent)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop matchmaking and wait for in-flight matches to settle."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._settling:
+            await asyncio.gather(*self._settling, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Queue sizes and totals, for GET /lobby."""
+        return {
+            "waiting": self._waiting,
+            "brackets": {
+                f"{MIN_QCOUNT + b * self.bracket_width}-{min(MAX_QCOUNT, MIN_QCOUNT + (b + 1) * self.bracket_width - 1)}":
+                    len(queue)
+                for b, queue in sorted(self._brackets.items()) if queue
+            },
+            "matches": self.matches,
+            "jobs": self.jobs,
+            "settling": len(self._settling)
+        }
+
+    async def _run(self):
+        while True:
+            await asyncio.sleep(self.tick_s)
+            pairs = self.match()
+            if pairs:
+                # Settle in the background so a slow job doesn't hold up the next tick
+                task = asyncio.ensure_future(self.settle(pairs))
+                self._settling.add(task)
+                task.add_done_callback(self._settling.discard)
+
+    def _expire(self):
+        # Queues are in arrival order, so idle players cluster at the front
+        cutoff = time.monotonic() - self.timeout_s
+        for queue in self._brackets.values():
+            while queue:
+                player = next(iter(queue.values()))
+                if player.joined_at >= cutoff:
+                    break
+                del queue[player.id]
+                self._waiting -= 1
+                LOBBY_PLAYERS.inc(result="timeout")
+                player._settle({"event": "timeout", "player_id": player.id,
+                                "waited_s": time.monotonic() - player.joined_at})
+
+
+def _side_event(result: Dict[str, Any], match_id: str, player: LobbyPlayer, opponent: LobbyPlayer,
+                side: str) -> Dict[str, Any]:
+    """One player's view of a settled match."""
+    return {
+        "event": "result",
+        "player_id": player.id,
+        "match_id": match_id,
+        "side": side,
+        "opponent": {"player_id": opponent.id, "qcount": opponent.qcount},
+        "won": result["winner"] == side,
+        "tie": result["winner"] == "tie",
+        "result": result
+    }
+
+
+# Global lobby instance
+_lobby: Optional[Lobby] = None
+
+
+def get_lobby() -> Lobby:
+    """
+    Return the process-wide lobby, configured from settings.
+
+    Uses LOBBY_TICK_MS (default 50), LOBBY_TIMEOUT_SECONDS (default 60),
+    LOBBY_MAX_WAITING (default 10000), LOBBY_BRACKET_WIDTH (default 5) and
+    LOBBY_SHOTS (default DEFAULT_SHOTS).
+
+    Returns:
+        Lobby: The shared lobby
+    """
+    global _lobby
+
+    if _lobby is None:
+        settings = get_settings()
+        _lobby = Lobby(
+            tick_s=settings.lobby_tick_ms / 1000.0,
+            timeout_s=settings.lobby_timeout_seconds,
+            max_waiting=settings.lobby_max_waiting,
+            bracket_width=settings.lobby_bracket_width,
+            shots=settings.lobby_shots,
+        )
+
+    return _lobby
+
+
+async def close_lobby():
+    """Stop the shared lobby (if started) so the next get_lobby() starts fresh."""
+    global _lobby
+
+    if _lobby is not None:
+        await _lobby.stop()
+        _lobby = None
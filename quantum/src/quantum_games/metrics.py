@@ -0,0 +1,290 @@
+"""Lightweight stage timing, counters and Prometheus text exposition."""
+
+import os
+import sys
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter as _Tally
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .settings import get_settings
+
+# Latency buckets in seconds: 100us .. 5min, wide enough for local engines and QPU queues
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0)
+
+
+def _enabled() -> bool:
+    """Whether stage timing is on; switched off entirely with METRICS_ENABLED=0."""
+    return get_settings().metrics_enabled
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+
+    Args:
+        name: Metric name
+        documentation: HELP text
+        labelnames: Label names, given as keyword arguments to ``inc``
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str):
+        """Increase the counter for a label set."""
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Current value for a label set (0 if never incremented)."""
+        return self._values.get(tuple(str(labels.get(name, "")) for name in self.labelnames), 0.0)
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_labels(self.labelnames, key)} {_number(v)}" for key, v in values]
+
+
+class Gauge(Counter):
+    """
+    Value that can go up and down, with labels.
+
+    Args:
+        name: Metric name
+        documentation: HELP text
+        labelnames: Label names, given as keyword arguments to ``set``
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float, **labels: str):
+        """Set the gauge for a label set."""
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram:
+    """
+    Cumulative histogram with labels and fixed buckets.
+
+    Args:
+        name: Metric name
+        documentation: HELP text
+        labelnames: Label names, given as keyword arguments to ``observe``
+        buckets: Upper bounds in ascending order (+Inf is implied)
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        # label key -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str):
+        """Record one observation for a label set."""
+        key = tuple(str(labels.get(name, "")) for name in self.labelnames)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, **labels: str) -> int:
+        """Number of observations for a label set."""
+        entry = self._values.get(tuple(str(labels.get(name, "")) for name in self.labelnames))
+        return sum(entry[0]) if entry else 0
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = [(key, list(counts), total) for key, (counts, total) in self._values.items()]
+
+        lines = []
+        for key, counts, total in values:
+            cumulative = 0
+            for bound, n in zip(self.buckets + (float("inf"),), counts):
+                cumulative += n
+                le = "+Inf" if bound == float("inf") else _number(bound)
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames + ('le',), key + (le,))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, key)} {_number(total)}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, key)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """Collection of metrics rendered together on /metrics."""
+
+    def __init__(self):
+        self._metrics: List = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text exposition format (0.0.4)."""
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+REGISTRY = Registry()
+
+STAGE_SECONDS = REGISTRY.register(Histogram(
+    "quantum_stage_seconds", "Time spent in each stage of a play",
+    ("stage", "game", "backend")
+))
+SAMPLER_JOBS = REGISTRY.register(Counter(
+    "quantum_sampler_jobs_total", "Sampler jobs submitted", ("backend",)
+))
+SAMPLER_PUBS = REGISTRY.register(Counter(
+    "quantum_sampler_pubs_total", "PUBs (circuits) submitted in sampler jobs", ("backend",)
+))
+SHOTS = REGISTRY.register(Counter(
+    "quantum_shots_total", "Shots requested across all PUBs", ("backend",)
+))
+PLAYS = REGISTRY.register(Counter(
+    "quantum_plays_total", "Completed plays", ("game", "backend", "outcome")
+))
+ERRORS = REGISTRY.register(Counter(
+    "quantum_errors_total", "Exceptions raised per stage", ("stage", "game", "backend")
+))
+ROUTES = REGISTRY.register(Counter(
+    "quantum_route_decisions_total", "Jobs routed per backend (least_busy or fallback)", ("backend", "reason")
+))
+LOBBY_PLAYERS = REGISTRY.register(Counter(
+    "quantum_lobby_players_total", "Players leaving the lobby queue (matched, timeout, left or rejected)", ("result",)
+))
+ADMISSION_DEPTH = REGISTRY.register(Gauge(
+    "quantum_admission_depth", "Admitted requests waiting for or holding a run slot", ("state",)
+))
+ADMISSION_SHED = REGISTRY.register(Counter(
+    "quantum_admission_shed_total", "Requests rejected with 429 by admission control", ("tier", "reason")
+))
+ADMISSION_QPU_SECONDS = REGISTRY.register(Counter(
+    "quantum_admission_qpu_seconds_total", "Estimated QPU seconds admitted (budget burn)", ("tier",)
+))
+ADMISSION_BUDGET = REGISTRY.register(Gauge(
+    "quantum_admission_budget_seconds", "Estimated QPU seconds left in the budget window"
+))
+HTTP_SECONDS = REGISTRY.register(Histogram(
+    "quantum_http_request_seconds", "HTTP request latency", ("method", "route", "status")
+))
+
+
+@contextmanager
+def timed(stage: str, game: str = "", backend: str = "") -> Iterator[None]:
+    """
+    Time a block into ``quantum_stage_seconds`` and count its exceptions.
+
+    Args:
+        stage: Stage name (e.g. "hash", "submit", "wait", "parse")
+        game: Game label, if known
+        backend: Backend label, if known
+    """
+    if not _enabled():
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        ERRORS.inc(stage=stage, game=game, backend=backend)
+        raise
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage, game=game, backend=backend)
+
+
+def observe_stage(stage: str, seconds: float, game: str = "", backend: str = ""):
+    """Record a stage duration measured elsewhere (e.g. reported by the backend)."""
+    if _enabled():
+        STAGE_SECONDS.observe(seconds, stage=stage, game=game, backend=backend)
+
+
+def render_metrics() -> str:
+    """Render all registered metrics in Prometheus text format."""
+    return REGISTRY.render()
+
+
+class SamplingProfiler:
+    """
+    Statistical profiler that samples every thread's stack at a fixed interval.
+
+    Stacks are aggregated in the "folded" format (``a;b;c count`` per line)
+    that flamegraph.pl and speedscope read directly. Sampling runs in its own
+    thread, so only the profiled request pays for it.
+
+    Args:
+        interval_s: Seconds between samples
+    """
+
+    def __init__(self, interval_s: float = 0.005):
+        self.interval_s = interval_s
+        self.stacks: _Tally = _Tally()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def folded(self) -> str:
+        """Collected stacks in folded format, most frequent first."""
+        return "".join(f"{stack} {n}\n" for stack, n in self.stacks.most_common())
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval_s):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own:
+                    continue
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(names))] += 1
@@ -0,0 +1,299 @@
+"""Qubit-parallel multiplexing: pack independent plays onto disjoint qubits of one circuit."""
+
+from collections import deque
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from .engines import LocalEngine
+from .results import Counts
+from .service import get_backend, resolve_backend_name, run_sampler
+from .settings import get_settings
+from .templates import get_template, get_optimization_level, play_n_qubits
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+# (game, template width argument) - identifies one slot in a packed circuit
+Slot = Tuple[str, Optional[int]]
+
+
+def get_max_pack_qubits() -> int:
+    """Get the widest packed circuit allowed, from MULTIPLEX_MAX_QUBITS (default 64)."""
+    return get_settings().multiplex_max_qubits
+
+
+def choose_layout(widths: Sequence[int], coupling_map=None, num_qubits: Optional[int] = None) -> Optional[List[List[int]]]:
+    """
+    Assign each slot a disjoint, connected set of physical qubits.
+
+    Wider slots are placed first. Each slot grows breadth-first from the free
+    qubit with the fewest free neighbours, which keeps the remaining free
+    region in one piece for later slots. Without a coupling map (local
+    engines) qubits are assigned in order.
+
+    Args:
+        widths: Number of qubits needed by each slot
+        coupling_map: Backend coupling map (None for all-to-all)
+        num_qubits: Device size (defaults to the coupling map's size)
+
+    Returns:
+        list: Physical qubits per slot (same order as widths), or None if they don't fit
+    """
+    if coupling_map is None:
+        layout, offset = [], 0
+        for width in widths:
+            layout.append(list(range(offset, offset + width)))
+            offset += width
+        if num_qubits is not None and offset > num_qubits:
+            return None
+        return layout
+
+    adjacency = _adjacency(coupling_map, num_qubits)
+    used: Set[int] = set()
+    layout: List[Optional[List[int]]] = [None] * len(widths)
+
+    for index in sorted(range(len(widths)), key=lambda i: -widths[i]):
+        qubits = _grow_region(widths[index], adjacency, used)
+        if qubits is None:
+            return None
+        used.update(qubits)
+        layout[index] = qubits
+
+    return layout
+
+
+def _adjacency(coupling_map, num_qubits: Optional[int] = None) -> Dict[int, Set[int]]:
+    adjacency: Dict[int, Set[int]] = {q: set() for q in range(num_qubits or coupling_map.size())}
+    for a, b in coupling_map.get_edges():
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    return adjacency
+
+
+def _grow_region(width: int, adjacency: Dict[int, Set[int]], used: Set[int]) -> Optional[List[int]]:
+    free = [q for q in adjacency if q not in used]
+    free.sort(key=lambda q: sum(1 for n in adjacency[q] if n not in used))
+
+    for start in free:
+        region, queue = [start], deque([start])
+        seen = {start}
+        while queue and len(region) < width:
+            for neighbour in sorted(adjacency[queue.popleft()]):
+                if neighbour in used or neighbour in seen:
+                    continue
+                seen.add(neighbour)
+                region.append(neighbour)
+                queue.append(neighbour)
+                if len(region) == width:
+                    break
+        if len(region) == width:
+            return region
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def build_packed_template(slots: Tuple[Slot, ...]) -> Tuple["QuantumCircuit", Tuple[Tuple[int, int], ...]]:
+    """
+    Lay out game templates side by side on disjoint qubits and clbits.
+
+    Slot parameters are renamed onto one ``slot`` ParameterVector, so the
+    packed circuit binds the slots' values concatenated in slot order.
+
+    Args:
+        slots: ``(game, n_qubits)`` per slot
+
+    Returns:
+        tuple: (packed parameterized circuit, (clbit offset, width) per slot)
+    """
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import ParameterVector
+
+    templates = [get_template(game, n) for game, n in slots]
+    slot_params = ParameterVector("slot", sum(t.num_parameters for t in templates))
+
+    qc = QuantumCircuit(sum(t.num_qubits for t in templates), sum(t.num_clbits for t in templates))
+    slices = []
+    q_off = c_off = p_off = 0
+
+    for template in templates:
+        mapping = {p: slot_params[p_off + i] for i, p in enumerate(template.parameters)}
+        qc.compose(
+            template.assign_parameters(mapping),
+            qubits=range(q_off, q_off + template.num_qubits),
+            clbits=range(c_off, c_off + template.num_clbits),
+            inplace=True
+        )
+        slices.append((c_off, template.num_clbits))
+        q_off += template.num_qubits
+        c_off += template.num_clbits
+        p_off += template.num_parameters
+
+    return qc, tuple(slices)
+
+
+def _transpile_packed(slots: Tuple[Slot, ...], backend_name: str,
+                      optimization_level: int) -> Tuple["QuantumCircuit", Tuple[Tuple[int, int], ...]]:
+    circuit, slices = build_packed_template(slots)
+    backend = get_backend(backend_name)
+
+    if isinstance(backend, LocalEngine):
+        return circuit, slices
+
+    from qiskit.transpiler import generate_preset_pass_manager
+
+    widths = [get_template(game, n).num_qubits for game, n in slots]
+    layout = choose_layout(widths, backend.coupling_map, backend.num_qubits)
+    if layout is None:
+        raise ValueError(f"Cannot fit {len(slots)} plays on {backend_name}")
+
+    initial_layout = [q for qubits in layout for q in qubits]
+    pass_manager = generate_preset_pass_manager(
+        optimization_level=optimization_level, backend=backend, initial_layout=initial_layout
+    )
+    return pass_manager.run(circuit), slices
+
+
+# LRU over _transpile_packed, sized from TEMPLATE_CACHE_SIZE on first use
+_packed: Optional[Callable[..., Tuple["QuantumCircuit", Tuple[Tuple[int, int], ...]]]] = None
+
+
+def _transpiled_packed() -> Callable[..., Tuple["QuantumCircuit", Tuple[Tuple[int, int], ...]]]:
+    global _packed
+
+    if _packed is None:
+        _packed = lru_cache(maxsize=get_settings().template_cache_size)(_transpile_packed)
+    return _packed
+
+
+def get_packed_template(slots: Tuple[Slot, ...], backend_name: Optional[str] = None,
+                        optimization_level: Optional[int] = None) -> Tuple["QuantumCircuit", Tuple[Tuple[int, int], ...]]:
+    """
+    Get a packed template transpiled for a backend, cached per slot signature.
+
+    Args:
+        slots: ``(game, n_qubits)`` per slot
+        backend_name: Backend to target (uses QISKIT_BACKEND from env if not specified)
+        optimization_level: Transpiler level (uses TRANSPILE_OPTIMIZATION_LEVEL if not specified)
+
+    Returns:
+        tuple: (ISA circuit with unbound parameters, (clbit offset, width) per slot)
+    """
+    if optimization_level is None:
+        optimization_level = get_optimization_level()
+
+    return _transpiled_packed()(slots, resolve_backend_name(backend_name), optimization_level)
+
+
+def split_counts(counts: Mapping[str, int], slices: Sequence[Tuple[int, int]]) -> List[Counts]:
+    """
+    Split joint counts of a packed circuit into per-slot counts.
+
+    Args:
+        counts: Counts (or a bitstring dict) over all clbits of the packed circuit
+        slices: (clbit offset, width) per slot
+
+    Returns:
+        list: One Counts per slot
+    """
+    joint = Counts.from_dict(counts)
+    return [joint.marginal(range(offset, offset + width)) for offset, width in slices]
+
+
+def plan_packs(plays: Sequence[Tuple[str, Sequence[float]]], backend=None,
+               max_qubits: Optional[int] = None) -> List[List[int]]:
+    """
+    Group plays into packs that each fit on the backend.
+
+    Args:
+        plays: ``(game, parameter values)`` pairs
+        backend: Target backend (None or a LocalEngine for no coupling constraints)
+        max_qubits: Maximum qubits per pack (uses MULTIPLEX_MAX_QUBITS if not specified)
+
+    Returns:
+        list: Lists of play indices, one per pack
+    """
+    if max_qubits is None:
+        max_qubits = get_max_pack_qubits()
+
+    adjacency = None
+    if backend is not None and not isinstance(backend, LocalEngine):
+        adjacency = _adjacency(backend.coupling_map, backend.num_qubits)
+        max_qubits = min(max_qubits, backend.num_qubits)
+
+    widths = [get_template(game, play_n_qubits(game, values)).num_qubits for game, values in plays]
+    packs: List[List[int]] = []
+    current: List[int] = []
+    used: Set[int] = set()
+
+    for index, width in enumerate(widths):
+        if width > max_qubits:
+            raise ValueError(f"Play {index} needs {width} qubits, more than the {max_qubits} available")
+
+        # Place plays incrementally so each check is one region search
+        region = None
+        fits = sum(widths[i] for i in current) + width <= max_qubits
+        if fits and adjacency is not None:
+            region = _grow_region(width, adjacency, used)
+            fits = region is not None
+
+        if not fits:
+            packs.append(current)
+            current, used = [], set()
+            if adjacency is not None:
+                region = _grow_region(width, adjacency, used)
+
+        current.append(index)
+        if region is not None:
+            used.update(region)
+
+    if current:
+        packs.append(current)
+    return packs
+
+
+def run_multiplexed(plays: Sequence[Tuple[str, Sequence[float]]], shots: Optional[int] = None,
+                    backend_name: Optional[str] = None) -> dict:
+    """
+    Run independent plays packed side by side on one circuit per pack.
+
+    Drop-in alternative to ``templates.run_plays``: the result has the same
+    shape, with one counts dict per play, but all plays in a pack share the
+    same shots of one wide PUB.
+
+    Args:
+        plays: ``(game, parameter values)`` pairs
+        shots: Number of shots (uses DEFAULT_SHOTS from env if not specified)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+    Returns:
+        dict: run_sampler-shaped result with per-play counts and the pack count
+    """
+    backend_name = resolve_backend_name(backend_name)
+    packs = plan_packs(plays, get_backend(backend_name))
+
+    pubs, pack_slots = [], []
+    for pack in packs:
+        # Sort slots so equivalent batches reuse one cached packed template
+        order = sorted(pack, key=lambda i: (plays[i][0], play_n_qubits(*plays[i]) or 0))
+        slots = tuple((plays[i][0], play_n_qubits(*plays[i])) for i in order)
+        circuit, slices = get_packed_template(slots, backend_name)
+        values = [float(v) for i in order for v in plays[i][1]]
+        pubs.append((circuit, values))
+        pack_slots.append((order, slices))
+
+    result = run_sampler(pubs, shots=shots, backend_name=backend_name)
+    counts_list = result["counts"] if len(pubs) > 1 else [result["counts"]]
+
+    per_play: List[Optional[Dict[str, int]]] = [None] * len(plays)
+    for (order, slices), counts in zip(pack_slots, counts_list):
+        for play_index, play_counts in zip(order, split_counts(counts, slices)):
+            per_play[play_index] = play_counts
+
+    return {
+        "job_id": result["job_id"],
+        "backend": result["backend"],
+        "shots": result["shots"],
+        "counts": per_play[0] if len(per_play) == 1 else per_play,
+        "packs": len(pubs)
+    }
@@ -0,0 +1,175 @@
+"""Win-probability tables for every bet, from one parameter-sweep job per refresh."""
+
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .circuits import entangled_theta, filter_theta
+from .metrics import timed
+from .routing import candidate_backends, run_routed
+from .service import resolve_backend_name, run_sampler
+from .settings import get_settings
+from .templates import make_pub
+
+# Bets offered by the games (matches the API's qcount/qa/qb bounds)
+QCOUNTS = range(1, 21)
+
+ODDS_GAMES = ("filter", "entangled_wager")
+
+# Plays standing in for the sweep job when routing it
+_SWEEP_PLAYS = [("filter", [0.0]), ("entangled_pair", [0.0])]
+
+# (backend the sweep ran on, shots) -> (odds table, fetched_at monotonic time)
+_odds_cache: Dict[Tuple[str, int], Tuple[Dict[str, Any], float]] = {}
+# Per-key locks so concurrent refreshes share one job
+_refresh_locks: Dict[Tuple[str, int], threading.Lock] = {}
+_cache_lock = threading.Lock()
+
+
+def _sweep_angles() -> Tuple[List[float], List[float]]:
+    """
+    Distinct angles to sweep for each game.
+
+    Filter angles saturate above qcount 7 and entangled angles only depend on
+    qa - qb, so the sweeps bind 8 and 39 rows instead of 20 and 400.
+    """
+    filter_angles = sorted({filter_theta(q) for q in QCOUNTS})
+    entangled_angles = sorted({entangled_theta(a, b) for a in QCOUNTS for b in QCOUNTS})
+    return filter_angles, entangled_angles
+
+
+def compute_odds(shots: Optional[int] = None, backend_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Estimate every bet's per-shot odds in a single sampler job.
+
+    The job holds one sweep PUB per game over the cached templates: the
+    filter angle for each qcount and the entangled phase for each (qa, qb).
+
+    Args:
+        shots: Shots per parameter row (uses ODDS_SHOTS if not specified)
+        backend_name: Backend to use (routed, or QISKIT_BACKEND, if not specified)
+
+    Returns:
+        dict: job_id, backend, shots, computed_at and per-game odds lists
+    """
+    return _compute_odds(shots, backend_name)[0]
+
+
+def _compute_odds(shots: Optional[int], backend_name: Optional[str]) -> Tuple[Dict[str, Any], str]:
+    """Run the sweep job; returns the odds and the backend spec it actually ran on."""
+    shots = shots or get_settings().odds_shots
+    filter_angles, entangled_angles = _sweep_angles()
+    ran_on = [resolve_backend_name(backend_name)]
+
+    def run_sweeps(_, shots, backend_name):
+        if backend_name is not None:
+            ran_on.append(backend_name)
+        pubs = [
+            make_pub("filter", [[theta] for theta in filter_angles], backend_name),
+            make_pub("entangled_pair", [[theta] for theta in entangled_angles], backend_name),
+        ]
+        return run_sampler(pubs, shots=shots, backend_name=backend_name)
+
+    with timed("odds"):
+        result = run_routed(run_sweeps, _SWEEP_PLAYS, shots, backend_name)
+
+    filter_counts, entangled_counts = result["counts"]
+    p_one = {theta: counts.get("1", 0) / shots for theta, counts in zip(filter_angles, filter_counts)}
+    p_correlated = {
+        theta: (counts.get("00", 0) + counts.get("11", 0)) / shots
+        for theta, counts in zip(entangled_angles, entangled_counts)
+    }
+
+    filter_odds = []
+    for qcount in QCOUNTS:
+        theta = filter_theta(qcount)
+        filter_odds.append({"qcount": qcount, "theta": theta, "p_one": p_one[theta]})
+
+    entangled_odds = []
+    for qa in QCOUNTS:
+        for qb in QCOUNTS:
+            theta = entangled_theta(qa, qb)
+            entangled_odds.append({
+                "qa": qa,
+                "qb": qb,
+                "theta": theta,
+                "p_correlated": p_correlated[theta],
+                "p_anticorrelated": 1.0 - p_correlated[theta]
+            })
+
+    return {
+        "job_id": result["job_id"],
+        "backend": result["backend"],
+        "shots": shots,
+        "computed_at": datetime.utcnow().isoformat(),
+        "filter": filter_odds,
+        "entangled_wager": entangled_odds
+    }, ran_on[-1]
+
+
+def get_odds(game: Optional[str] = None, shots: Optional[int] = None,
+             backend_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the odds tables, recomputing them at most once per ODDS_TTL_SECONDS per backend.
+
+    Concurrent callers that find the entry stale wait for a single refresh
+    instead of each submitting a job. Tables are cached under the backend the
+    sweep actually ran on. Without an explicit backend, a fresh table from any
+    backend the router could pick is served before a new sweep is started,
+    preferring the one it would pick now.
+
+    Args:
+        game: "filter" or "entangled_wager" for one table (both if not specified)
+        shots: Shots per parameter row (uses ODDS_SHOTS if not specified)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+    Returns:
+        dict: Odds tables plus job_id, backend, shots, computed_at, cached and age_s
+    """
+    if game is not None and game not in ODDS_GAMES:
+        raise ValueError(f"Unknown game '{game}'. Use 'filter' or 'entangled_wager'")
+
+    shots = shots or get_settings().odds_shots
+    candidates = candidate_backends(_SWEEP_PLAYS, backend_name)
+    ttl = get_settings().odds_ttl_seconds
+
+    entry = _fresh(candidates, shots, ttl)
+    cached = entry is not None
+    if entry is None:
+        with _cache_lock:
+            lock = _refresh_locks.setdefault((candidates[0], shots), threading.Lock())
+        with lock:
+            # Another caller may have refreshed while we waited
+            entry = _fresh(candidates, shots, ttl)
+            if entry is None:
+                odds, ran_on = _compute_odds(shots, backend_name)
+                entry = (odds, time.monotonic())
+                with _cache_lock:
+                    _odds_cache[(ran_on, shots)] = entry
+
+    odds, fetched_at = entry
+    response = {name: value for name, value in odds.items() if name not in ODDS_GAMES}
+    for name in ODDS_GAMES:
+        if game is None or game == name:
+            response[name] = odds[name]
+    response["cached"] = cached
+    response["age_s"] = time.monotonic() - fetched_at
+    return response
+
+
+def _fresh(backends: List[str], shots: int, ttl: float) -> Optional[Tuple[Dict[str, Any], float]]:
+    """Cached (odds, fetched_at) for the first backend with an unexpired table, or None."""
+    now = time.monotonic()
+    with _cache_lock:
+        for backend in backends:
+            entry = _odds_cache.get((backend, shots))
+            if entry is not None and now - entry[1] < ttl:
+                return entry
+    return None
+
+
+def clear_odds_cache():
+    """Drop all cached odds tables."""
+    with _cache_lock:
+        _odds_cache.clear()
@@ -0,0 +1,157 @@
+"""Slots paytables, evaluated over whole outcome histograms with NumPy."""
+
+import math
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .results import Counts
+
+# Widest machine: outcomes must fit the audit ledger's 32-bit count keys
+MAX_REELS = 32
+
+# Reels pay on 1, so keeping P(1) <= 0.5 per reel keeps the house edge
+MAX_REEL_ANGLE = math.pi / 2
+
+# Reels per default payline
+DEFAULT_LINE_WIDTH = 3
+
+
+def _popcount(values: np.ndarray) -> np.ndarray:
+    """Number of set bits in each uint64 value."""
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    # NumPy < 2.0: sum a per-byte lookup table
+    table = np.array([bin(i).count("1") for i in range(256)], dtype=np.int64)
+    return table[values.view(np.uint8).reshape(-1, 8)].sum(axis=1)
+
+
+class Paytable:
+    """
+    Payout rules for a row of binary reels, one qubit per reel.
+
+    A reel showing 1 is the paying symbol. Each spin (shot) is paid the sum of:
+
+    - Paylines: a set of reels that pays ``pay`` times the per-line stake when
+      every reel on it shows 1. The bet is spread evenly over the paylines.
+    - Scatter pays: a multiple of the whole bet, keyed by how many reels show
+      1 anywhere on the machine.
+
+    Rules are kept as bit masks and a scatter table indexed by popcount, so a
+    round is scored once per distinct outcome rather than once per shot.
+
+    Args:
+        n_reels: Number of reels
+        lines: ``(reel indices, pay)`` per payline
+        scatter: Number of reels showing 1 -> pay as a multiple of the bet
+    """
+
+    __slots__ = ("n_reels", "lines", "masks", "line_pays", "scatter")
+
+    def __init__(self, n_reels: int, lines: Sequence[Tuple[Sequence[int], float]],
+                 scatter: Optional[Mapping[int, float]] = None):
+        if not 1 <= n_reels <= MAX_REELS:
+            raise ValueError(f"n_reels must be between 1 and {MAX_REELS} (got {n_reels})")
+
+        masks = []
+        for reels, pay in lines:
+            if not reels or any(not 0 <= r < n_reels for r in reels):
+                raise ValueError(f"Payline {list(reels)} must name reels 0-{n_reels - 1}")
+            if pay < 0:
+                raise ValueError(f"Payline pay must be non-negative (got {pay})")
+            masks.append(sum(1 << r for r in set(reels)))
+
+        table = np.zeros(n_reels + 1)
+        for ones, pay in (scatter or {}).items():
+            if not 0 <= ones <= n_reels:
+                raise ValueError(f"Scatter pay for {ones} reels is outside 0-{n_reels}")
+            table[ones] = pay
+
+        self.n_reels = n_reels
+        self.lines = [(sorted(set(reels)), float(pay)) for reels, pay in lines]
+        self.masks = np.array(masks, dtype=np.uint64)
+        self.line_pays = np.array([pay for _, pay in self.lines], dtype=float)
+        self.scatter = table
+
+    @classmethod
+    def default(cls, n_reels: int) -> "Paytable":
+        """
+        House paytable for a machine with ``n_reels`` reels.
+
+        Paylines are the windows of three adjacent reels (one line over every
+        reel on narrower machines), each paying 0.75 * 2^width per line stake;
+        on wider machines all reels showing 1 is a 2^(n-3)x jackpot. At the
+        default angle of pi/2 (fair reels) that returns 87.5% of the bet.
+
+        Args:
+            n_reels: Number of reels
+
+        Returns:
+            Paytable: The default rules
+        """
+        if n_reels <= DEFAULT_LINE_WIDTH:
+            return cls(n_reels, [(range(n_reels), 0.875 * 2 ** n_reels)])
+
+        lines = [(range(start, start + DEFAULT_LINE_WIDTH), 0.75 * 2 ** DEFAULT_LINE_WIDTH)
+                 for start in range(n_reels - DEFAULT_LINE_WIDTH + 1)]
+        return cls(n_reels, lines, {n_reels: 2.0 ** (n_reels - 3)})
+
+    def multipliers(self, outcomes: np.ndarray) -> np.ndarray:
+        """
+        Multiple of the bet paid by each outcome.
+
+        Args:
+            outcomes: Outcome values (reel 0 least significant)
+
+        Returns:
+            np.ndarray: Pay per outcome, as a multiple of the whole bet
+        """
+        outcomes = np.asarray(outcomes, dtype=np.uint64)
+        pays = self.scatter[_popcount(outcomes)]
+        if len(self.masks):
+            hits = (outcomes[:, None] & self.masks) == self.masks
+            pays = pays + hits @ self.line_pays / len(self.masks)
+        return pays
+
+    def evaluate(self, counts: Mapping[str, int]) -> Dict[str, Any]:
+        """
+        Score a round of spins from its outcome histogram.
+
+        Args:
+            counts: Counts (or a bitstring dict) over the reels
+
+        Returns:
+            dict: ``return_multiplier`` (average pay per unit bet over all
+                  shots), ``winning_shots`` and ``jackpots`` (shots paying the
+                  top prize)
+        """
+        counts = Counts.from_dict(counts, self.n_reels)
+        shots = counts.shots
+        if not shots:
+            return {"return_multiplier": 0.0, "winning_shots": 0, "jackpots": 0}
+
+        pays = self.multipliers(counts.outcomes)
+        top = self.max_pay()
+        return {
+            "return_multiplier": float(pays @ counts.occurrences) / shots,
+            "winning_shots": int(counts.occurrences[pays > 0].sum()),
+            "jackpots": int(counts.occurrences[pays == top].sum()) if top > 0 else 0
+        }
+
+    def max_pay(self) -> float:
+        """Pay of the best possible spin (every reel showing 1)."""
+        return float(self.multipliers(np.array([(1 << self.n_reels) - 1], dtype=np.uint64))[0])
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Paytable):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    __hash__ = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "n_reels": self.n_reels,
+            "lines": [{"reels": reels, "pay": pay} for reels, pay in self.lines],
+            "scatter": {int(ones): float(pay) for ones, pay in enumerate(self.scatter) if pay}
+        }
@@ -0,0 +1,199 @@
+"""Compact measurement counts backed by NumPy arrays instead of bitstring dicts."""
+
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+import numpy as np
+
+# Widest register whose outcomes fit in a uint64; wider ones fall back to Python ints
+_MAX_PACKED_BITS = 64
+
+# Widest register histogram() will materialize densely (2^24 counters = 128 MiB)
+MAX_DENSE_BITS = 24
+
+
+class Counts(Mapping):
+    """
+    Outcome histogram of one circuit (or one sweep row), keyed by integer value.
+
+    Outcomes are held as two parallel arrays: the distinct measured values
+    (sorted, clbit 0 least significant) and how often each occurred. Only
+    observed outcomes are stored, so wide registers (slots, packed plays)
+    cost memory per distinct outcome rather than per possible bitstring.
+
+    The class is a read-only Mapping from bitstring to count, compatible with
+    ``BitArray.get_counts()``: ``counts.get("11", 0)`` is a binary search on
+    the value array, and bitstring keys are only formatted when the counts
+    are iterated or converted with ``to_dict`` (e.g. for JSON).
+
+    Args:
+        outcomes: Distinct outcome values, ascending
+        occurrences: How often each outcome was measured
+        num_bits: Number of classical bits measured
+    """
+
+    __slots__ = ("outcomes", "occurrences", "num_bits", "_dict")
+
+    def __init__(self, outcomes: np.ndarray, occurrences: np.ndarray, num_bits: int):
+        self.outcomes = outcomes
+        self.occurrences = occurrences
+        self.num_bits = num_bits
+        self._dict: Optional[Dict[str, int]] = None
+
+    @classmethod
+    def from_samples(cls, samples: np.ndarray, num_bits: int) -> "Counts":
+        """Histogram per-shot integer outcomes."""
+        values, counts = np.unique(samples, return_counts=True)
+        return cls(values, counts.astype(np.int64), num_bits)
+
+    @classmethod
+    def from_memory(cls, memory: np.ndarray, num_bits: int) -> "Counts":
+        """
+        Histogram per-shot outcomes packed like ``BitArray.array``.
+
+        Args:
+            memory: uint8 array of shape (shots, bytes), big-endian per shot
+            num_bits: Number of classical bits measured
+        """
+        shots, num_bytes = memory.shape
+        if num_bytes * 8 <= _MAX_PACKED_BITS:
+            padded = np.zeros((shots, 8), dtype=np.uint8)
+            padded[:, 8 - num_bytes:] = memory
+            samples = padded.view(">u8").ravel()
+        else:
+            samples = np.array([int.from_bytes(row.tobytes(), "big") for row in memory], dtype=object)
+        return cls.from_samples(samples, num_bits)
+
+    @classmethod
+    def from_dict(cls, counts: Mapping, num_bits: Optional[int] = None) -> "Counts":
+        """Build from a bitstring -> count mapping (e.g. ``get_counts()``)."""
+        if isinstance(counts, Counts):
+            return counts
+        if num_bits is None:
+            num_bits = len(next(iter(counts))) if counts else 0
+        dtype = np.uint64 if num_bits <= _MAX_PACKED_BITS else object
+        values = np.array([int(key, 2) for key in counts], dtype=dtype)
+        order = np.argsort(values)
+        return cls(values[order], np.array(list(counts.values()), dtype=np.int64)[order], num_bits)
+
+    @property
+    def shots(self) -> int:
+        """Total number of shots."""
+        return int(self.occurrences.sum())
+
+    def count(self, value: int) -> int:
+        """Occurrences of an integer outcome (0 if never measured)."""
+        index = int(np.searchsorted(self.outcomes, value))
+        if index < len(self.outcomes) and self.outcomes[index] == value:
+            return int(self.occurrences[index])
+        return 0
+
+    def ones(self, bit: int = 0) -> int:
+        """Shots in which a classical bit read 1."""
+        return int(self.occurrences[self._bit(bit) == 1].sum())
+
+    def marginal(self, bits: Sequence[int]) -> "Counts":
+        """
+        Counts over a subset of classical bits.
+
+        Args:
+            bits: Clbit indices; ``bits[i]`` becomes bit i of the result
+
+        Returns:
+            Counts: Marginal histogram
+        """
+        values = np.zeros(len(self.outcomes), dtype=np.uint64)
+        for i, bit in enumerate(bits):
+            values |= self._bit(bit).astype(np.uint64) << np.uint64(i)
+        unique, inverse = np.unique(values, return_inverse=True)
+        return Counts(unique, np.bincount(inverse, weights=self.occurrences, minlength=len(unique)).astype(np.int64),
+                      len(bits))
+
+    def even_parity(self, bits: Optional[Sequence[int]] = None) -> int:
+        """
+        Shots in which the given bits (all, if not specified) hold an even number of ones.
+
+        For a Bell pair these are the correlated (00/11) outcomes.
+        """
+        parity = np.zeros(len(self.outcomes), dtype=np.int64)
+        for bit in range(self.num_bits) if bits is None else bits:
+            parity ^= self._bit(bit)
+        return int(self.occurrences[parity == 0].sum())
+
+    def expectation(self, bits: Optional[Sequence[int]] = None) -> float:
+        """Z-parity expectation of the given bits, in [-1, 1] (e.g. a two-qubit correlation)."""
+        shots = self.shots
+        return (2 * self.even_parity(bits) - shots) / shots if shots else 0.0
+
+    def histogram(self) -> np.ndarray:
+        """Dense counts indexed by outcome value (narrow registers only)."""
+        if self.num_bits > MAX_DENSE_BITS:
+            raise ValueError(f"Dense histogram of {self.num_bits} bits is too large (max {MAX_DENSE_BITS})")
+        dense = np.zeros(1 << self.num_bits, dtype=np.int64)
+        dense[self.outcomes.astype(np.int64)] = self.occurrences
+        return dense
+
+    def to_dict(self) -> Dict[str, int]:
+        """Bitstring -> count dict, formatted once and cached."""
+        if self._dict is None:
+            width = self.num_bits
+            self._dict = {format(int(v), f"0{width}b"): int(c) for v, c in zip(self.outcomes, self.occurrences)}
+        return self._dict
+
+    def _bit(self, bit: int) -> np.ndarray:
+        if self.outcomes.dtype == object:
+            return np.array([(int(v) >> bit) & 1 for v in self.outcomes], dtype=np.int64)
+        return ((self.outcomes >> np.uint64(bit)) & np.uint64(1)).astype(np.int64)
+
+    def __getitem__(self, key: str) -> int:
+        if self._dict is not None:
+            return self._dict[key]
+        if not isinstance(key, str) or len(key) != self.num_bits:
+            raise KeyError(key)
+        try:
+            value = int(key, 2)
+        except ValueError:
+            raise KeyError(key) from None
+        count = self.count(value)
+        if not count:
+            raise KeyError(key)
+        return count
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+
+    def __len__(self) -> int:
+        return len(self.outcomes)
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def values(self):
+        return self.to_dict().values()
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Counts):
+            return (self.num_bits == other.num_bits and np.array_equal(self.outcomes, other.outcomes)
+                    and np.array_equal(self.occurrences, other.occurrences))
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Counts({self.to_dict()!r})"
+
+
+def to_jsonable(obj: Any) -> Any:
+    """``json.dumps`` default hook for Counts and NumPy values in results."""
+    if isinstance(obj, Counts):
+        return obj.to_dict()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
@@ -0,0 +1,336 @@
+"""Least-busy routing of sampler jobs across several backends, with local failover."""
+
+import logging
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from .engines import LocalEngine
+from .metrics import ROUTES
+from .service import get_backend, resolve_backend_name
+from .settings import get_settings
+from .templates import get_template, play_n_qubits
+
+logger = logging.getLogger(__name__)
+
+# Weight of the newest observation in the per-backend job duration average
+_EWMA_ALPHA = 0.2
+
+
+class BackendState:
+    """
+    Last known status of one routed backend.
+
+    Args:
+        name: Backend spec as configured (e.g. "ibm:ibm_kyiv", "fake:fake_manila")
+        job_seconds: Initial estimate of one job's run time on the device
+    """
+
+    __slots__ = ("name", "operational", "pending_jobs", "num_qubits", "status_msg", "job_seconds", "updated")
+
+    def __init__(self, name: str, job_seconds: float):
+        self.name = name
+        self.operational = False
+        self.pending_jobs = 0
+        self.num_qubits: Optional[int] = None
+        self.status_msg = "unknown"
+        self.job_seconds = job_seconds
+        self.updated = 0.0
+
+    def expected_wait(self) -> float:
+        """Seconds a new job should take: the queue ahead of it plus its own run."""
+        if not self.operational:
+            return math.inf
+        return (self.pending_jobs + 1) * self.job_seconds
+
+    def fits(self, num_qubits: int) -> bool:
+        return self.num_qubits is None or num_qubits <= self.num_qubits
+
+    def to_dict(self) -> Dict[str, Any]:
+        wait = self.expected_wait()
+        return {
+            "name": self.name,
+            "operational": self.operational,
+            "pending_jobs": self.pending_jobs,
+            "num_qubits": self.num_qubits,
+            "status_msg": self.status_msg,
+            "job_seconds": self.job_seconds,
+            "expected_wait_s": wait if wait != math.inf else None,
+            "age_s": time.monotonic() - self.updated if self.updated else None
+        }
+
+
+class BackendRouter:
+    """
+    Route each sampler job to the backend expected to finish it soonest.
+
+    Backend status (operational flag and pending job count) is polled in a
+    background thread and cached between polls. A job goes to the operational
+    backend with the lowest expected wait that has enough qubits for it; when
+    every candidate's expected wait is above ``sla_s`` (or none fits), it goes
+    to the local ``fallback`` engine instead. Jobs arriving before the first
+    poll has finished also go to the fallback, so routing never waits on it.
+
+    Expected wait is ``(pending_jobs + 1) * job_seconds``, where
+    ``job_seconds`` starts at a configured estimate and tracks the run times
+    observed for this process's own jobs.
+
+    Args:
+        backend_names: Candidate backend specs
+        fallback: Backend spec used when no candidate meets the SLA
+        sla_s: Maximum acceptable expected wait in seconds
+        poll_interval_s: Seconds between status polls
+        job_seconds: Initial per-job run time estimate
+    """
+
+    def __init__(self, backend_names: Sequence[str], fallback: str = "local:analytic", sla_s: float = 30.0,
+                 poll_interval_s: float = 30.0, job_seconds: float = 5.0):
+        if not backend_names:
+            raise ValueError("BackendRouter needs at least one backend")
+
+        self.fallback = fallback
+        self.sla_s = sla_s
+        self.poll_interval_s = poll_interval_s
+        self.states = {name: BackendState(name, job_seconds) for name in backend_names}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._poller: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    def refresh(self):
+        """Poll every candidate's status once."""
+        for state in self.states.values():
+            try:
+                backend = get_backend(state.name)
+                if isinstance(backend, LocalEngine):
+                    operational, pending, num_qubits, message = True, 0, None, "local"
+                else:
+                    status = backend.status()
+                    operational, pending, message = status.operational, status.pending_jobs, status.status_msg
+                    num_qubits = backend.num_qubits
+            except Exception as e:
+                logger.warning("Status poll failed for %s: %s", state.name, e)
+                operational, pending, num_qubits, message = False, 0, state.num_qubits, f"poll failed: {e}"
+
+            with self._lock:
+                state.operational = operational
+                state.pending_jobs = pending
+                state.num_qubits = num_qubits
+                state.status_msg = message
+                state.updated = time.monotonic()
+
+        self._ready.set()
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the first status poll has finished; False on timeout."""
+        return self._ready.wait(timeout)
+
+    def start(self):
+        """Start background status polling (idempotent)."""
+        if self._poller is None or not self._poller.is_alive():
+            self._stop.clear()
+            self._poller = threading.Thread(target=self._poll, name="backend-router", daemon=True)
+            self._poller.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join()
+
+    def _poll(self):
+        while not self._stop.is_set():
+            self.refresh()
+            self._stop.wait(self.poll_interval_s)
+
+    def choose(self, num_qubits: int = 1, record: bool = True) -> str:
+        """
+        Pick the backend for a job.
+
+        Args:
+            num_qubits: Qubits the job's widest circuit needs
+            record: Count the decision in the routes metric (False to only peek)
+
+        Returns:
+            str: Backend spec to run the job on
+        """
+        if not self._ready.is_set():
+            # No status yet: don't route blind, and don't poll on the job's time
+            if record:
+                ROUTES.inc(backend=self.fallback, reason="warming")
+            return self.fallback
+
+        with self._lock:
+            fitting = [s for s in self.states.values() if s.fits(num_qubits)]
+            best = min(fitting, key=BackendState.expected_wait, default=None)
+
+            if best is not None and best.expected_wait() <= self.sla_s:
+                name, reason = best.name, "least_busy"
+            else:
+                name, reason = self.fallback, "fallback"
+
+        if record:
+            ROUTES.inc(backend=name, reason=reason)
+        return name
+
+    def observe(self, backend_name: str, seconds: float):
+        """Fold an observed job duration into the backend's run time estimate."""
+        state = self.states.get(backend_name)
+        if state is None:
+            return
+        with self._lock:
+            # Time spent queued is already counted by pending_jobs
+            run = seconds / (state.pending_jobs + 1)
+            state.job_seconds += _EWMA_ALPHA * (run - state.job_seconds)
+
+    def mark_down(self, backend_name: str, reason: str):
+        """Take a backend out of rotation until its next successful poll."""
+        state = self.states.get(backend_name)
+        if state is None:
+            return
+        with self._lock:
+            state.operational = False
+            state.status_msg = reason
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current routing table, for /backends."""
+        with self._lock:
+            return {
+                "fallback": self.fallback,
+                "sla_s": self.sla_s,
+                "backends": [state.to_dict() for state in self.states.values()]
+            }
+
+
+def required_qubits(plays: Sequence[Any]) -> int:
+    """
+    Qubits the widest of a job's plays needs before layout.
+
+    Args:
+        plays: ``(game, parameter values)`` pairs, circuits or PUB tuples
+
+    Returns:
+        int: Logical qubit count of the widest play
+    """
+    widths = [1]
+    for play in plays:
+        if isinstance(play, tuple) and isinstance(play[0], str):
+            game, values = play
+            widths.append(get_template(game, play_n_qubits(game, values)).num_qubits)
+        else:
+            circuit = play[0] if isinstance(play, tuple) else play
+            widths.append(circuit.num_qubits)
+    return max(widths)
+
+
+# Global router instance
+_router: Optional[BackendRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_router() -> Optional[BackendRouter]:
+    """
+    Return the process-wide router, or None if routing is disabled.
+
+    Enabled by listing backends in QISKIT_BACKENDS (comma-separated specs).
+    ROUTE_SLA_SECONDS (default 30), ROUTE_FALLBACK_BACKEND (default
+    local:analytic), ROUTE_POLL_INTERVAL_SECONDS (default 30) and
+    ROUTE_JOB_SECONDS (default 5) tune it.
+
+    Returns:
+        BackendRouter: The shared router (polling in the background), or None
+    """
+    global _router
+
+    settings = get_settings()
+    names = [name.strip() for name in (settings.qiskit_backends or "").split(",") if name.strip()]
+    if not names:
+        return None
+
+    with _router_lock:
+        if _router is None:
+            _router = BackendRouter(
+                names,
+                fallback=settings.route_fallback_backend,
+                sla_s=settings.route_sla_seconds,
+                poll_interval_s=settings.route_poll_interval_seconds,
+                job_seconds=settings.route_job_seconds,
+            )
+            _router.start()
+
+    return _router
+
+
+def route(plays: Sequence[Any], backend_name: Optional[str] = None) -> Optional[str]:
+    """
+    Resolve the backend for a job: the explicit name if given, else the router's choice.
+
+    Args:
+        plays: The job's plays (see ``required_qubits``)
+        backend_name: Explicitly requested backend, which is never overridden
+
+    Returns:
+        str: Backend spec, or None to use QISKIT_BACKEND when routing is disabled
+    """
+    if backend_name is not None:
+        return backend_name
+    router = get_router()
+    if router is None:
+        return None
+    return router.choose(required_qubits(plays))
+
+
+def candidate_backends(plays: Sequence[Any], backend_name: Optional[str] = None) -> List[str]:
+    """
+    Backends a job's cached result may come from, without recording a route.
+
+    Args:
+        plays: The job's plays (see ``required_qubits``)
+        backend_name: Explicitly requested backend, which is the only candidate
+
+    Returns:
+        list: The backend the job would be routed to now, then every other one it could run on
+    """
+    if backend_name is not None:
+        return [backend_name]
+    router = get_router()
+    if router is None:
+        return [resolve_backend_name()]
+    first = router.choose(required_qubits(plays), record=False)
+    return [first] + [name for name in [*router.states, router.fallback] if name != first]
+
+
+def run_routed(runner, plays: List[Any], shots: int, backend_name: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Run a job on its routed backend, failing over once if that backend errors.
+
+    A routed backend that raises is marked down until its next status poll
+    and the job is re-routed (to the next best backend or the fallback).
+    Explicitly named backends are run as-is.
+
+    Args:
+        runner: Callable with the ``run_sampler`` signature
+        plays: Plays, circuits or PUBs for the runner
+        shots: Number of shots
+        backend_name: Explicitly requested backend, if any
+
+    Returns:
+        dict: The runner's result; its "backend" is where the job actually ran
+    """
+    chosen = route(plays, backend_name)
+    router = get_router()
+    if backend_name is not None or router is None:
+        return runner(plays, shots=shots, backend_name=chosen)
+
+    started = time.monotonic()
+    try:
+        result = runner(plays, shots=shots, backend_name=chosen)
+    except Exception as e:
+        if chosen == router.fallback:
+            raise
+        logger.warning("Job failed on %s, failing over: %s", chosen, e)
+        router.mark_down(chosen, f"job failed: {e}")
+        return runner(plays, shots=shots, backend_name=router.choose(required_qubits(plays)))
+
+    router.observe(chosen, time.monotonic() - started)
+    return result
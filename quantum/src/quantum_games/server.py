@@ -1,15 +1,90 @@
 """FastAPI server for quantum games."""
 
-from fastapi import FastAPI, HTTPException
+import asyncio
+import hmac
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager
+from functools import partial
+from fastapi import FastAPI, HTTPException, Query, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from starlette.requests import HTTPConnection
 from pydantic import BaseModel, Field
-from typing import Optional
-from .games import play_filter, play_entangled_wager
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
+from .admission import AdmissionRejected, Slot, circuit_cost, get_admission
+from .games import (MAX_DECK_QUBITS, draw_random_bits, play_batch_async, play_entangled_wager_async, play_filter_async,
+                    play_find_card_async, play_slots_async, slots_angles, validate_find_card)
+from .engines import LOCAL_PREFIX
+from .entropy import EntropyExhausted
+from .jobs import get_job_store, JobQueueFull
+from .ledger import get_audit_ledger
+from .lobby import LobbyFull, close_lobby, get_lobby, validate_qcount
+from .metrics import HTTP_SECONDS, SamplingProfiler, render_metrics
+from .odds import get_odds
+from .paytable import MAX_REELS, Paytable
+from .results import to_jsonable
+from .routing import get_router
+from .service import get_executor, resolve_backend_name, warm_up, close_samplers
+from .settings import get_settings
+from .templates import warm_templates
+
+logger = logging.getLogger(__name__)
+
+# Set once the background warm-up has finished (successfully or not)
+_warmed = threading.Event()
+
+
+def _warm_up():
+    router = get_router()
+    backend_names = list(router.states) + [router.fallback] if router is not None else [None]
+    try:
+        warm_up(backend_names if router is not None else None)
+        for backend_name in backend_names:
+            warm_templates(backend_name)
+        if router is not None:
+            router.wait_ready(router.poll_interval_s)
+    except Exception as e:
+        # Serve anyway; the first play will retry the cold path
+        logger.warning("Warm-up failed: %s", e)
+    finally:
+        _warmed.set()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Warm the runtime service, samplers and templates in the background.
+    
+    Startup doesn't wait for the warm-up (authenticating and transpiling take
+    seconds), so the server accepts traffic as soon as it is imported; plays
+    that arrive first take the cold path. ``/health`` reports when it's done.
+    """
+    # Start polling routed backends' queues before the first play
+    get_router()
+    if get_settings().warm_up_on_startup:
+        threading.Thread(target=_warm_up, name="warm-up", daemon=True).start()
+    else:
+        _warmed.set()
+    yield
+    await close_lobby()
+    close_samplers()
+    ledger = get_audit_ledger()
+    if ledger is not None:
+        ledger.close()
+
 
 app = FastAPI(
     title="Quantum Games API",
     description="API for playing quantum casino games using IBM Quantum",
-    version="0.1.0"
+    version="0.1.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -22,6 +97,95 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def instrument_requests(request: Request, call_next):
+    """
+    Record request latency per route and optionally profile the request.
+    
+    With PROFILE_REQUESTS=1, a request carrying ``X-Profile: 1`` is run under
+    the sampling profiler and its folded stacks are written to PROFILE_DIR;
+    the file path is returned in the ``X-Profile-File`` header.
+    """
+    profiler = None
+    settings = get_settings()
+    if request.headers.get("x-profile") == "1" and settings.profile_requests:
+        profiler = SamplingProfiler(settings.profile_interval_ms / 1000.0)
+        profiler.start()
+    
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+    finally:
+        route = request.scope.get("route")
+        HTTP_SECONDS.observe(
+            time.perf_counter() - start,
+            method=request.method,
+            route=route.path if route is not None else "unmatched",
+            status=str(status)
+        )
+        if profiler is not None:
+            profiler.stop()
+    
+    if profiler is not None:
+        response.headers["X-Profile-File"] = _write_profile(profiler)
+    return response
+
+
+def _write_profile(profiler: SamplingProfiler) -> str:
+    directory = get_settings().profile_dir or os.path.join(tempfile.gettempdir(), "quantum-profiles")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{int(time.time())}-{uuid.uuid4().hex[:8]}.folded")
+    with open(path, "w") as f:
+        f.write(profiler.folded())
+    return path
+
+
+def _client_id(connection: HTTPConnection) -> Tuple[str, bool]:
+    """
+    Client that rate limits apply to, and whether it is authenticated.
+    
+    A key from ADMISSION_API_KEYS (``Authorization: Bearer <key>`` or
+    ``X-Api-Key``) identifies its named client; anything else is keyed by
+    its peer address, so callers can't pick their own bucket.
+    """
+    authorization = connection.headers.get("authorization", "")
+    key = authorization[7:] if authorization[:7].lower() == "bearer " else connection.headers.get("x-api-key")
+    api_keys = get_settings().admission_api_keys
+    if key and api_keys:
+        for entry in api_keys.split(","):
+            client, _, expected = entry.strip().partition("=")
+            if expected and hmac.compare_digest(key.encode(), expected.encode()):
+                return client, True
+    
+    return f"peer:{connection.client.host if connection.client else 'unknown'}", False
+
+
+def _admit(connection: HTTPConnection, tier: str, cost: float = 0.0, shots: int = 0) -> Slot:
+    """
+    Admit a request through admission control or answer 429 with Retry-After.
+    
+    Authenticated clients listed in ADMISSION_VIP_CLIENTS are always admitted
+    at the VIP tier. Admit only after the request is validated, so rejected
+    requests don't spend tokens or budget.
+    """
+    settings = get_settings()
+    client, authenticated = _client_id(connection)
+    if authenticated and settings.admission_vip_clients and client in settings.admission_vip_clients.split(","):
+        tier = "vip"
+    
+    try:
+        return get_admission().admit(client, tier, cost, shots * settings.admission_shot_seconds)
+    except AdmissionRejected as e:
+        retry_after = max(1, math.ceil(min(e.retry_after, settings.admission_budget_window_seconds)))
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(retry_after)})
+
+
+def _shots(shots: Optional[int]) -> int:
+    return shots or get_settings().default_shots
+
+
 # Request/Response Models
 class FilterRequest(BaseModel):
     qcount: int = Field(..., description="Number of quantum chips to bet", ge=1, le=20)
@@ -34,6 +198,34 @@ class EntangledWagerRequest(BaseModel):
     shots: Optional[int] = Field(None, description="Number of measurement shots", ge=100, le=10000)
 
 
+class SlotsRequest(BaseModel):
+    reels: int = Field(5, description="Number of reels (qubits)", ge=1, le=MAX_REELS)
+    angles: Optional[List[float]] = Field(None, description="Per-reel RY angles in [0, pi/2] (fair reels if omitted)")
+    shots: Optional[int] = Field(None, description="Number of spins", ge=100, le=100000)
+
+
+class FindCardRequest(BaseModel):
+    qubits: int = Field(4, description="Deck size as qubits (2^qubits cards)", ge=1, le=MAX_DECK_QUBITS)
+    guess: int = Field(..., description="Guessed card, 0 to 2^qubits - 1", ge=0)
+    shots: Optional[int] = Field(None, description="Number of measurement shots", ge=100, le=10000)
+
+
+class FilterJobRequest(FilterRequest):
+    game: Literal["filter"]
+
+
+class EntangledWagerJobRequest(EntangledWagerRequest):
+    game: Literal["entangled_wager"]
+
+
+JobRequest = Annotated[Union[FilterJobRequest, EntangledWagerJobRequest], Field(discriminator="game")]
+
+
+class BatchPlayRequest(BaseModel):
+    plays: List[JobRequest] = Field(..., description="Plays to run", min_length=1, max_length=1000)
+    shots: Optional[int] = Field(None, description="Shots for plays that don't set their own", ge=100, le=10000)
+
+
 @app.get("/")
 async def root():
     """Root endpoint with API information."""
@@ -42,45 +234,343 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "filter": "/play/filter",
-            "entangled_wager": "/play/entangled-wager"
+            "entangled_wager": "/play/entangled-wager",
+            "slots": "/play/slots",
+            "find_card": "/play/find-card",
+            "batch": "/play/batch",
+            "odds": "/odds",
+            "jobs": "/jobs",
+            "admission": "/admission",
+            "lobby": "/lobby/ws",
+            "random": "/random",
+            "backends": "/backends",
+            "metrics": "/metrics"
         }
     }
 
 
 @app.get("/health")
 async def health():
-    """Health check endpoint."""
-    return {"status": "healthy"}
+    """Health check endpoint; ``warm`` turns true once startup warm-up has finished."""
+    return {"status": "healthy", "warm": _warmed.is_set()}
+
+
+@app.get("/backends")
+async def backends():
+    """
+    Routing table: each configured backend's status, queue and expected wait.
+    
+    Without QISKIT_BACKENDS, only the single QISKIT_BACKEND is reported.
+    """
+    router = get_router()
+    if router is None:
+        return {"routing": False, "backend": resolve_backend_name()}
+    return {"routing": True, **router.snapshot()}
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Stage timings, job/shot/error counters and HTTP latency in Prometheus text format."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
 
 
 @app.post("/play/filter")
-async def play_filter_endpoint(request: FilterRequest):
+async def play_filter_endpoint(request: FilterRequest, http_request: Request):
     """
     Play the Filter quantum game.
     
     The player bets quantum chips and the circuit rotates based on that bet.
     Higher bets increase the probability of winning.
     """
-    try:
-        result = play_filter(request.qcount, request.shots)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    shots = _shots(request.shots)
+    async with _admit(http_request, "live", shots * circuit_cost("filter"), shots):
+        try:
+            result = await play_filter_async(request.qcount, request.shots)
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.post("/play/entangled-wager")
-async def play_entangled_wager_endpoint(request: EntangledWagerRequest):
+async def play_entangled_wager_endpoint(request: EntangledWagerRequest, http_request: Request):
     """
     Play the Entangled Wager quantum game.
     
     Two players bet quantum chips. The game creates an entangled pair
     and measures to determine the winner based on quantum correlations.
     """
+    shots = _shots(request.shots)
+    async with _admit(http_request, "live", shots * circuit_cost("entangled_wager"), shots):
+        try:
+            result = await play_entangled_wager_async(request.qa, request.qb, request.shots)
+            return result
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/play/slots")
+async def play_slots_endpoint(request: SlotsRequest, http_request: Request):
+    """
+    Play the Slots quantum game.
+    
+    Each reel is a rotated qubit and each shot is one spin, paid from the
+    default paytable (see `GET /slots/paytable`). The round pays the bet
+    times `return_multiplier`, the average pay over all spins.
+    """
     try:
-        result = play_entangled_wager(request.qa, request.qb, request.shots)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        slots_angles(request.reels, request.angles)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    shots = _shots(request.shots)
+    async with _admit(http_request, "live", shots * circuit_cost("slots", request.reels), shots):
+        try:
+            return await play_slots_async(request.reels, request.angles, request.shots)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/slots/paytable")
+async def slots_paytable(reels: int = Query(5, description="Number of reels", ge=1, le=MAX_REELS)):
+    """Paylines and scatter pays of the default paytable for a machine size."""
+    return Paytable.default(reels).to_dict()
+
+
+@app.post("/play/find-card")
+async def play_find_card_endpoint(request: FindCardRequest, http_request: Request):
+    """
+    Play Find the Card.
+    
+    The house hides a card in a Grover oracle and the search reveals it;
+    a correct guess pays 0.95x the deck size.
+    """
+    try:
+        validate_find_card(request.qubits, request.guess)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    shots = _shots(request.shots)
+    async with _admit(http_request, "live", shots * circuit_cost("grover", request.qubits), shots):
+        try:
+            return await play_find_card_async(request.qubits, request.guess, request.shots)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/play/batch")
+async def play_batch_endpoint(request: BatchPlayRequest, http_request: Request):
+    """
+    Play a list of mixed Filter and Entangled Wager rounds.
+    
+    All plays run in a single sampler job; results come back in request order.
+    Batches are admitted at the analytics tier, behind live play.
+    """
+    shots = [play.shots or _shots(request.shots) for play in request.plays]
+    cost = sum(n * circuit_cost(play.game) for play, n in zip(request.plays, shots))
+    async with _admit(http_request, "analytics", cost, sum(shots)):
+        try:
+            results = await play_batch_async(
+                [play.model_dump(exclude_none=True) for play in request.plays], request.shots
+            )
+            return {"results": results}
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.get("/odds")
+async def odds(
+    http_request: Request,
+    game: Optional[Literal["filter", "entangled_wager"]] = Query(None, description="Only this game's table"),
+    shots: Optional[int] = Query(None, description="Shots per bet (default ODDS_SHOTS)", ge=100, le=10000),
+    backend: Optional[str] = Query(None, description="Local engine to estimate on, e.g. local:noisy:fake_sherbrooke")
+):
+    """
+    Estimated per-shot odds for every bet: each Filter qcount and each Entangled Wager (qa, qb).
+    
+    All bets are measured in one parameter-sweep job, cached per backend for
+    ODDS_TTL_SECONDS; `cached` and `age_s` say how fresh the table is.
+    `backend` picks a local engine instead of the configured backend, so
+    `local:noisy:<device>` gives that device's noisy odds without a QPU job.
+    """
+    if backend is not None and not backend.startswith(LOCAL_PREFIX):
+        raise HTTPException(status_code=400, detail=f"Only local engines can be chosen per request ('{LOCAL_PREFIX}...')")
+    
+    # Tables are mostly served from cache, so odds only take a run slot and give way to live play
+    async with _admit(http_request, "odds"):
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(get_executor(), partial(get_odds, game, shots, backend))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+
+@app.post("/jobs", status_code=202)
+async def create_job(request: JobRequest, http_request: Request):
+    """
+    Submit a play and return a ticket immediately.
+    
+    Poll `GET /jobs/{id}` or stream `GET /jobs/{id}/events` for the result.
+    """
+    shots = _shots(request.shots)
+    slot = _admit(http_request, "live", shots * circuit_cost(request.game), shots)
+    
+    # Build the play only once it runs, so a full queue leaves no coroutine unawaited
+    if request.game == "filter":
+        play = partial(play_filter_async, request.qcount, request.shots)
+    else:
+        play = partial(play_entangled_wager_async, request.qa, request.qb, request.shots)
+    
+    try:
+        ticket = get_job_store().submit(_run_admitted(slot, play))
+    except JobQueueFull as e:
+        slot.release()
+        raise HTTPException(status_code=503, detail=str(e))
+    
+    return {"id": ticket.id, "status": ticket.status, "url": f"/jobs/{ticket.id}"}
+
+
+async def _run_admitted(slot: Slot, play: Callable[[], Awaitable[Dict[str, Any]]]):
+    async with slot:
+        return await play()
+
+
+@app.get("/admission")
+async def admission_stats():
+    """Admission queue depth, shed counts and QPU-seconds budget."""
+    return get_admission().snapshot()
+
+
+@app.get("/jobs/{job_id}")
+async def get_job(job_id: str, wait: float = 0.0):
+    """
+    Get the status (and result, once finished) of a submitted play.
+    
+    Pass `wait` (seconds, max 30) to long-poll until the play finishes.
+    """
+    ticket = get_job_store().get(job_id)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    
+    if wait > 0:
+        await ticket.wait(min(wait, 30.0))
+    
+    return ticket.to_dict()
+
+
+@app.get("/jobs/{job_id}/events")
+async def stream_job(job_id: str):
+    """Stream the status of a submitted play as server-sent events."""
+    ticket = get_job_store().get(job_id)
+    if ticket is None:
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    
+    async def events():
+        yield f"event: status\ndata: {json.dumps({'id': ticket.id, 'status': ticket.status})}\n\n"
+        # Heartbeat comments keep proxies from closing the idle stream
+        while not await ticket.wait(15.0):
+            yield ": keep-alive\n\n"
+        yield f"event: {ticket.status}\ndata: {json.dumps(ticket.to_dict(), default=to_jsonable)}\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
+@app.websocket("/lobby/ws")
+async def lobby_socket(websocket: WebSocket):
+    """
+    Queue for an Entangled Wager match against another player.
+    
+    Send `{"qcount": n}` (1-20). The server replies with a `queued` event,
+    then one `result` (your side of the match) or `timeout` event, and
+    closes the socket. Closing early leaves the queue.
+    
+    Each player is admitted at the live tier when they queue, paying for
+    half of the match circuit; a shed player gets an `error` event with
+    `retry_after` and the socket closes with code 1013.
+    """
+    await websocket.accept()
+    try:
+        message = await websocket.receive_json()
+        qcount = validate_qcount(message.get("qcount") if isinstance(message, dict) else None)
+    except (ValueError, WebSocketDisconnect) as e:
+        if not isinstance(e, WebSocketDisconnect):
+            await websocket.send_json({"event": "error", "detail": str(e)})
+            await websocket.close(code=1008)
+        return
+    
+    lobby = get_lobby()
+    shots = _shots(lobby.shots)
+    try:
+        # The two sides share one circuit, so each pays for half of it
+        slot = _admit(websocket, "live", shots * circuit_cost("entangled_wager") / 2, shots // 2)
+    except HTTPException as e:
+        await websocket.send_json({"event": "error", "detail": e.detail,
+                                   "retry_after": int(e.headers["Retry-After"])})
+        await websocket.close(code=1013)
+        return
+    
+    try:
+        player = lobby.join(qcount)
+    except LobbyFull as e:
+        slot.release()
+        await websocket.send_json({"event": "error", "detail": str(e)})
+        await websocket.close(code=1013)
+        return
+    
+    await websocket.send_json({"event": "queued", "player_id": player.id, "waiting": lobby.waiting})
+    
+    # Wait for the match while watching for the client going away
+    settled = asyncio.ensure_future(player.wait())
+    received = None
+    try:
+        while not settled.done():
+            received = asyncio.ensure_future(websocket.receive())
+            await asyncio.wait((settled, received), return_when=asyncio.FIRST_COMPLETED)
+            if received.done() and received.result()["type"] == "websocket.disconnect":
+                lobby.leave(player.id)
+                return
+        try:
+            event = settled.result()
+        except Exception as e:
+            event = {"event": "error", "player_id": player.id, "detail": str(e)}
+        await websocket.send_text(json.dumps(event, default=to_jsonable))
+        await websocket.close()
+    finally:
+        slot.release()
+        settled.cancel()
+        if received is not None:
+            received.cancel()
+
+
+@app.get("/lobby")
+async def lobby_stats():
+    """Players waiting per stake bracket and matches settled by the lobby."""
+    return get_lobby().snapshot()
+
+
+@app.get("/random")
+async def random_bits(bits: int = Query(32, description="Number of random bits", ge=1, le=4096)):
+    """
+    Get quantum random bits from the pre-filled entropy pool.
+    
+    Served from the buffer without waiting on a QPU job; the audit block
+    lists the job IDs the bits were measured in.
+    """
+    try:
+        return draw_random_bits(bits)
+    except EntropyExhausted:
+        pass
+    
+    # Pool is short (e.g. right after startup): wait briefly for a refill off the event loop
+    try:
+        return await asyncio.to_thread(draw_random_bits, bits, 10.0)
+    except EntropyExhausted as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
 
 
 if __name__ == "__main__":
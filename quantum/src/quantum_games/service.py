@@ -1,20 +1,38 @@
 """Core quantum service initialization and runtime helpers."""
 
-import os
-from typing import Optional
-from dotenv import load_dotenv
-from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
-from qiskit_ibm_runtime.fake_provider import FakeProvider
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from .engines import LocalEngine, get_engine, parse_backend_spec, simulate_latency
+from .metrics import SAMPLER_JOBS, SAMPLER_PUBS, SHOTS, observe_stage, timed
+from .results import Counts
+from .settings import get_settings
+from .snapshots import BackendSnapshot, get_snapshot_store
 
-# Load environment variables
-load_dotenv()
+if TYPE_CHECKING:
+    # qiskit_ibm_runtime takes most of a second to import; it is only loaded
+    # once a runtime (ibm: or fake:) backend is actually used
+    from qiskit_ibm_runtime import QiskitRuntimeService, SamplerV2 as Sampler
+
+logger = logging.getLogger(__name__)
 
 # Global service instance
-_service: Optional[QiskitRuntimeService] = None
-_backend_cache = {}
+_service: Optional["QiskitRuntimeService"] = None
+# backend name -> (backend, fetched_at monotonic time)
+_backend_cache: Dict[str, Tuple[object, float]] = {}
+# backend name -> (sampler, session/batch or None)
+_sampler_cache: Dict[str, Tuple["Sampler", Optional[object]]] = {}
+_cache_lock = threading.RLock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+EXECUTION_MODES = ("job", "session", "batch")
 
 
-def get_service() -> QiskitRuntimeService:
+def get_service() -> "QiskitRuntimeService":
     """
     Initialize and return the QiskitRuntimeService instance.
     Uses IBM Cloud authentication with API key and instance CRN from environment.
@@ -25,8 +43,9 @@ def get_service() -> QiskitRuntimeService:
     global _service
     
     if _service is None:
-        api_key = os.getenv("IBM_CLOUD_API_KEY")
-        instance_crn = os.getenv("QISKIT_INSTANCE_CRN")
+        settings = get_settings()
+        api_key = settings.ibm_cloud_api_key
+        instance_crn = settings.qiskit_instance_crn
         
         if not api_key or not instance_crn:
             raise ValueError(
@@ -34,6 +53,8 @@ def get_service() -> QiskitRuntimeService:
                 "IBM_CLOUD_API_KEY and QISKIT_INSTANCE_CRN"
             )
         
+        from qiskit_ibm_runtime import QiskitRuntimeService
+        
         _service = QiskitRuntimeService(
             channel="ibm_cloud",
             token=api_key,
@@ -43,75 +64,321 @@ def get_service() -> QiskitRuntimeService:
     return _service
 
 
+def resolve_backend_name(name: Optional[str] = None) -> str:
+    """Return the given backend name, or QISKIT_BACKEND from env if None."""
+    return name or get_settings().qiskit_backend
+
+
 def get_backend(name: Optional[str] = None):
     """
     Get a backend by name, or use the default from environment.
     
+    Names prefixed with "local:" (e.g. 'local:analytic', 'local:statevector')
+    resolve to an in-process engine and need no credentials. Names prefixed
+    with "fake:" (e.g. 'fake:fake_manila') resolve to a snapshot backend from
+    the runtime fake provider, which runs locally with realistic noise and
+    coupling. Names prefixed with "snapshot:" (e.g. 'snapshot:ibm_kyiv')
+    simulate an IBM backend offline from its BACKEND_SNAPSHOT_DIR snapshot.
+    Names prefixed with "ibm:" or without a prefix are looked up on IBM
+    Quantum.
+    
     Args:
-        name: Backend name (e.g., 'ibm_oslo', 'ibm_perth'). 
+        name: Backend name (e.g., 'ibm_oslo', 'ibm:ibm_perth', 'local:analytic'). 
               If None, uses QISKIT_BACKEND from env.
     
+    IBM backends are cached for BACKEND_CACHE_TTL seconds (default 900) and
+    then re-fetched, so calibration and status updates are picked up. With
+    BACKEND_SNAPSHOT_DIR set, their configuration, calibration and target
+    come from a snapshot shared by all workers on the host, which one worker
+    re-fetches when it is older than BACKEND_CACHE_TTL.
+    
     Returns:
-        Backend instance
+        Backend instance (or LocalEngine for local backends)
     """
-    backend_name = name or os.getenv("QISKIT_BACKEND", "ibmq_qasm_simulator")
-    
-    if backend_name in _backend_cache:
-        return _backend_cache[backend_name]
+    backend_name = resolve_backend_name(name)
     
-    service = get_service()
-    backend = service.backend(backend_name)
-    _backend_cache[backend_name] = backend
+    with _cache_lock:
+        cached = _backend_cache.get(backend_name)
+        if cached is not None:
+            backend, fetched_at = cached
+            kind, _ = parse_backend_spec(backend_name)
+            if kind != "ibm" or time.monotonic() - fetched_at < get_backend_ttl():
+                return backend
+        
+        kind, resolved_name = parse_backend_spec(backend_name)
+        if kind == "local":
+            backend = get_engine(resolved_name)
+        elif kind == "fake":
+            from qiskit_ibm_runtime.fake_provider import FakeProviderForBackendV2
+            
+            backend = FakeProviderForBackendV2().backend(resolved_name)
+        elif kind == "snapshot":
+            backend = _load_snapshot(resolved_name).to_simulator()
+        else:
+            store = get_snapshot_store()
+            if store is not None:
+                snapshot = store.get(resolved_name, partial(_fetch_snapshot, resolved_name), get_backend_ttl())
+                backend = snapshot.to_backend(get_service())
+            else:
+                backend = get_service().backend(resolved_name)
+            # Samplers hold the old backend object; rebuild them on next use
+            if cached is not None:
+                _close_sampler(backend_name)
+        _backend_cache[backend_name] = (backend, time.monotonic())
     
     return backend
 
 
-def run_sampler(circuits, shots: Optional[int] = None, backend_name: Optional[str] = None, **kwargs):
+def _fetch_snapshot(name: str) -> BackendSnapshot:
+    return BackendSnapshot.from_backend(get_service().backend(name))
+
+
+def _load_snapshot(name: str) -> BackendSnapshot:
+    store = get_snapshot_store()
+    if store is None:
+        raise ValueError("snapshot: backends need BACKEND_SNAPSHOT_DIR to be set")
+    snapshot = store.load(name)
+    if snapshot is None:
+        raise ValueError(
+            f"No snapshot of '{name}' in {store.directory}; "
+            f"use ibm:{name} once with BACKEND_SNAPSHOT_DIR set to take one"
+        )
+    return snapshot
+
+
+def get_backend_ttl() -> float:
+    """Get the backend cache TTL in seconds from environment."""
+    return get_settings().backend_cache_ttl
+
+
+def get_execution_mode() -> str:
+    """
+    Get the sampler execution mode from SAMPLER_EXECUTION_MODE.
+    
+    "job" (default) submits standalone jobs, "session" runs all jobs in a
+    runtime Session (dedicated QPU access between jobs) and "batch" groups
+    them in a runtime Batch.
+    """
+    mode = get_settings().sampler_execution_mode
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"SAMPLER_EXECUTION_MODE must be one of {EXECUTION_MODES}, got '{mode}'")
+    return mode
+
+
+def get_sampler(backend_name: Optional[str] = None) -> "Sampler":
+    """
+    Get a long-lived SamplerV2 for a backend.
+    
+    Samplers are created once per backend and reused across calls. In
+    "session" or "batch" execution mode the sampler runs inside a shared
+    runtime Session/Batch that is reopened if it expires.
+    
+    Args:
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+    
+    Returns:
+        SamplerV2: The shared sampler
+    """
+    backend_name = resolve_backend_name(backend_name)
+    backend = get_backend(backend_name)
+    
+    with _cache_lock:
+        cached = _sampler_cache.get(backend_name)
+        if cached is not None:
+            return cached[0]
+        
+        from qiskit_ibm_runtime import Batch, SamplerV2 as Sampler, Session
+        
+        mode = get_execution_mode()
+        context = None
+        if mode == "session":
+            context = Session(backend=backend)
+        elif mode == "batch":
+            context = Batch(backend=backend)
+        
+        sampler = Sampler(mode=context or backend)
+        _sampler_cache[backend_name] = (sampler, context)
+    
+    return sampler
+
+
+def _close_sampler(backend_name: str):
+    with _cache_lock:
+        cached = _sampler_cache.pop(backend_name, None)
+    if cached is not None and cached[1] is not None:
+        try:
+            cached[1].close()
+        except Exception as e:
+            logger.warning("Failed to close %s context for %s: %s", get_execution_mode(), backend_name, e)
+
+
+def close_samplers():
+    """Close all cached samplers and their sessions/batches."""
+    for backend_name in list(_sampler_cache):
+        _close_sampler(backend_name)
+
+
+def warm_up(backend_names: Optional[List[str]] = None):
+    """
+    Authenticate, fetch backends and create samplers ahead of the first play.
+    
+    Args:
+        backend_names: Backends to warm (uses QISKIT_BACKEND from env if not specified)
+    """
+    for backend_name in backend_names or [resolve_backend_name()]:
+        started = time.perf_counter()
+        backend = get_backend(backend_name)
+        if not isinstance(backend, LocalEngine):
+            get_sampler(backend_name)
+        logger.info("Warmed up %s in %.2fs", backend_name, time.perf_counter() - started)
+
+
+def run_sampler(circuits, shots: Optional[int] = None, backend_name: Optional[str] = None,
+                memory: bool = False, **kwargs):
     """
     Run circuits using the Sampler primitive and return results with metadata.
     
+    Circuits may also be given as SamplerV2 PUBs, i.e. ``(circuit, parameter_values)``
+    tuples. A PUB whose parameter values hold several rows (a sweep) yields a
+    list of counts, one per row.
+    
     Args:
-        circuits: Single circuit or list of circuits to run
+        circuits: Single circuit/PUB or list of circuits/PUBs to run
         shots: Number of shots (uses DEFAULT_SHOTS from env if not specified)
         backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+        memory: Also return per-shot outcomes under "memory", as uint8 arrays of
+                shape (shots, bytes) packed like ``BitArray.array``
         **kwargs: Additional sampler options
     
     Returns:
-        dict: Results with job_id, backend name, shots, and raw counts
+        dict: Results with job_id, backend name, shots, and counts (Counts histograms)
     """
     if shots is None:
-        shots = int(os.getenv("DEFAULT_SHOTS", "1024"))
+        shots = get_settings().default_shots
     
     backend = get_backend(backend_name)
     
-    # Initialize Sampler with the backend
-    sampler = Sampler(backend=backend)
-    
     # Ensure circuits is a list
     if not isinstance(circuits, list):
         circuits = [circuits]
     
+    SAMPLER_JOBS.inc(backend=backend.name)
+    SAMPLER_PUBS.inc(len(circuits), backend=backend.name)
+    SHOTS.inc(sum(_pub_shots(pub, shots) for pub in circuits), backend=backend.name)
+    
+    # Local engines sample in-process and return the same result shape
+    if isinstance(backend, LocalEngine):
+        with timed("execute", backend=backend.name):
+            return backend.run(circuits, shots, memory=memory)
+    
+    # Reuse the long-lived sampler for this backend
+    backend_name = resolve_backend_name(backend_name)
+    sampler = get_sampler(backend_name)
+    
     # Run the sampler job
-    job = sampler.run(circuits, shots=shots, **kwargs)
-    result = job.result()
+    with timed("submit", backend=backend.name):
+        try:
+            job = sampler.run(circuits, shots=shots, **kwargs)
+        except Exception:
+            if get_execution_mode() == "job":
+                raise
+            # The session/batch may have expired; reopen it once and retry
+            _close_sampler(backend_name)
+            job = get_sampler(backend_name).run(circuits, shots=shots, **kwargs)
+    
+    waited = time.perf_counter()
+    with timed("wait", backend=backend.name):
+        result = job.result()
+    _observe_execution(result, time.perf_counter() - waited, backend.name)
     
     # Extract counts from result
     # SamplerV2 returns results differently than V1
     counts_list = []
-    for i, pub_result in enumerate(result):
-        # Get the bitstring counts
-        counts = pub_result.data.meas.get_counts()
-        counts_list.append(counts)
+    memory_list = []
+    with timed("parse", backend=backend.name):
+        for i, pub_result in enumerate(result):
+            # Get the bitstring counts across all classical registers
+            bits = pub_result.join_data()
+            memory_list.append(bits.array)
+            if bits.ndim == 0:
+                counts = Counts.from_memory(bits.array, bits.num_bits)
+            else:
+                # Parameter sweep: one histogram per parameter row
+                bits = bits.reshape(bits.size)
+                counts = [Counts.from_memory(row, bits.num_bits) for row in bits.array]
+            counts_list.append(counts)
     
-    return {
+    output = {
         "job_id": job.job_id(),
         "backend": backend.name,
         "shots": shots,
-        "counts": counts_list[0] if len(counts_list) == 1 else counts_list,
-        "result": result
+        "counts": counts_list[0] if len(counts_list) == 1 else counts_list
     }
+    if memory:
+        output["memory"] = memory_list[0] if len(memory_list) == 1 else memory_list
+    
+    return output
+
+
+def _pub_shots(pub, shots: int) -> int:
+    """Shots a circuit or PUB will run, honouring a per-PUB shots override."""
+    if isinstance(pub, tuple) and len(pub) > 2 and pub[2] is not None:
+        return pub[2]
+    return shots
+
+
+def _observe_execution(result, waited: float, backend_name: str):
+    """Split a job's wait into queue and execution time when the backend reports execution spans."""
+    spans = result.metadata.get("execution", {}).get("execution_spans") if result.metadata else None
+    if not spans:
+        return
+    
+    execution = (spans.stop - spans.start).total_seconds()
+    observe_stage("execute", execution, backend=backend_name)
+    observe_stage("queue", max(0.0, waited - execution), backend=backend_name)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Return the bounded executor used to wait on sampler jobs off the event loop.
+    
+    Its size comes from SAMPLER_MAX_WORKERS (default 8), which caps how many
+    jobs a process waits on at once.
+    
+    Returns:
+        ThreadPoolExecutor: The shared executor
+    """
+    global _executor
+    
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=get_settings().sampler_max_workers,
+            thread_name_prefix="sampler"
+        )
+    
+    return _executor
+
+
+async def run_sampler_async(circuits, shots: Optional[int] = None, backend_name: Optional[str] = None, **kwargs):
+    """
+    Async version of run_sampler that waits for the job in the bounded executor.
+    
+    Args:
+        circuits: Single circuit or list of circuits to run
+        shots: Number of shots (uses DEFAULT_SHOTS from env if not specified)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+        **kwargs: Additional sampler options
+    
+    Returns:
+        dict: Results with job_id, backend name, shots, and raw counts
+    """
+    loop = asyncio.get_running_loop()
+    call = partial(run_sampler, circuits, shots=shots, backend_name=backend_name, **kwargs)
+    result = await loop.run_in_executor(get_executor(), call)
+    await simulate_latency(result["backend"])
+    return result
 
 
 def get_default_shots() -> int:
-    """Get the default number of shots from environment."""
-    return int(os.getenv("DEFAULT_SHOTS", "1024"))
+    """Get the default number of shots from settings (DEFAULT_SHOTS)."""
+    return get_settings().default_shots
@@ -0,0 +1,164 @@
+"""Typed application settings, read once from the environment (and .env)."""
+
+import os
+from dataclasses import dataclass, fields
+from typing import Any, Mapping, Optional, Union, get_args, get_origin
+
+_TRUE = ("1", "true", "yes", "on")
+_FALSE = ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """
+    Process-wide configuration.
+
+    Each field is set from the upper-cased environment variable of the same
+    name (``default_shots`` <- ``DEFAULT_SHOTS``); unset or empty variables
+    keep the default. See .env.example for what each one does.
+    """
+
+    # Runtime service and backends
+    ibm_cloud_api_key: Optional[str] = None
+    qiskit_instance_crn: Optional[str] = None
+    qiskit_backend: str = "ibmq_qasm_simulator"
+    default_shots: int = 1024
+    backend_cache_ttl: float = 900.0
+    backend_snapshot_dir: Optional[str] = None
+    sampler_execution_mode: str = "job"
+    sampler_max_workers: int = 8
+    local_seed: Optional[int] = None
+    local_latency_ms: float = 0.0
+    noisy_backend: str = "fake_sherbrooke"
+    noisy_cache_size: int = 4096
+
+    # Multi-backend routing (enabled by QISKIT_BACKENDS)
+    qiskit_backends: Optional[str] = None
+    route_fallback_backend: str = "local:analytic"
+    route_sla_seconds: float = 30.0
+    route_poll_interval_seconds: float = 30.0
+    route_job_seconds: float = 5.0
+
+    # Templates and batching
+    transpile_optimization_level: int = 1
+    template_cache_size: int = 64
+    batch_window_ms: float = 20.0
+    batch_max_size: int = 32
+    batch_multiplex: bool = False
+    multiplex_max_qubits: int = 64
+
+    # Find the Card: widest deck on backends with gate noise (ideal local engines allow 10 qubits)
+    find_card_max_qubits: int = 4
+
+    # Odds tables
+    odds_shots: int = 4096
+    odds_ttl_seconds: float = 60.0
+
+    # Jobs and entropy
+    job_ttl_seconds: float = 600.0
+    job_max_pending: int = 10000
+    entropy_pool_bytes: int = 65536
+    entropy_low_watermark: Optional[int] = None
+    entropy_high_watermark: Optional[int] = None
+    entropy_shots: int = 8192
+    entropy_backend: Optional[str] = None
+
+    # Entangled Wager matchmaking lobby
+    lobby_tick_ms: float = 50.0
+    lobby_timeout_seconds: float = 60.0
+    lobby_max_waiting: int = 10000
+    lobby_bracket_width: int = 5
+    lobby_shots: Optional[int] = None
+
+    # Admission control
+    admission_client_rate: float = 100000.0
+    admission_client_burst: float = 1000000.0
+    admission_max_inflight: int = 256
+    admission_max_queue: int = 1024
+    admission_qpu_budget_seconds: Optional[float] = None
+    admission_budget_window_seconds: float = 86400.0
+    admission_shot_seconds: float = 0.00025
+    admission_vip_clients: Optional[str] = None
+    admission_api_keys: Optional[str] = None
+
+    # Audit ledger
+    audit_ledger_dir: Optional[str] = None
+    audit_segment_mb: float = 64.0
+    audit_fsync_interval_ms: float = 200.0
+
+    # Server and observability
+    warm_up_on_startup: bool = True
+    metrics_enabled: bool = True
+    profile_requests: bool = False
+    profile_interval_ms: float = 5.0
+    profile_dir: Optional[str] = None
+
+    @classmethod
+    def from_env(cls, environ: Optional[Mapping[str, str]] = None) -> "Settings":
+        """
+        Build settings from environment variables.
+
+        Args:
+            environ: Variables to read (uses os.environ if not specified)
+
+        Returns:
+            Settings: Parsed settings
+
+        Raises:
+            ValueError: If a variable can't be parsed as its field's type
+        """
+        environ = os.environ if environ is None else environ
+        values = {}
+        for field in fields(cls):
+            raw = environ.get(field.name.upper())
+            if raw:
+                values[field.name] = _parse(field.name.upper(), field.type, raw)
+        return cls(**values)
+
+
+def _parse(name: str, kind: Any, raw: str) -> Any:
+    """Convert one variable to its field type (Optional[X] parses as X)."""
+    if get_origin(kind) is Union:
+        kind = next(arg for arg in get_args(kind) if arg is not type(None))
+
+    if kind is bool:
+        if raw.strip().lower() in _TRUE:
+            return True
+        if raw.strip().lower() in _FALSE:
+            return False
+        raise ValueError(f"{name} must be a boolean (1/0, true/false), got '{raw}'")
+
+    try:
+        return kind(raw)
+    except ValueError:
+        raise ValueError(f"{name} must be {kind.__name__}, got '{raw}'") from None
+
+
+_settings: Optional[Settings] = None
+
+
+def get_settings() -> Settings:
+    """
+    Return the process settings, loading .env and the environment on first use.
+
+    Returns:
+        Settings: The shared settings instance
+    """
+    global _settings
+
+    if _settings is None:
+        # Deferred so importing the package doesn't touch the filesystem
+        from dotenv import load_dotenv
+
+        load_dotenv()
+        _settings = Settings.from_env()
+
+    return _settings
+
+
+def reload_settings() -> Settings:
+    """Re-read settings from the environment (e.g. after tests change it)."""
+    global _settings
+
+    _settings = None
+    return get_settings()
@@ -0,0 +1,276 @@
+"""Vectorized Monte Carlo simulation of game payouts (RTP, variance, risk of ruin)."""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .circuits import entangled_theta, filter_theta, make_entangled_pair
+from .engines import get_engine
+
+# Filter payout multiplier cap (mirrors games.compute_payout)
+MAX_FILTER_MULTIPLIER = 10.0
+
+# Rounds simulated per NumPy chunk; statistics are accumulated chunk by chunk,
+# so memory stays bounded however many rounds are run
+CHUNK_ROUNDS = 1_000_000
+
+
+def filter_payouts(ones: np.ndarray, shots: int) -> np.ndarray:
+    """
+    Vectorized ``compute_payout`` for the Filter game, per unit bet.
+
+    Args:
+        ones: Number of |1⟩ shots in each round
+        shots: Shots per round
+
+    Returns:
+        np.ndarray: Payout per unit bet for each round
+    """
+    ones = np.asarray(ones)
+    win = ones > (shots - ones)
+    # win implies ones > 0, so the division is safe where it's used
+    multiplier = np.minimum(MAX_FILTER_MULTIPLIER, shots / np.maximum(ones, 1))
+    return np.where(win, multiplier, 0.0)
+
+
+def entangled_payouts(correlated: np.ndarray, shots: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized ``compute_payout`` for the Entangled Wager, per unit bet and seat.
+
+    The winning seat receives 2x its bet, a tie returns the bet, and the
+    losing seat receives nothing.
+
+    Args:
+        correlated: Number of 00/11 shots in each round
+        shots: Shots per round
+
+    Returns:
+        tuple: (player A payouts, player B payouts)
+    """
+    correlated = np.asarray(correlated)
+    anticorrelated = shots - correlated
+    payout_a = np.where(correlated > anticorrelated, 2.0, np.where(correlated == anticorrelated, 1.0, 0.0))
+    payout_b = np.where(anticorrelated > correlated, 2.0, np.where(correlated == anticorrelated, 1.0, 0.0))
+    return payout_a, payout_b
+
+
+def filter_win_probability(qcount: int) -> float:
+    """Per-shot probability of measuring |1⟩ in the Filter circuit."""
+    return math.sin(filter_theta(qcount) / 2) ** 2
+
+
+@lru_cache(maxsize=None)
+def entangled_correlation_probability(qcount_a: int, qcount_b: int, engine: str = "analytic") -> float:
+    """Per-shot probability of a correlated (00/11) outcome in the Entangled Wager circuit."""
+    circuit, _ = make_entangled_pair(entangled_theta(qcount_a, qcount_b))
+    probs = get_engine(engine).probabilities(circuit)
+    return float(probs[0b00] + probs[0b11])
+
+
+def summarize(payouts: np.ndarray, bankrolls: Sequence[int] = (10, 50, 100),
+              session_rounds: int = 1000) -> Dict[str, Any]:
+    """
+    Summarize per-round payouts for a player betting one unit each round.
+
+    Risk of ruin is the fraction of sessions of ``session_rounds`` consecutive
+    rounds in which the player's running net loss reaches the bankroll.
+
+    Args:
+        payouts: Payout per unit bet for each round
+        bankrolls: Starting bankrolls (in bet units) to report risk of ruin for
+        session_rounds: Rounds per simulated session
+
+    Returns:
+        dict: rtp, house_edge, variance, std, rounds and risk_of_ruin per bankroll
+    """
+    summary = _Summary(bankrolls, session_rounds)
+    summary.add(payouts)
+    return summary.result()
+
+
+class _Summary:
+    """Running ``summarize`` statistics, fed one chunk of rounds at a time."""
+
+    def __init__(self, bankrolls: Sequence[int], session_rounds: int):
+        self.bankrolls = bankrolls
+        self.session_rounds = session_rounds
+        self.rounds = 0
+        self.mean = 0.0
+        # Sum of squared deviations from the mean, merged per chunk (Chan et al.)
+        self.m2 = 0.0
+        self.sessions = 0
+        self.ruined = {bankroll: 0 for bankroll in bankrolls}
+
+    def add(self, payouts: np.ndarray):
+        """Fold in a chunk; only its whole sessions count towards risk of ruin."""
+        net = np.asarray(payouts) - 1.0
+        n = len(net)
+        if n == 0:
+            return
+
+        mean = float(net.mean())
+        total = self.rounds + n
+        delta = mean - self.mean
+        self.m2 += float(np.square(net - mean).sum()) + delta * delta * self.rounds * n / total
+        self.mean += delta * n / total
+        self.rounds = total
+
+        sessions = n // self.session_rounds
+        if sessions:
+            running = np.cumsum(net[:sessions * self.session_rounds].reshape(sessions, self.session_rounds), axis=1)
+            worst = running.min(axis=1)
+            self.sessions += sessions
+            for bankroll in self.bankrolls:
+                self.ruined[bankroll] += int((worst <= -bankroll).sum())
+
+    def result(self) -> Dict[str, Any]:
+        rtp = self.mean + 1.0 if self.rounds else math.nan
+        variance = self.m2 / self.rounds if self.rounds else math.nan
+        risk_of_ruin = {}
+        if self.sessions:
+            risk_of_ruin = {bankroll: ruined / self.sessions for bankroll, ruined in self.ruined.items()}
+
+        return {
+            "rounds": self.rounds,
+            "rtp": rtp,
+            "house_edge": 1.0 - rtp,
+            "variance": variance,
+            "std": math.sqrt(variance),
+            "risk_of_ruin": risk_of_ruin
+        }
+
+
+def simulate_filter(qcount: int, shots: int, rounds: int, seed: Optional[int] = None,
+                    bankrolls: Sequence[int] = (10, 50, 100), session_rounds: int = 1000) -> Dict[str, Any]:
+    """
+    Simulate Filter rounds with binomially drawn shot counts.
+
+    Args:
+        qcount: Quantum chips bet
+        shots: Shots per round
+        rounds: Number of rounds
+        seed: RNG seed
+        bankrolls: Bankrolls for the risk-of-ruin table
+        session_rounds: Rounds per risk-of-ruin session
+
+    Returns:
+        dict: Grid point parameters plus the summary statistics
+    """
+    rng = np.random.default_rng(seed)
+    p = filter_win_probability(qcount)
+    summary = _Summary(bankrolls, session_rounds)
+    for n in _chunks(rounds, session_rounds):
+        summary.add(filter_payouts(rng.binomial(shots, p, size=n), shots))
+
+    return {"game": "filter", "qcount": qcount, "shots": shots, "p_one": p, **summary.result()}
+
+
+def simulate_entangled(qcount_a: int, qcount_b: int, shots: int, rounds: int, seed: Optional[int] = None,
+                       bankrolls: Sequence[int] = (10, 50, 100), session_rounds: int = 1000) -> Dict[str, Any]:
+    """
+    Simulate Entangled Wager rounds with binomially drawn correlation counts.
+
+    Args:
+        qcount_a: Player A quantum chips
+        qcount_b: Player B quantum chips
+        shots: Shots per round
+        rounds: Number of rounds
+        seed: RNG seed
+        bankrolls: Bankrolls for the risk-of-ruin table
+        session_rounds: Rounds per risk-of-ruin session
+
+    Returns:
+        dict: Grid point parameters plus a summary per seat
+    """
+    rng = np.random.default_rng(seed)
+    p = entangled_correlation_probability(qcount_a, qcount_b)
+    player_a, player_b = _Summary(bankrolls, session_rounds), _Summary(bankrolls, session_rounds)
+    for n in _chunks(rounds, session_rounds):
+        payout_a, payout_b = entangled_payouts(rng.binomial(shots, p, size=n), shots)
+        player_a.add(payout_a)
+        player_b.add(payout_b)
+
+    return {"game": "entangled_wager", "qcount_a": qcount_a, "qcount_b": qcount_b, "shots": shots,
+            "p_correlated": p, "player_a": player_a.result(), "player_b": player_b.result()}
+
+
+def _chunks(rounds: int, session_rounds: int) -> Iterable[int]:
+    # Whole sessions per chunk, so no risk-of-ruin session straddles two chunks
+    size = max(session_rounds, CHUNK_ROUNDS - CHUNK_ROUNDS % session_rounds)
+    for start in range(0, rounds, size):
+        yield min(size, rounds - start)
+
+
+def _simulate_point(task: Tuple[str, tuple, int, int, int]) -> Dict[str, Any]:
+    game, params, shots, rounds, seed = task
+    if game == "filter":
+        return simulate_filter(params[0], shots, rounds, seed)
+    return simulate_entangled(params[0], params[1], shots, rounds, seed)
+
+
+def run_sweep(game: str, shots_list: Sequence[int], rounds: int, qcounts: Sequence[int] = range(1, 21),
+              seed: Optional[int] = None, workers: int = 1) -> List[Dict[str, Any]]:
+    """
+    Simulate a game over its full parameter grid.
+
+    The filter grid is every qcount x shots; the entangled grid is every
+    (qa, qb) pair from ``qcounts`` x shots. Grid points run in a process pool
+    when ``workers > 1``, each with an independent seed.
+
+    Args:
+        game: "filter" or "entangled_wager"
+        shots_list: Shot counts to simulate
+        rounds: Rounds per grid point
+        qcounts: Quantum chip values (default 1-20)
+        seed: Base RNG seed
+        workers: Number of processes
+
+    Returns:
+        list: One result dict per grid point
+    """
+    if game == "filter":
+        grid = [(q,) for q in qcounts]
+    elif game == "entangled_wager":
+        grid = [(qa, qb) for qa in qcounts for qb in qcounts]
+    else:
+        raise ValueError(f"Unknown game '{game}'. Use 'filter' or 'entangled_wager'")
+
+    points = [(params, shots) for params in grid for shots in shots_list]
+    seeds = np.random.SeedSequence(seed).generate_state(len(points))
+    tasks = [(game, params, shots, rounds, int(s)) for (params, shots), s in zip(points, seeds)]
+
+    if workers <= 1:
+        return [_simulate_point(task) for task in tasks]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_simulate_point, tasks, chunksize=max(1, len(tasks) // (workers * 4))))
+
+
+def format_table(results: List[Dict[str, Any]]) -> str:
+    """Render sweep results as a plain-text table."""
+    bankrolls = sorted({b for r in results for s in _seats(r) for b in s[1]["risk_of_ruin"]})
+    header = f"{'params':<14} {'seat':<5} {'shots':>6} {'RTP':>8} {'edge':>8} {'std':>7}"
+    header += "".join(f" {'RoR@' + str(b):>8}" for b in bankrolls)
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        if result["game"] == "filter":
+            params = f"q={result['qcount']}"
+        else:
+            params = f"qa={result['qcount_a']},qb={result['qcount_b']}"
+        for seat, summary in _seats(result):
+            row = (f"{params:<14} {seat:<5} {result['shots']:>6} {summary['rtp']:>8.4f} "
+                   f"{summary['house_edge']:>8.4f} {summary['std']:>7.3f}")
+            row += "".join(f" {summary['risk_of_ruin'].get(b, float('nan')):>8.4f}" for b in bankrolls)
+            lines.append(row)
+
+    return "\n".join(lines)
+
+
+def _seats(result: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    if result["game"] == "filter":
+        return [("-", result)]
+    return [("A", result["player_a"]), ("B", result["player_b"])]
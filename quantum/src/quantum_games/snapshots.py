@@ -0,0 +1,334 @@
+"""Shared on-disk backend snapshots: configuration, calibration and target, refreshed by one process."""
+
+import json
+import logging
+import mmap
+import os
+import pickle
+import re
+import struct
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, Optional
+
+from .settings import get_settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows: every process refreshes on its own
+    fcntl = None
+
+if TYPE_CHECKING:
+    from qiskit_ibm_runtime import IBMBackend, QiskitRuntimeService
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"QBSNAP1\n"
+# magic, header length; then the JSON header, then the pickled payload
+_PREFIX = struct.Struct("<8sI")
+
+_NAME = re.compile(r"^[\w.-]+$")
+
+# qiskit-ibm-runtime minor versions whose IBMBackend internals _preload_ibm_backend
+# has been checked against; on any other version backends are fetched normally
+PRELOAD_RUNTIME_VERSIONS = ("0.43",)
+
+
+def _runtime_version() -> str:
+    from qiskit_ibm_runtime import __version__
+    return __version__
+
+
+class BackendSnapshot:
+    """
+    A backend's configuration, calibration (properties) and transpiler target.
+
+    Args:
+        name: Backend name
+        configuration: Backend configuration
+        properties: Backend properties (None for simulators)
+        target: Transpiler target built from the two
+        version: Calibration timestamp the snapshot was taken at
+        fetched_at: Wall-clock time it was fetched (or last confirmed current)
+    """
+
+    __slots__ = ("name", "configuration", "properties", "target", "version", "fetched_at")
+
+    def __init__(self, name: str, configuration: Any, properties: Any, target: Any,
+                 version: str, fetched_at: Optional[float] = None):
+        self.name = name
+        self.configuration = configuration
+        self.properties = properties
+        self.target = target
+        self.version = version
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+
+    @classmethod
+    def from_backend(cls, backend) -> "BackendSnapshot":
+        """Snapshot a runtime (or fake) backend; fetches its properties and target."""
+        properties = backend.properties()
+        version = properties.last_update_date.isoformat() if properties is not None else ""
+        return cls(backend.name, backend.configuration(), properties, backend.target, version)
+
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was fetched."""
+        return time.time() - self.fetched_at
+
+    def to_backend(self, service: "QiskitRuntimeService", instance: Optional[str] = None) -> "IBMBackend":
+        """
+        Build a job-ready IBMBackend without fetching configuration or calibration.
+
+        On qiskit-ibm-runtime versions outside PRELOAD_RUNTIME_VERSIONS the
+        backend is fetched from the service instead.
+
+        Args:
+            service: Authenticated runtime service the backend submits through
+            instance: Instance CRN (uses QISKIT_INSTANCE_CRN if not specified)
+
+        Returns:
+            IBMBackend: Backend with the snapshot's properties and target preloaded
+        """
+        instance = instance or get_settings().qiskit_instance_crn
+        backend = _preload_ibm_backend(self, service, instance)
+        if backend is None:
+            logger.warning("qiskit-ibm-runtime %s isn't supported for snapshot preloading; fetching %s",
+                           _runtime_version(), self.name)
+            backend = service.backend(self.name, instance=instance)
+        return backend
+
+    def to_simulator(self):
+        """
+        Build a local noisy simulator of the backend (works offline).
+
+        Returns:
+            FakeBackendV2: Fake backend whose noise model comes from the snapshot's calibration
+        """
+        return _simulator_class()(self)
+
+
+def _preload_ibm_backend(snapshot: BackendSnapshot, service: "QiskitRuntimeService",
+                         instance: Optional[str]) -> Optional["IBMBackend"]:
+    """
+    Build an IBMBackend with a snapshot's calibration and target already cached.
+
+    The one place that reaches into qiskit-ibm-runtime internals: the
+    service's active API client and the backend's ``_properties`` and
+    ``_target`` caches.
+
+    Returns:
+        IBMBackend: The preloaded backend, or None if the installed runtime
+                    isn't a version this has been checked against
+    """
+    checked = ".".join(_runtime_version().split(".")[:2]) in PRELOAD_RUNTIME_VERSIONS
+    if not checked or not hasattr(service, "_active_api_client"):
+        return None
+
+    from qiskit_ibm_runtime import IBMBackend
+
+    backend = IBMBackend(configuration=snapshot.configuration, service=service,
+                         api_client=service._active_api_client, instance=instance)
+    backend._properties = snapshot.properties
+    backend._target = snapshot.target
+    return backend
+
+
+_SimulatorClass = None
+
+
+def _simulator_class():
+    """FakeBackendV2 subclass fed from a snapshot instead of bundled JSON files."""
+    global _SimulatorClass
+
+    if _SimulatorClass is None:
+        from qiskit_ibm_runtime.fake_provider.fake_backend import FakeBackendV2
+
+        class SnapshotSimulator(FakeBackendV2):
+            def __init__(self, snapshot: BackendSnapshot):
+                self._snapshot = snapshot
+                self.backend_name = snapshot.name
+                super().__init__()
+
+            def _get_conf_dict_from_json(self) -> dict:
+                return self._snapshot.configuration.to_dict()
+
+            def _set_props_dict_from_json(self):
+                properties = self._snapshot.properties
+                self._props_dict = properties.to_dict() if properties is not None else None
+
+        _SimulatorClass = SnapshotSimulator
+
+    return _SimulatorClass
+
+
+class SnapshotStore:
+    """
+    Directory of backend snapshots shared by every worker on a host.
+
+    Each backend is one file: a JSON header (name, calibration version,
+    fetch time, runtime version) followed by the pickled snapshot. Files are
+    replaced atomically, so readers never see a partial write. The header is
+    checked before anything is unpickled; each process then unpickles its own
+    copy, so snapshots save API calls and target builds, not memory. When a snapshot goes stale, the first process to take
+    its lock file refetches it; the others keep using the stale one meanwhile
+    (or, with no snapshot at all, wait for the refresh). Snapshots written
+    by a different qiskit-ibm-runtime version are ignored.
+
+    Only point this at a directory the service alone can write: snapshots are
+    unpickled on load.
+
+    Args:
+        directory: Directory holding the snapshot files
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        if not _NAME.match(name):
+            raise ValueError(f"Invalid backend name for a snapshot: '{name}'")
+        return os.path.join(self.directory, f"{name}.snapshot")
+
+    def header(self, name: str) -> Optional[Dict[str, Any]]:
+        """The snapshot's header without loading it, or None if missing/unreadable."""
+        try:
+            with open(self.path(name), "rb") as f:
+                prefix = f.read(_PREFIX.size)
+                magic, length = _PREFIX.unpack(prefix)
+                if magic != _MAGIC:
+                    return None
+                return json.loads(f.read(length))
+        except (OSError, ValueError, struct.error):
+            return None
+
+    def load(self, name: str) -> Optional[BackendSnapshot]:
+        """
+        Load a snapshot.
+
+        Returns:
+            BackendSnapshot: The snapshot, or None if it is missing, corrupt or
+            was written by another qiskit-ibm-runtime version
+        """
+        try:
+            with open(self.path(name), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                magic, length = _PREFIX.unpack_from(view)
+                if magic != _MAGIC:
+                    return None
+                header = json.loads(view[_PREFIX.size:_PREFIX.size + length])
+                if header["runtime"] != _runtime_version():
+                    return None
+                configuration, properties, target = pickle.loads(view[_PREFIX.size + length:])
+        except (OSError, ValueError, struct.error, KeyError, pickle.UnpicklingError, EOFError) as e:
+            logger.warning("Ignoring unreadable snapshot of %s: %s", name, e)
+            return None
+
+        return BackendSnapshot(header["name"], configuration, properties, target,
+                               header["version"], header["fetched_at"])
+
+    def save(self, snapshot: BackendSnapshot):
+        """Write a snapshot, atomically replacing any previous one."""
+        header = json.dumps({
+            "name": snapshot.name,
+            "version": snapshot.version,
+            "fetched_at": snapshot.fetched_at,
+            "runtime": _runtime_version()
+        }).encode()
+        payload = pickle.dumps((snapshot.configuration, snapshot.properties, snapshot.target),
+                               protocol=pickle.HIGHEST_PROTOCOL)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{snapshot.name}.")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(_MAGIC, len(header)))
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, self.path(snapshot.name))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def get(self, name: str, fetch: Callable[[], BackendSnapshot], ttl: float) -> BackendSnapshot:
+        """
+        Return a snapshot no older than ``ttl``, refreshing it at most once across processes.
+
+        Args:
+            name: Backend name
+            fetch: Fetches a new snapshot from the runtime service
+            ttl: Seconds a snapshot is used before it is re-fetched
+
+        Returns:
+            BackendSnapshot: The current snapshot (possibly stale while another
+            process refreshes it)
+        """
+        header = self.header(name)
+        if header is not None and time.time() - header["fetched_at"] < ttl:
+            snapshot = self.load(name)
+            if snapshot is not None:
+                return snapshot
+
+        with self._lock(name, blocking=False) as locked:
+            if locked:
+                return self._refresh(name, fetch, ttl)
+
+        # Another process is refreshing: use what's on disk, or wait for the refresh
+        snapshot = self.load(name)
+        if snapshot is not None:
+            return snapshot
+        with self._lock(name, blocking=True):
+            return self._refresh(name, fetch, ttl)
+
+    def _refresh(self, name: str, fetch: Callable[[], BackendSnapshot], ttl: float) -> BackendSnapshot:
+        # Holding the lock; the previous holder may have just refreshed it
+        current = self.load(name)
+        if current is not None and current.age < ttl:
+            return current
+
+        started = time.perf_counter()
+        snapshot = fetch()
+        if current is not None and current.version == snapshot.version:
+            logger.info("Snapshot of %s still current (calibration %s)", name, snapshot.version)
+        else:
+            logger.info("Fetched snapshot of %s (calibration %s) in %.2fs",
+                        name, snapshot.version, time.perf_counter() - started)
+        self.save(snapshot)
+        return snapshot
+
+    @contextmanager
+    def _lock(self, name: str, blocking: bool) -> Iterator[bool]:
+        if fcntl is None:
+            yield True
+            return
+
+        with open(self.path(name) + ".lock", "a") as f:
+            try:
+                fcntl.flock(f, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+# Global store instance
+_store: Optional[SnapshotStore] = None
+
+
+def get_snapshot_store() -> Optional[SnapshotStore]:
+    """
+    Return the shared snapshot store, or None if BACKEND_SNAPSHOT_DIR isn't set.
+
+    Returns:
+        SnapshotStore: Store in BACKEND_SNAPSHOT_DIR
+    """
+    global _store
+
+    directory = get_settings().backend_snapshot_dir
+    if not directory:
+        return None
+    if _store is None or _store.directory != directory:
+        _store = SnapshotStore(directory)
+    return _store
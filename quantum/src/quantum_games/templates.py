@@ -0,0 +1,196 @@
+"""Parameterized circuit templates, transpiled once per backend and reused across plays."""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple
+
+from .circuits import get_circuit_hash
+from .engines import LocalEngine
+from .service import get_backend, resolve_backend_name, run_sampler
+from .settings import get_settings
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit
+
+GAMES = ("filter", "entangled_pair", "slots", "grover")
+
+
+def get_template(game: str, n_qubits: Optional[int] = None) -> "QuantumCircuit":
+    """
+    Build (once) the logical parameterized circuit for a game.
+
+    The templates mirror ``make_filter_circuit``, ``make_entangled_pair``,
+    ``make_slots_circuit`` and ``build_grover_circuit`` gate for gate, so a
+    bound template hashes the same as the circuit built directly from the
+    same values.
+
+    Args:
+        game: One of "filter", "entangled_pair", "slots" or "grover"
+        n_qubits: Number of reels (slots) or search qubits (grover)
+
+    Returns:
+        QuantumCircuit: Template with unbound parameters
+    """
+    return _build_template(game, n_qubits)
+
+
+@lru_cache(maxsize=None)
+def _build_template(game: str, n_qubits: Optional[int]) -> "QuantumCircuit":
+    from qiskit import QuantumCircuit
+    from qiskit.circuit import Parameter, ParameterVector
+
+    if game == "filter":
+        qc = QuantumCircuit(1, 1)
+        qc.ry(Parameter("theta"), 0)
+        qc.measure(0, 0)
+
+    elif game == "entangled_pair":
+        qc = QuantumCircuit(2, 2)
+        qc.h(0)
+        qc.cx(0, 1)
+        qc.p(Parameter("theta"), 1)
+        qc.measure([0, 1], [0, 1])
+
+    elif game == "slots":
+        if not n_qubits or n_qubits < 1:
+            raise ValueError("Slots template requires n_qubits >= 1")
+        angles = ParameterVector("angle", n_qubits)
+        qc = QuantumCircuit(n_qubits, n_qubits)
+        for i in range(n_qubits):
+            qc.ry(angles[i], i)
+        qc.measure(range(n_qubits), range(n_qubits))
+
+    elif game == "grover":
+        from .grover import build_grover_circuit
+
+        if not n_qubits or n_qubits < 1:
+            raise ValueError("Grover template requires n_qubits >= 1")
+        # The marked card binds as per-qubit oracle angles (see card_flips)
+        qc = build_grover_circuit(n_qubits, ParameterVector("flip", n_qubits))
+
+    else:
+        raise ValueError(f"Unknown template '{game}'. Available: {', '.join(GAMES)}")
+
+    return qc
+
+
+# LRU over _transpile_template, sized from TEMPLATE_CACHE_SIZE on first use
+_transpiled: Optional[Callable[..., "QuantumCircuit"]] = None
+
+
+def _transpiled_template() -> Callable[..., "QuantumCircuit"]:
+    global _transpiled
+
+    if _transpiled is None:
+        _transpiled = lru_cache(maxsize=get_settings().template_cache_size)(_transpile_template)
+    return _transpiled
+
+
+def get_optimization_level() -> int:
+    """Get the transpiler optimization level from settings (TRANSPILE_OPTIMIZATION_LEVEL, default 1)."""
+    return get_settings().transpile_optimization_level
+
+
+def _transpile_template(game: str, backend_name: str, optimization_level: int,
+                        n_qubits: Optional[int]) -> "QuantumCircuit":
+    template = get_template(game, n_qubits)
+    backend = get_backend(backend_name)
+
+    # Local engines take logical circuits directly
+    if isinstance(backend, LocalEngine):
+        return template
+
+    from qiskit.transpiler import generate_preset_pass_manager
+
+    pass_manager = generate_preset_pass_manager(optimization_level=optimization_level, backend=backend)
+    return pass_manager.run(template)
+
+
+def get_transpiled_template(game: str, backend_name: Optional[str] = None,
+                            optimization_level: Optional[int] = None,
+                            n_qubits: Optional[int] = None) -> "QuantumCircuit":
+    """
+    Get a game template transpiled to a backend's ISA, cached per backend.
+
+    Templates are kept in an LRU keyed by (game, backend, optimization level),
+    so transpilation happens once per backend rather than once per play.
+
+    Args:
+        game: One of "filter", "entangled_pair", "slots" or "grover"
+        backend_name: Backend to target (uses QISKIT_BACKEND from env if not specified)
+        optimization_level: Transpiler level (uses TRANSPILE_OPTIMIZATION_LEVEL if not specified)
+        n_qubits: Number of reels (slots) or search qubits (grover)
+
+    Returns:
+        QuantumCircuit: ISA circuit with unbound parameters
+    """
+    if optimization_level is None:
+        optimization_level = get_optimization_level()
+
+    return _transpiled_template()(game, resolve_backend_name(backend_name), optimization_level, n_qubits)
+
+
+def warm_templates(backend_name: Optional[str] = None):
+    """Transpile the per-play game templates for a backend ahead of the first play."""
+    for game in ("filter", "entangled_pair"):
+        get_transpiled_template(game, backend_name)
+
+
+def make_pub(game: str, values: Sequence[float], backend_name: Optional[str] = None,
+             n_qubits: Optional[int] = None) -> Tuple["QuantumCircuit", list]:
+    """
+    Build a sampler PUB that binds parameter values to a cached template.
+
+    ``values`` may be a single parameter set or a 2D sweep (one row per set),
+    in which case the whole sweep runs as one PUB.
+
+    Args:
+        game: One of "filter", "entangled_pair", "slots" or "grover"
+        values: Parameter values in template parameter order
+        backend_name: Backend to target (uses QISKIT_BACKEND from env if not specified)
+        n_qubits: Number of reels (slots) or search qubits (grover)
+
+    Returns:
+        tuple: (transpiled template, parameter values)
+    """
+    return get_transpiled_template(game, backend_name, n_qubits=n_qubits), list(values)
+
+
+@lru_cache(maxsize=4096)
+def template_hash(game: str, values: Tuple[float, ...], n_qubits: Optional[int] = None) -> str:
+    """
+    Audit hash of a template bound to the given parameter values.
+
+    Memoized per parameter set, so repeated plays with the same bet skip
+    binding and hashing entirely.
+
+    Args:
+        game: One of "filter", "entangled_pair", "slots" or "grover"
+        values: Parameter values in template parameter order
+        n_qubits: Number of reels (slots) or search qubits (grover)
+
+    Returns:
+        str: Hexadecimal hash string (matches get_circuit_hash of the built circuit)
+    """
+    return get_circuit_hash(get_template(game, n_qubits).assign_parameters(list(values)))
+
+
+def play_n_qubits(game: str, values: Sequence[float]) -> Optional[int]:
+    """Template width argument for a single play (reel count for slots, search width for grover)."""
+    return len(values) if game in ("slots", "grover") else None
+
+
+def run_plays(plays: Sequence[Tuple[str, Sequence[float]]], shots: Optional[int] = None,
+              backend_name: Optional[str] = None) -> dict:
+    """
+    Run several plays as one sampler job, one PUB per play.
+
+    Args:
+        plays: ``(game, parameter values)`` pairs
+        shots: Number of shots (uses DEFAULT_SHOTS from env if not specified)
+        backend_name: Backend to use (uses QISKIT_BACKEND from env if not specified)
+
+    Returns:
+        dict: run_sampler result with one counts entry per play
+    """
+    pubs = [make_pub(game, values, backend_name, play_n_qubits(game, values)) for game, values in plays]
+    return run_sampler(pubs, shots=shots, backend_name=backend_name)
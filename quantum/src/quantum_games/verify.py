@@ -0,0 +1,236 @@
+"""Bulk audit verification: replay ledger records and report mismatches."""
+
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+from .circuits import entangled_theta, get_circuit_hash, make_entangled_pair, make_filter_circuit, make_slots_circuit
+from .games import compute_payout, entangled_outcome, filter_outcome, find_card_outcome, slots_outcome
+from .grover import build_grover_circuit, card_flips
+from .paytable import Paytable
+from .ledger import AuditLedger, decode_record, record_length
+
+# Relative tolerance when comparing stored floats (theta, payout)
+FLOAT_TOLERANCE = 1e-9
+
+
+@lru_cache(maxsize=4096)
+def expected_circuit(game: str, params: Tuple[int, ...], version: int) -> Tuple[float, str]:
+    """
+    Rebuild a play's circuit with the circuits.py builders and hash it.
+
+    Memoized per parameter set, so each distinct bet is built once per worker.
+
+    Args:
+        game: "filter", "entangled_wager", "slots" or "find_the_card"
+        params: (qcount,), (qcount_a, qcount_b), the per-reel angles or (n_qubits, marked card)
+        version: Circuit hash version the record was written with
+
+    Returns:
+        tuple: (expected theta, or None for slots and find_the_card, expected circuit hash)
+    """
+    if game == "filter":
+        circuit, metadata = make_filter_circuit(params[0])
+        theta = metadata["theta"]
+    elif game == "slots":
+        theta = None
+        circuit, _ = make_slots_circuit(len(params), list(params))
+    elif game == "find_the_card":
+        theta = None
+        circuit = build_grover_circuit(params[0], card_flips(*params))
+    else:
+        theta = entangled_theta(*params)
+        circuit, _ = make_entangled_pair(theta)
+    return theta, get_circuit_hash(circuit, version)
+
+
+def verify_record(record: Dict[str, Any]) -> Dict[str, Tuple[Any, Any]]:
+    """
+    Check one decoded ledger record.
+
+    Verifies that the circuit hash matches the circuit its params build, that
+    the stored angle matches the bet, that the counts add up to the shots, and
+    that the outcome and payout follow from the counts. Slots payouts are
+    checked against the default paytable for the record's reel count; custom
+    paytables are refused for ledgered rounds, so it is the one they paid from.
+
+    Args:
+        record: Record from ``ledger.decode_record``
+
+    Returns:
+        dict: Failed check -> (expected, recorded); empty if the record is consistent
+    """
+    game = record["game_type"]
+    params = record["params"]
+    counts = record["counts"]
+    problems = {}
+
+    if game == "filter":
+        key = (params["qcount"],)
+        outcome = filter_outcome(counts)
+        replayed = {"game_type": game, "outcome": outcome,
+                    "win_probability": counts.get("1", 0) / record["shots"] if record["shots"] else 0.0}
+    elif game == "slots":
+        key = tuple(params["angles"])
+        replayed = {"game_type": game, **slots_outcome(counts, Paytable.default(params["n_reels"]))}
+        outcome = replayed["outcome"]
+    elif game == "find_the_card":
+        key = (params["n_qubits"], params["marked_card"])
+        outcome = find_card_outcome(counts, params["guess"], params["marked_card"])["outcome"]
+        replayed = {"game_type": game, "outcome": outcome, "params": params}
+    else:
+        key = (params["qcount_a"], params["qcount_b"])
+        outcome = entangled_outcome(counts)
+        replayed = {"game_type": game, "outcome": outcome}
+
+    theta, circuit_hash = expected_circuit(game, key, record["audit"]["circuit_hash_version"])
+    if circuit_hash != record["audit"]["circuit_hash"]:
+        problems["circuit_hash"] = (circuit_hash, record["audit"]["circuit_hash"])
+    if theta is not None and not _close(theta, params["theta"]):
+        problems["theta"] = (theta, params["theta"])
+    if sum(counts.values()) != record["shots"]:
+        problems["shots"] = (sum(counts.values()), record["shots"])
+    if outcome != record["outcome"]:
+        problems["outcome"] = (outcome, record["outcome"])
+
+    payout = compute_payout(replayed, 1.0)
+    if not _close(payout, record["payout_per_unit"]):
+        problems["payout"] = (payout, record["payout_per_unit"])
+
+    return problems
+
+
+def _close(a: float, b: float) -> bool:
+    return abs(a - b) <= FLOAT_TOLERANCE * max(1.0, abs(a), abs(b))
+
+
+def verify_chunk(segment: int, base_offset: int, data: bytes) -> Tuple[int, List[Dict[str, Any]]]:
+    """
+    Verify a chunk of raw records (runs in a worker process).
+
+    Args:
+        segment: Segment number the chunk came from
+        base_offset: Byte offset of the chunk within the segment
+        data: Whole records, back to back
+
+    Returns:
+        tuple: (records checked, mismatch entries)
+    """
+    checked, mismatches = 0, []
+    offset = 0
+
+    while offset < len(data):
+        position = {"segment": segment, "offset": base_offset + offset}
+        length = record_length(data, offset)
+        checked += 1
+        try:
+            record = decode_record(data, offset)
+        except ValueError as e:
+            mismatches.append({**position, "problems": {"record": {"expected": "valid record", "recorded": str(e)}}})
+            offset += length
+            continue
+        offset += length
+
+        problems = verify_record(record)
+        if problems:
+            mismatches.append({
+                **position,
+                "job_id": record["audit"]["job_id"],
+                "timestamp": record["audit"]["timestamp"],
+                "game_type": record["game_type"],
+                "problems": {name: {"expected": e, "recorded": r} for name, (e, r) in problems.items()}
+            })
+
+    return checked, mismatches
+
+
+def load_checkpoint(path: Optional[str]) -> Dict[str, Any]:
+    """Read a verification checkpoint, or a fresh one if there is none."""
+    if path and os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {"segment": 0, "offset": 0, "records": 0, "mismatches": 0}
+
+
+def save_checkpoint(path: str, checkpoint: Dict[str, Any]):
+    """Atomically write a verification checkpoint."""
+    tmp = path + ".tmp"
+    with open(tmp, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp, path)
+
+
+def verify_ledger(
+    directory: str,
+    report: TextIO,
+    workers: Optional[int] = None,
+    checkpoint_path: Optional[str] = None,
+    chunk_records: int = 5000,
+    checkpoint_interval_s: float = 10.0,
+    progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Verify every record in an audit ledger in parallel.
+
+    Chunks of raw records are verified in a process pool; results are
+    consumed in ledger order, so the checkpoint always marks a position
+    before which everything has been verified and reported. Rerunning with
+    the same checkpoint resumes from there (append to the same report).
+
+    Args:
+        directory: Ledger directory
+        report: Text stream receiving one JSON line per mismatching record
+        workers: Worker processes (default: CPU count)
+        checkpoint_path: File to resume from and save progress to
+        chunk_records: Records per work unit
+        checkpoint_interval_s: Minimum seconds between checkpoint writes
+        progress: Called with the checkpoint dict after each chunk
+
+    Returns:
+        dict: Final checkpoint (segment, offset, records, mismatches) plus elapsed seconds
+    """
+    checkpoint = load_checkpoint(checkpoint_path)
+    ledger = AuditLedger(directory, read_only=True)
+    workers = workers or os.cpu_count() or 1
+    started = last_saved = time.monotonic()
+
+    def consume(future_and_end):
+        nonlocal last_saved
+        future, (segment, end) = future_and_end
+        checked, mismatches = future.result()
+        for mismatch in mismatches:
+            report.write(json.dumps(mismatch) + "\n")
+        checkpoint.update(
+            segment=segment, offset=end,
+            records=checkpoint["records"] + checked,
+            mismatches=checkpoint["mismatches"] + len(mismatches)
+        )
+        if progress is not None:
+            progress(checkpoint)
+        if checkpoint_path and time.monotonic() - last_saved >= checkpoint_interval_s:
+            report.flush()
+            save_checkpoint(checkpoint_path, checkpoint)
+            last_saved = time.monotonic()
+
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            inflight = deque()
+            chunks = ledger.iter_chunks((checkpoint["segment"], checkpoint["offset"]), chunk_records)
+            for segment, start, end, data in chunks:
+                inflight.append((pool.submit(verify_chunk, segment, start, data), (segment, end)))
+                # Bound memory: keep a couple of chunks queued per worker
+                if len(inflight) >= workers * 2:
+                    consume(inflight.popleft())
+            while inflight:
+                consume(inflight.popleft())
+    finally:
+        ledger.close()
+        report.flush()
+        if checkpoint_path:
+            save_checkpoint(checkpoint_path, checkpoint)
+
+    return {**checkpoint, "elapsed_s": time.monotonic() - started}
@@ -0,0 +1,21 @@
+"""Shared test fixtures."""
+
+import pytest
+from quantum_games.settings import reload_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    """Start each test from settings re-read from the (restored) environment."""
+    reload_settings()
+
+
+@pytest.fixture
+def env(monkeypatch):
+    """Set environment variables and reload settings: ``env(QISKIT_BACKEND="local:analytic")``."""
+    def apply(**values):
+        for name, value in values.items():
+            monkeypatch.setenv(name, value)
+        reload_settings()
+
+    return apply
@@ -0,0 +1,161 @@
+"""Tests for admission control."""
+
+import asyncio
+import pytest
+from quantum_games import admission
+from quantum_games.admission import AdmissionController, AdmissionRejected, circuit_cost
+
+
+def test_client_buckets_are_independent():
+    """Test that one client exhausting its bucket doesn't limit another."""
+    controller = AdmissionController(client_rate=1000.0, client_burst=10000.0)
+    controller.admit("greedy", cost=10000.0).release()
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.admit("greedy", cost=5000.0)
+    assert rejected.value.reason == "rate_limited"
+    assert rejected.value.retry_after == pytest.approx(5.0, rel=0.01)
+
+    controller.admit("polite", cost=5000.0).release()
+    assert controller.snapshot()["shed"] == {"rate_limited": 1}
+
+
+def test_lower_tiers_are_shed_first():
+    """Test that a deep queue turns away analytics before live play and VIPs."""
+    controller = AdmissionController(max_queue=8)
+    held = [controller.admit("c", tier="live") for _ in range(2)]
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.admit("c", tier="analytics")
+    assert rejected.value.reason == "queue_full"
+
+    held += [controller.admit("c", tier="live") for _ in range(5)]
+    with pytest.raises(AdmissionRejected):
+        controller.admit("c", tier="live")
+    held.append(controller.admit("c", tier="vip"))
+
+    for slot in held:
+        slot.release()
+    assert controller.depth == 0
+
+
+def test_qpu_budget():
+    """Test that the budget stops admissions once its QPU seconds are spent."""
+    controller = AdmissionController(qpu_budget_s=1.0, budget_window_s=3600.0)
+    controller.admit("c", qpu_seconds=0.6).release()
+
+    with pytest.raises(AdmissionRejected) as rejected:
+        controller.admit("c", qpu_seconds=0.6)
+    assert rejected.value.reason == "budget_exhausted"
+    assert rejected.value.retry_after == pytest.approx(720.0, rel=0.01)
+    assert controller.snapshot()["qpu_seconds"] == pytest.approx(0.6)
+
+
+def test_waiters_run_in_priority_order():
+    """Test that queued requests take free run slots highest tier first."""
+    async def scenario():
+        controller = AdmissionController(max_inflight=1)
+        order = []
+
+        async def play(tier):
+            async with controller.admit("c", tier=tier):
+                order.append(tier)
+                await asyncio.sleep(0.01)
+
+        first = controller.admit("c")
+        await first.__aenter__()
+        tasks = [asyncio.ensure_future(play(tier)) for tier in ("analytics", "odds", "live", "vip")]
+        await asyncio.sleep(0.01)
+        assert controller.snapshot()["queued"] == 4
+        await first.__aexit__(None, None, None)
+        await asyncio.gather(*tasks)
+        return order, controller.depth
+
+    order, depth = asyncio.run(scenario())
+    assert order == ["vip", "live", "odds", "analytics"]
+    assert depth == 0
+
+
+def test_circuit_cost_grows_with_circuit():
+    """Test that wider and deeper circuits cost more per shot."""
+    assert circuit_cost("filter") < circuit_cost("entangled_wager") < circuit_cost("slots", 5)
+    assert circuit_cost("grover", 6) > circuit_cost("grover", 3)
+
+
+def test_api_answers_429(env, monkeypatch):
+    """Test that a rate-limited client gets 429 with Retry-After, keyed by API key or peer."""
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0",
+        ADMISSION_CLIENT_RATE="100", ADMISSION_CLIENT_BURST="2000", ADMISSION_API_KEYS="table-9=s3cret")
+    monkeypatch.setattr(admission, "_controller", None)
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    client = TestClient(app)
+    headers = {"Authorization": "Bearer s3cret"}
+    assert client.post("/play/filter", json={"qcount": 5, "shots": 2000}, headers=headers).status_code == 200
+
+    response = client.post("/play/filter", json={"qcount": 5, "shots": 2000}, headers=headers)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+    # Unauthenticated callers share their peer's bucket, whatever id they claim
+    assert client.post("/play/filter", json={"qcount": 5, "shots": 2000}).status_code == 200
+    spoofed = {"X-Client-Id": "someone-else", "X-Api-Key": "wrong"}
+    assert client.post("/play/filter", json={"qcount": 5, "shots": 2000}, headers=spoofed).status_code == 429
+
+    assert client.get("/admission").json()["shed"] == {"rate_limited": 2}
+    assert 'quantum_admission_shed_total{tier="live",reason="rate_limited"}' in client.get("/metrics").text
+
+
+def test_vip_needs_authentication(env, monkeypatch):
+    """Test that VIP priority is only granted to an authenticated client."""
+    env(QISKIT_BACKEND="local:analytic", ADMISSION_API_KEYS="lounge=k1", ADMISSION_VIP_CLIENTS="lounge")
+    from starlette.requests import Request
+    from quantum_games import server
+
+    def admitted_tier(headers):
+        request = Request({"type": "http", "headers": [(k.lower().encode(), v.encode()) for k, v in headers.items()],
+                           "client": ("10.0.0.1", 1234)})
+        slot = server._admit(request, "live")
+        slot.release()
+        return slot.tier
+
+    monkeypatch.setattr(admission, "_controller", None)
+    assert admitted_tier({"X-Api-Key": "k1"}) == "vip"
+    assert admitted_tier({"X-Client-Id": "lounge"}) == "live"
+    assert server._client_id(Request({"type": "http", "headers": [], "client": ("10.0.0.1", 1)})) == ("peer:10.0.0.1", False)
+
+
+def test_invalid_requests_spend_nothing(env, monkeypatch):
+    """Test that requests rejected by validation aren't charged tokens or budget."""
+    env(QISKIT_BACKEND="local:analytic", ADMISSION_QPU_BUDGET_SECONDS="100")
+    monkeypatch.setattr(admission, "_controller", None)
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    client = TestClient(app)
+    assert client.post("/play/slots", json={"reels": 3, "angles": [0.1, 0.2]}).status_code == 400
+    assert client.post("/play/find-card", json={"qubits": 2, "guess": 9}).status_code == 400
+    assert client.get("/admission").json()["qpu_seconds"] == 0.0
+
+
+def test_lobby_players_are_admitted(env, monkeypatch):
+    """Test that queueing in the lobby charges each player half of the match."""
+    env(QISKIT_BACKEND="local:analytic", WARM_UP_ON_STARTUP="0", LOBBY_SHOTS="100",
+        ADMISSION_CLIENT_RATE="1", ADMISSION_CLIENT_BURST="150", ADMISSION_QPU_BUDGET_SECONDS="100")
+    monkeypatch.setattr(admission, "_controller", None)
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/lobby/ws") as alice:
+            alice.send_json({"qcount": 4})
+            assert alice.receive_json()["event"] == "queued"
+            assert client.get("/admission").json()["queued"] == 1
+
+            with client.websocket_connect("/lobby/ws") as bob:
+                bob.send_json({"qcount": 5})
+                event = bob.receive_json()
+                assert event["event"] == "error" and event["retry_after"] >= 1
+
+        assert client.get("/admission").json()["shed"] == {"rate_limited": 1}
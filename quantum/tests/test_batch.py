@@ -0,0 +1,64 @@
+"""Tests for bulk play endpoints and the JSONL CLI mode."""
+
+import io
+import json
+import pytest
+from quantum_games.cli import run_batch
+from quantum_games.games import play_batch
+
+
+@pytest.fixture(autouse=True)
+def local_backend(env):
+    env(QISKIT_BACKEND="local:analytic")
+
+
+def test_play_batch_runs_one_job():
+    """Test that mixed plays share one job and keep their order."""
+    plays = [
+        {"game": "filter", "qcount": 5, "id": "a"},
+        {"game": "entangled_wager", "qa": 3, "qb": 5},
+        {"game": "filter", "qcount": 20, "shots": 200},
+    ]
+    results = play_batch(plays, shots=100)
+
+    assert [r["game_type"] for r in results] == ["filter", "entangled_wager", "filter"]
+    assert results[0]["id"] == "a"
+    assert [r["shots"] for r in results] == [100, 100, 200]
+    assert sum(results[2]["counts"].values()) == 200
+    assert len({r["audit"]["job_id"] for r in results}) == 1
+
+
+def test_play_batch_rejects_bad_plays():
+    """Test that malformed plays fail before anything runs."""
+    with pytest.raises(ValueError, match="Play 1"):
+        play_batch([{"game": "filter", "qcount": 5}, {"game": "filter"}])
+
+
+def test_cli_batch_streams_jsonl():
+    """Test one output line per input line, with errors in place."""
+    lines = ['{"game": "filter", "qcount": 5}', "not json", "", '{"game": "slots"}',
+             '{"game": "entangled_wager", "qa": 1, "qb": 2}']
+    out = io.StringIO()
+
+    run_batch(lines, out, shots=100, chunk_size=2)
+
+    records = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert len(records) == 4
+    assert records[0]["game_type"] == "filter"
+    assert records[1]["line"] == 2 and "Invalid JSON" in records[1]["error"]
+    assert records[2]["line"] == 4
+    assert records[3]["game_type"] == "entangled_wager"
+
+
+def test_batch_endpoint():
+    """Test the /play/batch endpoint."""
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    response = TestClient(app).post("/play/batch", json={
+        "plays": [{"game": "filter", "qcount": 4}, {"game": "entangled_wager", "qa": 2, "qb": 9}],
+        "shots": 100
+    })
+
+    assert response.status_code == 200
+    assert [r["game_type"] for r in response.json()["results"]] == ["filter", "entangled_wager"]
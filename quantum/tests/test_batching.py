@@ -0,0 +1,72 @@
+"""Tests for the sampler micro-batcher."""
+
+import threading
+import pytest
+from quantum_games.batching import SamplerBatcher
+from quantum_games.circuits import make_filter_circuit
+
+
+class RecordingRunner:
+    """Stand-in for run_sampler that records each job it receives."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, circuits, shots=None, backend_name=None):
+        with self.lock:
+            self.calls.append((list(circuits), shots, backend_name))
+            job_id = f"job-{len(self.calls)}"
+        counts = [{"1": i, "0": shots - i} for i in range(len(circuits))]
+        return {
+            "job_id": job_id,
+            "backend": "test_backend",
+            "shots": shots,
+            "counts": counts[0] if len(counts) == 1 else counts,
+        }
+
+
+def test_concurrent_plays_share_one_job():
+    """Test that plays inside the window are merged into a single job."""
+    runner = RecordingRunner()
+    batcher = SamplerBatcher(window_s=0.2, max_batch_size=10, runner=runner)
+    circuits = [make_filter_circuit(q)[0] for q in range(1, 6)]
+
+    futures = [batcher.submit(circuit, 100) for circuit in circuits]
+    results = [future.result(timeout=5) for future in futures]
+
+    assert len(runner.calls) == 1
+    assert runner.calls[0][0] == circuits
+    assert {r["job_id"] for r in results} == {"job-1"}
+    # Each caller gets its own PUB result back
+    assert [r["counts"]["1"] for r in results] == [0, 1, 2, 3, 4]
+    assert all(r["batch_size"] == 5 for r in results)
+
+
+def test_max_batch_size_and_shots_split_jobs():
+    """Test that batches are capped and never mix shot counts."""
+    runner = RecordingRunner()
+    batcher = SamplerBatcher(window_s=0.2, max_batch_size=2, runner=runner)
+    circuit, _ = make_filter_circuit(3)
+
+    futures = [batcher.submit(circuit, 100) for _ in range(3)]
+    futures.append(batcher.submit(circuit, 200))
+    for future in futures:
+        future.result(timeout=5)
+
+    sizes = sorted((len(c), shots) for c, shots, _ in runner.calls)
+    assert sizes == [(1, 100), (1, 200), (2, 100)]
+
+
+def test_runner_errors_reach_every_caller():
+    """Test that a failed job fails all plays in the batch."""
+    def failing_runner(circuits, shots=None, backend_name=None):
+        raise RuntimeError("backend offline")
+
+    batcher = SamplerBatcher(window_s=0.05, runner=failing_runner)
+    circuit, _ = make_filter_circuit(1)
+    futures = [batcher.submit(circuit, 100) for _ in range(2)]
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(timeout=5)
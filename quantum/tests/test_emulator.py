@@ -0,0 +1,91 @@
+"""Tests for the noise-aware batched emulator."""
+
+import math
+import numpy as np
+import pytest
+from quantum_games import emulator, odds
+from quantum_games.engines import get_engine
+from quantum_games.templates import get_template
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return emulator.NoisyEngine("fake_sherbrooke", seed=7)
+
+
+def test_filter_is_near_ideal_but_noisy(engine):
+    """Test that noise perturbs, but doesn't swamp, the filter's ideal odds."""
+    thetas = np.array([[0.0], [math.pi / 3], [math.pi]])
+    probs, compiled = engine.distributions(get_template("filter"), thetas)
+    ideal = np.sin(thetas[:, 0] / 2) ** 2
+
+    assert compiled.n_qubits == 1
+    assert np.allclose(probs[:, 1], ideal, atol=0.05)
+    assert not np.allclose(probs[:, 1], ideal, atol=1e-6)
+    assert np.allclose(probs.sum(axis=1), 1.0)
+
+
+def test_bell_pair_loses_correlation(engine):
+    """Test that the Bell pair's outcomes are mostly but not always correlated."""
+    probs, _ = engine.distributions(get_template("entangled_pair"), np.array([[0.0]]))
+    correlated = probs[0, 0] + probs[0, 3]
+
+    assert 0.9 < correlated < 1.0
+
+
+def test_sweep_matches_single_rows(engine):
+    """Test that one batched pass gives the same distributions as row-by-row passes."""
+    thetas = np.linspace(-math.pi, math.pi, 7).reshape(-1, 1)
+    template = get_template("slots", 2)
+    values = np.hstack([thetas, thetas[::-1] / 2])
+
+    compiled = engine.noise.compile(template)
+    batched = emulator._simulate(compiled, values)
+    single = np.vstack([emulator._simulate(compiled, row[None]) for row in values])
+    assert np.allclose(batched, single)
+
+
+def test_distributions_are_cached(engine, monkeypatch):
+    """Test that repeated rows are sampled from the cache without simulating again."""
+    template = get_template("filter")
+    engine.run_pub((template, [[0.25], [0.5]]), 100)
+
+    passes = []
+    simulate = emulator._simulate
+
+    def counting_simulate(compiled, values):
+        passes.append(len(values))
+        return simulate(compiled, values)
+
+    monkeypatch.setattr(emulator, "_simulate", counting_simulate)
+
+    counts = engine.run_pub((template, [[0.25], [0.5], [0.75], [0.75]]), 100)
+    assert passes == [1]
+    assert [c.shots for c in counts] == [100] * 4
+    assert engine.run_pub((template, [0.25]), 100).shots == 100
+
+
+def test_noisy_odds(env):
+    """Test that odds can be estimated on the emulator by naming it."""
+    env(QISKIT_BACKEND="local:analytic", ODDS_SHOTS="2000")
+    odds.clear_odds_cache()
+    table = odds.get_odds("entangled_wager", backend_name="local:noisy")
+
+    assert table["backend"] == get_engine("noisy").name == "local:noisy:fake_sherbrooke"
+    assert all(row["p_correlated"] < 1.0 for row in table["entangled_wager"][:5])
+    with pytest.raises(ValueError):
+        get_engine("noisy:ibm_nowhere")
+
+
+def test_unknown_device_is_a_bad_request(env):
+    """Test that naming a fake device that doesn't exist is a client error."""
+    env(QISKIT_BACKEND="local:analytic")
+    with pytest.raises(ValueError, match="fake_nope"):
+        emulator.NoiseModel.from_backend("fake_nope")
+
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    response = TestClient(app).get("/odds", params={"backend": "local:noisy:fake_nope"})
+    assert response.status_code == 400
+    assert "fake_nope" in response.json()["detail"]
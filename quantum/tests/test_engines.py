@@ -0,0 +1,98 @@
+"""Tests for the local sampling engines."""
+
+import math
+import pytest
+import numpy as np
+from quantum_games.circuits import (
+    make_filter_circuit,
+    make_entangled_pair,
+    make_slots_circuit,
+    make_grover_oracle
+)
+from quantum_games.engines import AnalyticEngine, StatevectorEngine, parse_backend_spec
+
+
+def test_parse_backend_spec():
+    """Test backend spec parsing."""
+    assert parse_backend_spec("local:analytic") == ("local", "analytic")
+    assert parse_backend_spec("ibm:ibm_kyiv") == ("ibm", "ibm_kyiv")
+    assert parse_backend_spec("ibm_kyiv") == ("ibm", "ibm_kyiv")
+
+
+@pytest.mark.parametrize("circuit", [
+    make_filter_circuit(7)[0],
+    make_entangled_pair(math.pi / 3)[0],
+    make_slots_circuit(3, [math.pi / 6, math.pi / 4, math.pi / 3])[0],
+    make_grover_oracle(3, "101")[0],
+    make_grover_oracle(6, "100110")[0],
+])
+def test_analytic_matches_statevector(circuit):
+    """Test that the closed-form engine agrees with Qiskit's Statevector."""
+    analytic = AnalyticEngine().probabilities(circuit)
+    reference = StatevectorEngine().probabilities(circuit)
+
+    assert np.allclose(analytic, reference)
+
+
+def test_run_result_shape():
+    """Test that engines return run_sampler-shaped results."""
+    engine = AnalyticEngine(seed=1)
+    circuit, _ = make_entangled_pair(0.5)
+
+    result = engine.run([circuit], shots=1000)
+
+    assert result["backend"] == "local:analytic"
+    assert result["job_id"].startswith("local-")
+    assert sum(result["counts"].values()) == 1000
+    # A Bell pair only ever yields correlated outcomes
+    assert set(result["counts"]) <= {"00", "11"}
+
+
+def test_memory_expands_sweeps_and_pub_shots():
+    """Test that per-shot memory covers every sweep row and honours each PUB's shots."""
+    from quantum_games.templates import get_template
+
+    engine = AnalyticEngine(seed=3)
+    template = get_template("filter")
+    result = engine.run([(template, [[0.0], [math.pi]], 50), (template, [math.pi])], shots=100, memory=True)
+
+    sweep, single = result["memory"]
+    assert [len(row) for row in sweep] == [50, 50] and len(single) == 100
+    # RY(0) always measures 0 and RY(pi) always 1
+    assert result["counts"] == [[{"0": 50}, {"1": 50}], {"1": 100}]
+
+
+def test_wide_product_circuit_sampling():
+    """Test per-qubit sampling for circuits too wide for a dense distribution."""
+    engine = AnalyticEngine(seed=2)
+    circuit, _ = make_slots_circuit(20, [math.pi] * 10 + [0.0] * 10)
+
+    counts = engine.sample_counts(circuit, 500)
+
+    # RY(pi) always measures 1, RY(0) always 0
+    assert counts == {"0" * 10 + "1" * 10: 500}
+
+
+def test_local_latency_is_awaited_not_slept(env, monkeypatch):
+    """Test that LOCAL_LATENCY_MS delays async plays without holding the engine or a worker."""
+    import asyncio
+    from quantum_games import engines
+    from quantum_games.games import play_filter, play_filter_async
+
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0", LOCAL_LATENCY_MS="300")
+    sleep = asyncio.sleep
+    delays = []
+
+    async def recording_sleep(delay, *args, **kwargs):
+        delays.append(delay)
+        await sleep(0)
+
+    monkeypatch.setattr(engines.asyncio, "sleep", recording_sleep)
+    play_filter(3, 100)
+    assert delays == []
+
+    async def plays():
+        return await asyncio.gather(*(play_filter_async(3, 100) for _ in range(8)))
+
+    asyncio.run(plays())
+    assert delays.count(0.3) == 8
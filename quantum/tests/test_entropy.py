@@ -0,0 +1,49 @@
+"""Tests for the quantum entropy pool."""
+
+import pytest
+from quantum_games.engines import AnalyticEngine
+from quantum_games.entropy import EntropyPool, EntropyExhausted
+
+
+def local_runner(circuits, shots=None, backend_name=None, memory=False):
+    return AnalyticEngine(seed=7).run(circuits, shots, memory=memory)
+
+
+def test_refill_and_draw_track_job_ids():
+    """Test that draws return bytes and the jobs they came from."""
+    pool = EntropyPool(capacity=256, shots=100, runner=local_runner)
+
+    assert pool.refill_once() == 100
+    assert pool.refill_once() == 100
+    assert pool.available == 200
+
+    first = pool.draw(80)
+    spanning = pool.draw(40)
+
+    assert len(first.data) == 80
+    assert len(first.job_ids) == 1
+    # The second draw straddles both refill jobs
+    assert len(spanning.job_ids) == 2
+    assert spanning.backend == "local:analytic"
+    assert pool.available == 80
+
+
+def test_ring_buffer_wraps_and_caps_at_capacity():
+    """Test that refills wrap around the buffer without overwriting unread bytes."""
+    pool = EntropyPool(capacity=150, low_watermark=10, high_watermark=140, shots=100, runner=local_runner)
+
+    pool.refill_once()
+    pool.draw(90)
+    # Only 140 bytes of room remain, so the second job is truncated and wraps
+    assert pool.refill_once() == 100
+    assert pool.refill_once() == 40
+    assert pool.available == 150
+    assert len(pool.draw(150).data) == 150
+
+
+def test_exhausted_pool_raises():
+    """Test that an empty pool refuses non-blocking draws."""
+    pool = EntropyPool(capacity=64, shots=10, runner=local_runner)
+
+    with pytest.raises(EntropyExhausted):
+        pool.draw(8)
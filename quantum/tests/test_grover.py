@@ -0,0 +1,97 @@
+"""Tests for Grover search circuits and the Find the Card game."""
+
+import pytest
+from qiskit import QuantumCircuit
+from qiskit.quantum_info import Statevector
+from quantum_games.games import FIND_CARD_RETURN, compute_payout, find_card_outcome, max_deck_qubits, play_find_card
+from quantum_games.grover import (
+    MCX_ANCILLAS,
+    mcx_strategy,
+    optimal_iterations,
+    success_probability,
+    synthesize_mcx,
+)
+from quantum_games.ledger import decode_record, encode_record
+from quantum_games.templates import make_pub
+from quantum_games.verify import verify_record
+
+
+@pytest.mark.parametrize("num_ctrl,strategy", [(3, "one_clean"), (5, "two_clean"), (4, "noaux"), (7, "noaux")])
+def test_mcx_synthesis_is_exact(num_ctrl, strategy):
+    """Test that each decomposition flips the target only when every control is set."""
+    mcx = synthesize_mcx(num_ctrl, strategy)
+    assert mcx.num_qubits == num_ctrl + 1 + MCX_ANCILLAS[strategy]
+
+    for controls in (2 ** num_ctrl - 1, 2 ** num_ctrl - 2):
+        qc = QuantumCircuit(mcx.num_qubits)
+        for q in range(num_ctrl):
+            if (controls >> q) & 1:
+                qc.x(q)
+        qc.compose(mcx, inplace=True)
+
+        expected = controls | ((controls == 2 ** num_ctrl - 1) << num_ctrl)
+        assert Statevector(qc).probabilities()[expected] == pytest.approx(1.0)
+
+
+def test_strategy_by_size():
+    """Test that wide gates use ancilla ladders unless no ancilla is allowed."""
+    assert mcx_strategy(2) == "native"
+    assert mcx_strategy(3) == "one_clean"
+    assert mcx_strategy(15) == "two_clean"
+    assert mcx_strategy(15, max_ancillas=0) == "noaux"
+
+
+def test_optimal_iterations():
+    """Test the iteration count against the textbook values."""
+    assert optimal_iterations(2) == 1 and success_probability(2, 1) == pytest.approx(1.0)
+    assert optimal_iterations(10) == 25
+    assert success_probability(10, 25) > 0.99
+
+
+def test_find_card_plays_and_verifies(env):
+    """Test that the search reveals the hidden card and the record replays cleanly."""
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0")
+    result = play_find_card(6, guess=41, shots=500, card=41)
+
+    assert result["found_card"] == 41 and result["outcome"] == "win"
+    assert result["search_success"] > 0.9
+    assert compute_payout(result, 1.0) == pytest.approx(FIND_CARD_RETURN * 64)
+
+    record = decode_record(encode_record(result, compute_payout(result, 1.0)))
+    assert record["params"] == result["params"]
+    assert verify_record(record) == {}
+
+    # Every card of the deck shares one cached template
+    assert make_pub("grover", [0.0] * 6, n_qubits=6)[0] is make_pub("grover", [3.14] * 6, n_qubits=6)[0]
+
+
+def test_missed_search_is_void():
+    """Test that the bet is settled against the hidden card and a missed search is refunded."""
+    assert find_card_outcome({"10": 60, "01": 40}, guess=2, card=2)["outcome"] == "win"
+    assert find_card_outcome({"10": 60, "01": 40}, guess=1, card=2)["outcome"] == "lose"
+
+    # The search revealed card 1, which the player guessed, but the hidden card was 2
+    missed = find_card_outcome({"10": 40, "01": 60}, guess=1, card=2)
+    assert missed == {"outcome": "void", "found_card": 1}
+    result = {"game_type": "find_the_card", **missed, "params": {"n_qubits": 2}}
+    assert compute_payout(result, 5.0) == 5.0
+
+
+def test_deck_capped_on_noisy_backends(env):
+    """Test that noisy backends only accept decks the search is reliable on."""
+    env(QISKIT_BACKEND="local:noisy")
+    assert max_deck_qubits() == 4
+    with pytest.raises(ValueError):
+        play_find_card(6, guess=0)
+
+    assert max_deck_qubits("local:analytic") == 10
+    env(QISKIT_BACKEND="local:analytic", QISKIT_BACKENDS="local:analytic,fake:fake_manila")
+    assert max_deck_qubits() == 4
+
+
+def test_find_card_rejects_bad_guess():
+    """Test bet validation."""
+    with pytest.raises(ValueError):
+        play_find_card(3, guess=8)
+    with pytest.raises(ValueError):
+        play_find_card(11, guess=0)
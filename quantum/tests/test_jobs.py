@@ -0,0 +1,73 @@
+"""Tests for the submit-then-poll job store."""
+
+import asyncio
+import gc
+import warnings
+import pytest
+from quantum_games import jobs
+from quantum_games.jobs import JobStore, JobQueueFull, DONE, FAILED
+
+
+async def _play(value, delay=0.01):
+    await asyncio.sleep(delay)
+    return {"value": value}
+
+
+async def _failing_play():
+    raise RuntimeError("backend offline")
+
+
+def test_ticket_resolves_with_result():
+    """Test that a submitted play finishes with its result."""
+    async def scenario():
+        store = JobStore()
+        ticket = store.submit(_play(42))
+        assert store.get(ticket.id) is ticket
+        assert await ticket.wait(5)
+        return ticket
+
+    ticket = asyncio.run(scenario())
+    assert ticket.status == DONE
+    assert ticket.result == {"value": 42}
+
+
+def test_ticket_records_failure():
+    """Test that errors are captured on the ticket instead of raised."""
+    async def scenario():
+        store = JobStore()
+        ticket = store.submit(_failing_play())
+        await ticket.wait(5)
+        return ticket, store.pending
+
+    ticket, pending = asyncio.run(scenario())
+    assert ticket.status == FAILED
+    assert "backend offline" in ticket.error
+    assert pending == 0
+
+
+def test_pending_limit():
+    """Test that the store refuses work beyond max_pending."""
+    async def scenario():
+        store = JobStore(max_pending=1)
+        first = store.submit(_play(1, delay=0.05))
+        with pytest.raises(JobQueueFull):
+            store.submit(_play(2))
+        await first.wait(5)
+
+    asyncio.run(scenario())
+
+
+def test_full_queue_leaves_no_coroutine_behind(env, monkeypatch):
+    """Test that POST /jobs answers 503 on a full queue without an unawaited play."""
+    env(QISKIT_BACKEND="local:analytic")
+    monkeypatch.setattr(jobs, "_store", JobStore(max_pending=0))
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        response = TestClient(app).post("/jobs", json={"game": "filter", "qcount": 5, "shots": 100})
+        gc.collect()
+
+    assert response.status_code == 503
+    assert not [w for w in caught if "never awaited" in str(w.message)]
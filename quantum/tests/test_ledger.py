@@ -0,0 +1,143 @@
+"""Tests for the binary audit ledger."""
+
+import io
+import json
+import pytest
+from quantum_games.games import play_batch, play_filter
+from quantum_games.ledger import AuditLedger, decode_record, encode_record
+from quantum_games import ledger as ledger_module
+
+
+def make_play(job_id, timestamp, qcount=5, circuit_hash="ab" * 32):
+    return {
+        "game_type": "filter",
+        "outcome": "win",
+        "counts": {"0": 40, "1": 60},
+        "shots": 100,
+        "params": {"qcount": qcount, "theta": 1.28},
+        "audit": {"job_id": job_id, "backend": "local:analytic", "circuit_hash": circuit_hash,
+                  "circuit_hash_version": 2, "timestamp": timestamp}
+    }
+
+
+def test_record_roundtrip():
+    """Test that a record decodes to the play it was encoded from."""
+    play = make_play("job-1", "2026-01-02T03:04:05.123456")
+    record = decode_record(encode_record(play, 1.5))
+
+    assert record["audit"] == play["audit"]
+    assert record["counts"] == play["counts"]
+    assert record["params"] == play["params"]
+    assert record["payout_per_unit"] == 1.5
+
+    corrupted = bytearray(encode_record(play, 1.5))
+    corrupted[-6] ^= 0xFF
+    with pytest.raises(ValueError):
+        decode_record(bytes(corrupted))
+
+
+def test_lookups_across_sealed_and_active_segments(tmp_path):
+    """Test job, hash and time lookups over indexed and unsealed segments."""
+    ledger = AuditLedger(str(tmp_path), segment_bytes=1024)
+    for i in range(40):
+        ledger.append(make_play(f"job-{i % 10}", f"2026-01-01T00:00:{i:02d}", circuit_hash=f"{i % 4:02x}" * 32))
+    ledger.flush()
+
+    assert len(ledger.segments()) > 2
+    assert len(ledger.find_by_job_id("job-3")) == 4
+    assert len(ledger.find_by_circuit_hash("01" * 32)) == 10
+    window = list(ledger.find_by_time("2026-01-01T00:00:10", "2026-01-01T00:00:20"))
+    assert [r["audit"]["timestamp"][-2:] for r in window] == [f"{i}" for i in range(10, 20)]
+
+    out = io.StringIO()
+    assert ledger.export(out) == 40
+    assert json.loads(out.getvalue().splitlines()[0])["audit"]["job_id"] == "job-0"
+
+    # A read-only reader sees everything the live writer has flushed
+    reader = AuditLedger(str(tmp_path), read_only=True)
+    assert len(reader.find_by_job_id("job-3")) == 4
+    reader.close()
+    ledger.close()
+
+    # Reopening seals the segment left unsealed, starts its own and keeps every record queryable
+    reopened = AuditLedger(str(tmp_path), segment_bytes=1024)
+    assert len(list(reopened.find_by_time())) == 40
+    reopened.close()
+
+
+def test_bad_record_mid_batch_is_skipped(tmp_path):
+    """Test that a play that can't be encoded doesn't lose or misindex the rest of its batch."""
+    ledger = AuditLedger(str(tmp_path))
+    bad = make_play("bad", "2026-01-01T00:00:01")
+    bad["counts"] = {"1" * 40: 100}
+    ledger._write([
+        (make_play("good-1", "2026-01-01T00:00:00"), 1.0),
+        (bad, 1.0),
+        (make_play("good-2", "2026-01-01T00:00:02"), 1.0),
+    ])
+    ledger.append(make_play("good-3", "2026-01-01T00:00:03"))
+    ledger.flush()
+
+    assert [r["audit"]["job_id"] for r in ledger.find_by_time()] == ["good-1", "good-2", "good-3"]
+    assert len(ledger.find_by_job_id("good-1")) == 1
+    assert ledger.find_by_job_id("bad") == []
+    assert "40-bit" in ledger.last_error
+    ledger.close()
+
+
+def test_torn_tail_is_dropped(tmp_path):
+    """Test recovery from a partially written final record."""
+    ledger = AuditLedger(str(tmp_path))
+    ledger.append(make_play("job-a", "2026-01-01T00:00:00"))
+    ledger.append(make_play("job-b", "2026-01-01T00:00:01"))
+    ledger.close()
+
+    segment = ledger.segments()[-1]
+    with open(segment, "r+b") as f:
+        f.truncate(f.seek(0, 2) - 3)
+
+    reopened = AuditLedger(str(tmp_path))
+    assert [r["audit"]["job_id"] for r in reopened.find_by_time()] == ["job-a"]
+    reopened.append(make_play("job-c", "2026-01-01T00:00:02"))
+    reopened.flush()
+    assert len(reopened.find_by_job_id("job-c")) == 1
+    reopened.close()
+
+
+def test_writers_share_a_directory(tmp_path):
+    """Test that writers on one directory each append to their own segments and lose nothing."""
+    writers = [AuditLedger(str(tmp_path), segment_bytes=2048) for _ in range(2)]
+    for i in range(200):
+        if i == 100:
+            # A writer opening mid-run leaves the live writers' active segments alone
+            writers.append(AuditLedger(str(tmp_path), segment_bytes=2048))
+        for n, ledger in enumerate(writers):
+            ledger.append(make_play(f"writer-{n}-{i}", f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}"))
+    for ledger in writers:
+        ledger.flush()
+
+    assert writers[0].segments()[-1] != writers[1].segments()[-1]
+    for ledger in writers:
+        ledger.close()
+
+    reader = AuditLedger(str(tmp_path), read_only=True)
+    assert len(list(reader.find_by_time())) == 500
+    for job_id in ("writer-0-0", "writer-1-199", "writer-2-100"):
+        assert len(reader.find_by_job_id(job_id)) == 1
+    reader.close()
+
+
+def test_plays_are_recorded(tmp_path, monkeypatch, env):
+    """Test that play adapters write to the ledger when it's enabled."""
+    env(QISKIT_BACKEND="local:analytic", AUDIT_LEDGER_DIR=str(tmp_path))
+    monkeypatch.setattr(ledger_module, "_ledger", None)
+
+    result = play_filter(5, 100)
+    batch = play_batch([{"game": "entangled_wager", "qa": 1, "qb": 2}], shots=100)
+    ledger = ledger_module.get_audit_ledger()
+    ledger.flush()
+
+    assert ledger.find_by_job_id(result["audit"]["job_id"])[0]["counts"] == result["counts"]
+    assert ledger.find_by_job_id(batch[0]["audit"]["job_id"])[0]["payout_per_unit"] == 2.0
+    ledger.close()
+    monkeypatch.setattr(ledger_module, "_ledger", None)
@@ -0,0 +1,107 @@
+"""Tests for the API load generator."""
+
+import asyncio
+import io
+import pytest
+from quantum_games.loadtest import LatencyHistogram, parse_mix, run_loadtest
+
+
+def test_histogram_percentiles_keep_precision():
+    """Test that percentiles come back within the histogram's precision at any magnitude."""
+    histogram = LatencyHistogram(significant_digits=3)
+    for value in range(1, 100001):
+        histogram.record(value * 10)
+
+    for percentile in (50, 95, 99, 99.9):
+        expected = percentile / 100 * 1000000
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=1e-3)
+    assert histogram.percentile(100) == histogram.max == 1000000
+    assert histogram.count == 100000
+
+    merged = LatencyHistogram(significant_digits=3)
+    merged.merge(histogram)
+    merged.record(5)
+    assert merged.count == 100001 and merged.percentile(0) == 5
+
+
+def test_hgrm_export():
+    """Test that the .hgrm export lists rising percentiles and ends at the max."""
+    histogram = LatencyHistogram()
+    for value in (1000, 2000, 3000, 50000):
+        histogram.record(value)
+    out = io.StringIO()
+    histogram.write_percentiles(out)
+
+    rows = [line.split() for line in out.getvalue().splitlines()[2:] if line and not line.startswith("#")]
+    percentiles = [float(row[1]) for row in rows]
+    assert percentiles == sorted(percentiles) and percentiles[-1] == 1.0
+    assert float(rows[-1][0]) == 50.0 and int(rows[-1][2]) == 4
+    assert "#[Max     =       50.000" in out.getvalue()
+
+
+def test_parse_mix():
+    """Test that mixes are normalized and unknown games rejected."""
+    assert parse_mix("filter=3,entangled_wager=1") == {"filter": 0.75, "entangled_wager": 0.25}
+    assert parse_mix("entangled_wager") == {"entangled_wager": 1.0}
+    with pytest.raises(ValueError):
+        parse_mix("roulette=1")
+
+
+@pytest.mark.parametrize("rate", [None, 100.0])
+def test_loadtest_in_process(env, rate):
+    """Test closed- and open-loop runs against the app with injected backend latency."""
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0", LOCAL_LATENCY_MS="20")
+    import httpx
+    from quantum_games.server import app
+
+    report = asyncio.run(run_loadtest(
+        "http://loadtest", duration_s=0.5, warmup_s=0.5, concurrency=4, rate=rate,
+        mix=parse_mix("filter=1,entangled_wager=1"), shots=100, seed=3,
+        transport=httpx.ASGITransport(app=app)
+    ))
+    summary = report.summary()
+
+    assert summary["ok"] == summary["requests"] > 10
+    assert summary["error_rate"] == 0.0
+    assert set(summary["games"]) == {"filter", "entangled_wager"}
+    assert 20.0 <= summary["latency_ms"]["p50"] <= summary["latency_ms"]["p99"] <= summary["latency_ms"]["max"]
+    assert summary["throughput_rps"] > 0
+
+
+def test_loadtest_counts_errors(env):
+    """Test that rejected plays are counted as errors, not latencies."""
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0")
+    import httpx
+    from quantum_games.server import app
+
+    report = asyncio.run(run_loadtest(
+        "http://loadtest", duration_s=0.2, concurrency=2, shots=50000,
+        transport=httpx.ASGITransport(app=app)
+    ))
+    summary = report.summary()
+
+    assert summary["ok"] == 0 and summary["error_rate"] == 1.0
+    assert summary["errors"] == {"422": summary["requests"]}
+
+
+def test_api_keys_and_send_window():
+    """Test that plays carry the given API keys and throughput uses the send window, not the drain."""
+    import httpx
+
+    seen = []
+
+    async def slow_play(request):
+        seen.append(request.headers.get("Authorization"))
+        await asyncio.sleep(0.15)
+        return httpx.Response(200, json={})
+
+    report = asyncio.run(run_loadtest(
+        "http://loadtest", duration_s=0.4, concurrency=4, api_keys=["k1", "k2"], seed=1,
+        transport=httpx.MockTransport(slow_play)
+    ))
+    summary = report.summary()
+
+    assert set(seen) == {"Bearer k1", "Bearer k2"}
+    assert summary["elapsed_s"] == pytest.approx(0.4)
+    assert summary["drain_s"] > 0.05
+    assert summary["throughput_rps"] == pytest.approx(summary["ok"] / 0.4)
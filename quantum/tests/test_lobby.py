@@ -0,0 +1,114 @@
+"""Tests for the Entangled Wager matchmaking lobby."""
+
+import asyncio
+import pytest
+from quantum_games.lobby import Lobby, LobbyFull
+
+
+class RecordingRunner:
+    """Stand-in for play_batch_async that records each job's plays."""
+
+    def __init__(self):
+        self.jobs = []
+
+    async def __call__(self, plays, shots=None):
+        self.jobs.append(plays)
+        return [{"winner": "player_a", "id": play["id"]} for play in plays]
+
+
+def test_pairs_within_brackets_in_one_job():
+    """Test that a tick pairs close stakes per bracket and settles them in a single job."""
+    async def scenario():
+        runner = RecordingRunner()
+        lobby = Lobby(tick_s=3600, bracket_width=5, runner=runner)
+        players = [lobby.join(q) for q in (1, 4, 2, 3, 7, 9, 6)]
+        pairs = lobby.match()
+        await lobby.settle(pairs)
+        await lobby.stop()
+        return runner, lobby, players, pairs
+
+    runner, lobby, players, pairs = asyncio.run(scenario())
+
+    # 1-5 pairs by closest stake; the newest of 6-10 (qcount 6) waits
+    assert [(a.qcount, b.qcount) for a, b in pairs] == [(1, 2), (3, 4), (7, 9)]
+    assert len(runner.jobs) == 1 and len(runner.jobs[0]) == 3
+    assert lobby.waiting == 1 and lobby.snapshot()["brackets"] == {"6-10": 1}
+
+    event = players[0]._result.result()
+    assert event["event"] == "result" and event["won"] and event["opponent"]["qcount"] == 2
+    assert players[2]._result.result()["side"] == "player_b"
+    assert not players[2]._result.result()["won"]
+    assert not players[-1].done
+
+
+def test_idle_players_time_out():
+    """Test that unmatched players are dropped with a timeout event."""
+    async def scenario():
+        lobby = Lobby(tick_s=0.01, timeout_s=0.05, runner=RecordingRunner())
+        player = lobby.join(10)
+        event = await player.wait(5)
+        await lobby.stop()
+        return event, lobby.waiting
+
+    event, waiting = asyncio.run(scenario())
+    assert event["event"] == "timeout"
+    assert waiting == 0
+
+
+def test_lobby_bounds_and_leaving():
+    """Test the waiting limit, bet validation and leaving the queue."""
+    async def scenario():
+        lobby = Lobby(tick_s=3600, max_waiting=2, runner=RecordingRunner())
+        first = lobby.join(5)
+        lobby.join(5)
+        with pytest.raises(LobbyFull):
+            lobby.join(5)
+        assert lobby.leave(first.id)
+        assert not lobby.leave(first.id)
+        lobby.join(6)
+        with pytest.raises(ValueError):
+            lobby.join(21)
+        await lobby.stop()
+        return lobby.waiting
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_failed_job_reaches_both_players():
+    """Test that a sampler failure is raised to both sides of the match."""
+    async def failing_runner(plays, shots=None):
+        raise RuntimeError("backend offline")
+
+    async def scenario():
+        lobby = Lobby(tick_s=0.01, runner=failing_runner)
+        players = [lobby.join(3), lobby.join(3)]
+        results = await asyncio.gather(*(p.wait(5) for p in players), return_exceptions=True)
+        await lobby.stop()
+        return results
+
+    assert all(isinstance(r, RuntimeError) for r in asyncio.run(scenario()))
+
+
+def test_websocket_match(env):
+    """Test two players matched over the WebSocket endpoint on the local backend."""
+    env(QISKIT_BACKEND="local:analytic", WARM_UP_ON_STARTUP="0", LOBBY_TICK_MS="10")
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    with TestClient(app) as client:
+        with client.websocket_connect("/lobby/ws") as alice, client.websocket_connect("/lobby/ws") as bob:
+            alice.send_json({"qcount": 4})
+            assert alice.receive_json()["event"] == "queued"
+            bob.send_json({"qcount": 5})
+            assert bob.receive_json()["event"] == "queued"
+
+            a, b = alice.receive_json(), bob.receive_json()
+
+        assert a["match_id"] == b["match_id"]
+        assert {a["side"], b["side"]} == {"player_a", "player_b"}
+        assert a["result"]["counts"] == b["result"]["counts"]
+        assert client.get("/lobby").json()["matches"] >= 1
+
+        with client.websocket_connect("/lobby/ws") as carol:
+            carol.send_json({"qcount": 0})
+            assert carol.receive_json()["event"] == "error"
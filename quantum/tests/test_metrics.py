@@ -0,0 +1,49 @@
+"""Tests for stage instrumentation and the /metrics endpoint."""
+
+import pytest
+from quantum_games.metrics import ERRORS, Histogram, STAGE_SECONDS, timed
+
+
+def test_histogram_exposition():
+    """Test cumulative buckets, sum and count in the text format."""
+    histogram = Histogram("test_seconds", "Test", ("stage",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, stage="a")
+    histogram.observe(0.5, stage="a")
+    histogram.observe(5.0, stage="a")
+
+    lines = histogram.collect()
+    assert 'test_seconds_bucket{stage="a",le="0.1"} 1' in lines
+    assert 'test_seconds_bucket{stage="a",le="1"} 2' in lines
+    assert 'test_seconds_bucket{stage="a",le="+Inf"} 3' in lines
+    assert 'test_seconds_count{stage="a"} 3' in lines
+
+
+def test_timed_counts_errors():
+    """Test that timed blocks record durations and exceptions."""
+    before = STAGE_SECONDS.count(stage="unit", game="g", backend="b")
+
+    with pytest.raises(RuntimeError):
+        with timed("unit", game="g", backend="b"):
+            raise RuntimeError("boom")
+
+    assert STAGE_SECONDS.count(stage="unit", game="g", backend="b") == before + 1
+    assert ERRORS.value(stage="unit", game="g", backend="b") >= 1
+
+
+def test_metrics_endpoint(env, tmp_path):
+    """Test that a play shows up on /metrics and requests can be profiled."""
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    env(QISKIT_BACKEND="local:analytic", PROFILE_REQUESTS="1", PROFILE_DIR=str(tmp_path))
+    client = TestClient(app)
+
+    response = client.post("/play/filter", json={"qcount": 5, "shots": 100}, headers={"X-Profile": "1"})
+    assert response.status_code == 200
+    assert response.headers["X-Profile-File"].startswith(str(tmp_path))
+
+    body = client.get("/metrics").text
+    assert 'quantum_stage_seconds_count{stage="play",game="filter",backend=""}' in body
+    assert 'quantum_stage_seconds_count{stage="execute",game="",backend="local:analytic"}' in body
+    assert 'quantum_shots_total{backend="local:analytic"}' in body
+    assert 'route="/play/filter",status="200"' in body
@@ -0,0 +1,60 @@
+"""Tests for qubit-parallel multiplexing of plays."""
+
+import math
+from qiskit.transpiler import CouplingMap
+from quantum_games.multiplex import choose_layout, build_packed_template, plan_packs, run_multiplexed, split_counts
+
+
+def test_choose_layout_respects_coupling_map():
+    """Test that 2-qubit slots land on connected qubits and slots don't overlap."""
+    line = CouplingMap.from_line(5)
+
+    layout = choose_layout([1, 2, 2], line)
+
+    assert layout is not None
+    assert len({q for qubits in layout for q in qubits}) == 5
+    for qubits in layout:
+        if len(qubits) == 2:
+            assert abs(qubits[0] - qubits[1]) == 1
+    # Three pairs can never fit on five qubits
+    assert choose_layout([2, 2, 2], line) is None
+
+
+def test_packed_template_layout():
+    """Test that slots occupy consecutive qubits, clbits and parameters."""
+    circuit, slices = build_packed_template((("entangled_pair", None), ("filter", None), ("filter", None)))
+
+    assert circuit.num_qubits == 4
+    assert circuit.num_parameters == 3
+    assert slices == ((0, 2), (2, 1), (3, 1))
+
+
+def test_split_counts():
+    """Test that joint bitstrings are split back into per-slot counts."""
+    counts = {"1" + "0" + "11": 7, "0" + "1" + "00": 3}
+
+    assert split_counts(counts, [(0, 2), (2, 1), (3, 1)]) == [
+        {"11": 7, "00": 3},
+        {"0": 7, "1": 3},
+        {"1": 7, "0": 3},
+    ]
+
+
+def test_plan_packs_caps_width():
+    """Test that plays are split into packs under the qubit cap."""
+    plays = [("entangled_pair", [0.1])] * 3 + [("filter", [0.2])] * 2
+
+    assert plan_packs(plays, max_qubits=5) == [[0, 1], [2, 3, 4]]
+
+
+def test_run_multiplexed_on_local_engine():
+    """Test end-to-end packing and splitting with deterministic plays."""
+    plays = [("filter", [math.pi]), ("entangled_pair", [0.3]), ("filter", [0.0])]
+
+    result = run_multiplexed(plays, shots=200, backend_name="local:analytic")
+
+    assert result["packs"] == 1
+    filter_on, pair, filter_off = result["counts"]
+    assert filter_on == {"1": 200}
+    assert filter_off == {"0": 200}
+    assert set(pair) <= {"00", "11"} and sum(pair.values()) == 200
@@ -0,0 +1,114 @@
+"""Tests for the parameter-sweep odds tables."""
+
+import math
+import pytest
+from quantum_games import odds, routing
+from quantum_games.circuits import filter_theta
+from quantum_games.metrics import ROUTES
+
+
+@pytest.fixture(autouse=True)
+def local_odds(env, monkeypatch):
+    env(QISKIT_BACKEND="local:analytic", ODDS_SHOTS="2000")
+    odds.clear_odds_cache()
+    jobs = []
+    run_sampler = odds.run_sampler
+
+    def counting_run_sampler(pubs, **kwargs):
+        jobs.append(pubs)
+        return run_sampler(pubs, **kwargs)
+
+    monkeypatch.setattr(odds, "run_sampler", counting_run_sampler)
+    return jobs
+
+
+def test_one_job_covers_every_bet(local_odds):
+    """Test that all 20 filter and 400 entangled bets come from one two-PUB job."""
+    table = odds.compute_odds()
+
+    assert len(local_odds) == 1 and len(local_odds[0]) == 2
+    assert [row["qcount"] for row in table["filter"]] == list(range(1, 21))
+    assert len(table["entangled_wager"]) == 400
+
+    for row in table["filter"]:
+        assert row["p_one"] == pytest.approx(math.sin(filter_theta(row["qcount"]) / 2) ** 2, abs=0.05)
+    # Equal bets leave the Bell pair unrotated: always correlated
+    assert all(row["p_correlated"] == 1.0 for row in table["entangled_wager"] if row["qa"] == row["qb"])
+
+
+def test_odds_cached_per_ttl(local_odds, env):
+    """Test that odds are served from cache until the TTL runs out."""
+    first = odds.get_odds()
+    second = odds.get_odds(game="filter")
+
+    assert first["cached"] is False and second["cached"] is True
+    assert second["job_id"] == first["job_id"]
+    assert "entangled_wager" not in second
+    assert len(local_odds) == 1
+
+    env(ODDS_TTL_SECONDS="0")
+    assert odds.get_odds()["job_id"] != first["job_id"]
+    assert len(local_odds) == 2
+
+
+def test_failed_over_odds_not_cached_for_routed_backend(local_odds, monkeypatch):
+    """Test that a sweep that failed over is cached for the backend it ran on only."""
+    def failing_over(runner, plays, shots, backend_name=None):
+        return runner(plays, shots=shots, backend_name="local:statevector")
+
+    monkeypatch.setattr(odds, "run_routed", failing_over)
+    first = odds.get_odds()
+
+    assert first["backend"] == "local:statevector"
+    assert odds.get_odds()["cached"] is False
+    assert odds.get_odds(backend_name="local:statevector")["cached"] is True
+    assert len(local_odds) == 2
+
+
+def test_cached_odds_survive_route_changes(local_odds, env, monkeypatch):
+    """Test that cache hits record no route and any routable backend's fresh table is served."""
+    class Idle:
+        num_qubits = 127
+
+        def status(self):
+            return type("Status", (), {"pending_jobs": 0, "operational": True, "status_msg": "active"})()
+
+    env(QISKIT_BACKENDS="ibm:a,ibm:b", ROUTE_SLA_SECONDS="60")
+    monkeypatch.setattr(routing, "get_backend", lambda name: Idle())
+    monkeypatch.setattr(routing, "_router", None)
+    router = routing.get_router()
+    router.stop()
+    router.refresh()
+
+    def routes():
+        return sum(ROUTES.value(backend=name, reason=reason)
+                   for name in [*router.states, router.fallback] for reason in ("least_busy", "fallback"))
+
+    # The sweep fails over, so its table is cached for the fallback
+    monkeypatch.setattr(odds, "run_routed", lambda runner, plays, shots, backend_name=None:
+                        runner(plays, shots=shots, backend_name=router.fallback))
+    first = odds.get_odds()
+    before = routes()
+
+    # The least-busy choice moves to the other backend
+    router.states[router.choose(record=False)].pending_jobs = 5
+    second = odds.get_odds()
+
+    assert second["cached"] is True and second["job_id"] == first["job_id"]
+    assert routes() == before
+    assert len(local_odds) == 1
+    router.stop()
+    monkeypatch.setattr(routing, "_router", None)
+
+
+def test_odds_endpoint():
+    """Test the /odds endpoint and its game filter."""
+    from fastapi.testclient import TestClient
+    from quantum_games.server import app
+
+    client = TestClient(app)
+    body = client.get("/odds", params={"game": "entangled_wager", "shots": 500}).json()
+
+    assert body["shots"] == 500 and len(body["entangled_wager"]) == 400
+    assert "filter" not in body
+    assert client.get("/odds", params={"game": "slots"}).status_code == 422
@@ -0,0 +1,49 @@
+"""Tests for the array-backed Counts result type."""
+
+import json
+
+import numpy as np
+import pytest
+from quantum_games.multiplex import split_counts
+from quantum_games.results import Counts, to_jsonable
+
+
+def test_from_memory_matches_bitstring_counts():
+    """Test that packed shots histogram like BitArray.get_counts()."""
+    # Three bits, big-endian bytes per shot: 0b101, 0b101, 0b011
+    memory = np.array([[5], [5], [3]], dtype=np.uint8)
+    counts = Counts.from_memory(memory, 3)
+
+    assert counts == {"101": 2, "011": 1}
+    assert counts["101"] == 2 and counts.get("111", 0) == 0
+    assert counts.shots == 3 and len(counts) == 2
+    assert list(counts.outcomes) == [3, 5]
+
+
+def test_vectorized_helpers():
+    """Test bit, parity and marginal helpers against hand-computed values."""
+    counts = Counts.from_dict({"00": 40, "11": 35, "01": 15, "10": 10})
+
+    assert counts.ones(0) == 50
+    assert counts.ones(1) == 45
+    assert counts.even_parity() == 75
+    assert counts.expectation() == pytest.approx(0.5)
+    assert counts.marginal([1]) == {"0": 55, "1": 45}
+    assert list(counts.histogram()) == [40, 15, 10, 35]
+
+
+def test_split_counts_of_packed_slots():
+    """Test that per-slot marginals come from the joint outcome array."""
+    joint = Counts.from_dict({"0110": 7, "1001": 3})
+
+    first, second = split_counts(joint, [(0, 2), (2, 2)])
+    assert first == {"10": 7, "01": 3}
+    assert second == {"01": 7, "10": 3}
+
+
+def test_json_boundary():
+    """Test that counts only become bitstring dicts when serialized."""
+    counts = Counts.from_dict({"1": 3, "0": 1})
+
+    assert counts._dict is None
+    assert json.loads(json.dumps({"counts": counts}, default=to_jsonable)) == {"counts": {"0": 1, "1": 3}}
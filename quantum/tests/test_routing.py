@@ -0,0 +1,112 @@
+"""Tests for least-busy backend routing and local failover."""
+
+import pytest
+from quantum_games import routing
+from quantum_games.games import play_batch, play_filter
+from quantum_games.routing import BackendRouter, required_qubits
+
+
+class StubStatus:
+    def __init__(self, pending_jobs, operational=True):
+        self.pending_jobs = pending_jobs
+        self.operational = operational
+        self.status_msg = "active" if operational else "maintenance"
+
+
+class StubBackend:
+    def __init__(self, pending_jobs, num_qubits=127, operational=True):
+        self.num_qubits = num_qubits
+        self._status = StubStatus(pending_jobs, operational)
+
+    def status(self):
+        return self._status
+
+
+@pytest.fixture
+def stub_backends(monkeypatch):
+    """Route over stubbed remotes; returns the name -> backend table to edit."""
+    backends = {}
+    monkeypatch.setattr(routing, "get_backend", lambda name: backends[name])
+    return backends
+
+
+def test_least_busy_backend_wins(stub_backends):
+    """Test that the backend with the shortest expected wait is chosen."""
+    stub_backends.update({"ibm:busy": StubBackend(20), "ibm:quiet": StubBackend(2), "ibm:down": StubBackend(0, operational=False)})
+    router = BackendRouter(list(stub_backends), sla_s=100, job_seconds=1.0)
+    router.refresh()
+
+    assert router.choose() == "ibm:quiet"
+
+
+def test_fallback_when_over_sla_or_too_small(stub_backends):
+    """Test local failover when every remote is too slow or too narrow."""
+    stub_backends.update({"ibm:a": StubBackend(50), "ibm:small": StubBackend(0, num_qubits=5)})
+    router = BackendRouter(list(stub_backends), fallback="local:analytic", sla_s=10, job_seconds=1.0)
+    router.refresh()
+
+    assert router.choose(num_qubits=2) == "ibm:small"
+    assert router.choose(num_qubits=20) == "local:analytic"
+
+    router.mark_down("ibm:small", "test")
+    assert router.choose(num_qubits=2) == "local:analytic"
+
+
+def test_required_qubits():
+    """Test that job width comes from the widest play."""
+    assert required_qubits([("filter", [0.1]), ("entangled_pair", [0.2])]) == 2
+    assert required_qubits([("slots", [0.1] * 7)]) == 7
+
+
+def test_unpolled_router_falls_back_without_polling(stub_backends, monkeypatch):
+    """Test that jobs before the first poll go to the fallback instead of polling inline."""
+    stub_backends["ibm:quiet"] = StubBackend(0)
+    router = BackendRouter(list(stub_backends), fallback="local:analytic", sla_s=100, job_seconds=1.0)
+    refresh = router.refresh
+    monkeypatch.setattr(router, "refresh", lambda: pytest.fail("choose() polled status"))
+
+    assert router.choose() == "local:analytic"
+    assert router.wait_ready(0) is False
+
+    refresh()
+    assert router.wait_ready(0) is True
+    assert router.choose() == "ibm:quiet"
+
+
+def test_plays_route_and_audit_backend(env, monkeypatch):
+    """Test that plays follow the router and record where they ran."""
+    env(QISKIT_BACKENDS="fake:fake_manila", ROUTE_SLA_SECONDS="60", ROUTE_JOB_SECONDS="1", BATCH_WINDOW_MS="0")
+    monkeypatch.setattr(routing, "_router", None)
+    router = routing.get_router()
+    router.stop()
+    router.refresh()
+
+    # Idle snapshot device: the job goes to it
+    assert play_filter(5, 100)["audit"]["backend"] == "fake_manila"
+
+    # Long queue: every play fails over to the local engine
+    router.states["fake:fake_manila"].pending_jobs = 1000
+    assert play_filter(5, 100)["audit"]["backend"] == "local:analytic"
+    results = play_batch([{"game": "filter", "qcount": 3}, {"game": "entangled_wager", "qa": 1, "qb": 2}], shots=100)
+    assert {r["audit"]["backend"] for r in results} == {"local:analytic"}
+
+
+def test_failed_job_fails_over(env, monkeypatch, stub_backends):
+    """Test that a job erroring on its routed backend is retried on the fallback."""
+    env(QISKIT_BACKENDS="ibm:flaky")
+    stub_backends["ibm:flaky"] = StubBackend(0)
+    monkeypatch.setattr(routing, "_router", None)
+    routing.get_router().stop()
+    routing.get_router().refresh()
+
+    calls = []
+
+    def runner(plays, shots, backend_name):
+        calls.append(backend_name)
+        if backend_name == "ibm:flaky":
+            raise RuntimeError("device in maintenance")
+        return {"backend": backend_name}
+
+    assert routing.run_routed(runner, [("filter", [0.1])], 100)["backend"] == "local:analytic"
+    assert calls == ["ibm:flaky", "local:analytic"]
+    assert routing.get_router().states["ibm:flaky"].operational is False
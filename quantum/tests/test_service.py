@@ -0,0 +1,73 @@
+"""Tests for backend and sampler caching in the runtime service."""
+
+import time
+import pytest
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+from quantum_games import service
+from quantum_games.circuits import make_filter_circuit
+
+
+@pytest.fixture
+def fake_backend():
+    """Register a fake IBM backend in the service cache."""
+    backend = FakeManilaV2()
+    service._backend_cache["fake_manila"] = (backend, time.monotonic())
+    yield backend
+    service._close_sampler("fake_manila")
+    service._backend_cache.pop("fake_manila", None)
+
+
+def test_sampler_is_reused(fake_backend):
+    """Test that run_sampler reuses one sampler per backend."""
+    from qiskit import transpile
+
+    first = service.get_sampler("fake_manila")
+    circuit = transpile(make_filter_circuit(3)[0], fake_backend)
+    result = service.run_sampler(circuit, shots=50, backend_name="fake_manila")
+
+    assert service.get_sampler("fake_manila") is first
+    assert result["backend"] == "fake_manila"
+    assert sum(result["counts"].values()) == 50
+
+
+def test_backend_cache_expires(fake_backend, monkeypatch, env):
+    """Test that stale backends are re-fetched and their samplers rebuilt."""
+    refreshed = FakeManilaV2()
+
+    class StubService:
+        def backend(self, name):
+            assert name == "fake_manila"
+            return refreshed
+
+    monkeypatch.setattr(service, "get_service", lambda: StubService())
+    env(BACKEND_CACHE_TTL="60")
+    old_sampler = service.get_sampler("fake_manila")
+
+    # Still fresh: no refetch
+    assert service.get_backend("fake_manila") is fake_backend
+
+    service._backend_cache["fake_manila"] = (fake_backend, time.monotonic() - 120)
+    assert service.get_backend("fake_manila") is refreshed
+    assert service.get_sampler("fake_manila") is not old_sampler
+
+
+def test_invalid_execution_mode(env):
+    """Test that unknown execution modes are rejected."""
+    env(SAMPLER_EXECUTION_MODE="turbo")
+
+    with pytest.raises(ValueError):
+        service.get_execution_mode()
+
+
+def test_fake_backend_spec():
+    """Test that fake: specs resolve to runtime fake backends and run templates."""
+    from quantum_games.templates import make_pub
+
+    backend = service.get_backend("fake:fake_manila")
+    assert backend.name == "fake_manila"
+    assert service.get_backend("fake:fake_manila") is backend
+
+    result = service.run_sampler(make_pub("filter", [1.0], "fake:fake_manila"), shots=40,
+                                 backend_name="fake:fake_manila")
+    assert sum(result["counts"].values()) == 40
+    service._close_sampler("fake:fake_manila")
@@ -0,0 +1,69 @@
+"""Tests for typed settings and lazy imports."""
+
+import subprocess
+import sys
+import pytest
+from quantum_games.settings import Settings, get_settings
+
+
+def test_settings_from_env():
+    """Test that variables are parsed into their field types and blanks keep defaults."""
+    settings = Settings.from_env({
+        "DEFAULT_SHOTS": "2048",
+        "BACKEND_CACHE_TTL": "1.5",
+        "BATCH_MULTIPLEX": "true",
+        "METRICS_ENABLED": "0",
+        "LOCAL_SEED": "7",
+        "ENTROPY_BACKEND": "",
+    })
+
+    assert settings.default_shots == 2048
+    assert settings.backend_cache_ttl == 1.5
+    assert settings.batch_multiplex is True
+    assert settings.metrics_enabled is False
+    assert settings.local_seed == 7
+    assert settings.entropy_backend is None
+    assert settings.qiskit_backend == "ibmq_qasm_simulator"
+
+
+def test_invalid_settings_rejected():
+    """Test that unparsable values name the offending variable."""
+    with pytest.raises(ValueError, match="DEFAULT_SHOTS"):
+        Settings.from_env({"DEFAULT_SHOTS": "lots"})
+    with pytest.raises(ValueError, match="WARM_UP_ON_STARTUP"):
+        Settings.from_env({"WARM_UP_ON_STARTUP": "maybe"})
+
+
+def test_settings_loaded_once(env):
+    """Test that settings are cached until reloaded."""
+    env(DEFAULT_SHOTS="300")
+    settings = get_settings()
+
+    assert settings.default_shots == 300
+    assert get_settings() is settings
+
+
+@pytest.mark.parametrize("module", ["quantum_games.cli", "quantum_games.server"])
+def test_entry_points_defer_qiskit(module):
+    """Test that importing an entry point doesn't load qiskit, the runtime client or settings."""
+    code = (f"import sys, {module}, quantum_games.settings as s; "
+            "print('qiskit' in sys.modules, 'qiskit_ibm_runtime' in sys.modules, s._settings is not None)")
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+
+    assert output.split() == ["False", "False", "False"]
+
+
+def test_metrics_switch_follows_reload(env):
+    """Test that METRICS_ENABLED is read at use, so reloaded settings take effect."""
+    from quantum_games import metrics
+
+    env(METRICS_ENABLED="0")
+    before = metrics.STAGE_SECONDS.count(stage="reload-check", game="", backend="")
+    with metrics.timed("reload-check"):
+        pass
+    assert metrics.STAGE_SECONDS.count(stage="reload-check", game="", backend="") == before
+
+    env(METRICS_ENABLED="1")
+    with metrics.timed("reload-check"):
+        pass
+    assert metrics.STAGE_SECONDS.count(stage="reload-check", game="", backend="") == before + 1
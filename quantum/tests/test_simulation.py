@@ -0,0 +1,91 @@
+"""Tests for the Monte Carlo payout simulation."""
+
+import numpy as np
+import pytest
+from quantum_games import simulation
+from quantum_games.games import compute_payout
+from quantum_games.simulation import (
+    entangled_correlation_probability,
+    entangled_payouts,
+    filter_payouts,
+    filter_win_probability,
+    run_sweep,
+    simulate_filter,
+    summarize,
+)
+
+
+def test_vectorized_payouts_match_compute_payout():
+    """Test that array payouts agree with compute_payout round by round."""
+    shots = 10
+    ones = np.arange(shots + 1)
+
+    for n, payout in zip(ones, filter_payouts(ones, shots)):
+        result = {
+            "game_type": "filter",
+            "outcome": "win" if n > shots - n else "lose",
+            "win_probability": n / shots
+        }
+        assert payout == compute_payout(result, 1.0)
+
+    payout_a, payout_b = entangled_payouts(ones, shots)
+    for n, a, b in zip(ones, payout_a, payout_b):
+        if n > shots - n:
+            outcome, seat_a, seat_b = "player_a_wins", True, False
+        elif n < shots - n:
+            outcome, seat_a, seat_b = "player_b_wins", False, True
+        else:
+            outcome, seat_a, seat_b = "tie", True, True
+        payout = compute_payout({"game_type": "entangled_wager", "outcome": outcome}, 1.0)
+        assert a == (payout if seat_a else 0.0)
+        assert b == (payout if seat_b else 0.0)
+
+
+def test_simulate_filter_is_reproducible():
+    """Test summary statistics and seeding."""
+    first = simulate_filter(15, shots=1, rounds=20000, seed=3)
+    second = simulate_filter(15, shots=1, rounds=20000, seed=3)
+
+    assert first == second
+    # One shot: win with probability p, paid min(10, 1/1) = 1x
+    assert abs(first["rtp"] - filter_win_probability(15)) < 0.02
+    assert first["house_edge"] == 1.0 - first["rtp"]
+    assert set(first["risk_of_ruin"]) == {10, 50, 100}
+
+
+def test_chunked_statistics_match_one_pass(monkeypatch):
+    """Test that statistics accumulated chunk by chunk equal a summary of all rounds at once."""
+    monkeypatch.setattr(simulation, "CHUNK_ROUNDS", 3500)
+    chunked = simulate_filter(4, shots=10, rounds=20000, seed=5, session_rounds=1000)
+
+    rng = np.random.default_rng(5)
+    p = filter_win_probability(4)
+    ones = np.concatenate([rng.binomial(10, p, size=n) for n in (3000,) * 6 + (2000,)])
+    whole = summarize(filter_payouts(ones, 10), session_rounds=1000)
+
+    assert chunked["rounds"] == whole["rounds"] == 20000
+    for name in ("rtp", "variance", "std"):
+        assert chunked[name] == pytest.approx(whole[name], rel=1e-9)
+    assert chunked["risk_of_ruin"] == whole["risk_of_ruin"]
+
+
+def test_run_sweep_grid():
+    """Test grid sizes for both games."""
+    assert len(run_sweep("filter", [10, 100], rounds=1000, qcounts=range(1, 4), seed=0)) == 6
+
+    results = run_sweep("entangled_wager", [10], rounds=1000, qcounts=range(1, 3), seed=0, workers=2)
+    assert [(r["qcount_a"], r["qcount_b"]) for r in results] == [(1, 1), (1, 2), (2, 1), (2, 2)]
+    assert "player_b" in results[0]
+
+
+def test_entangled_odds_agree_with_live_tables(env):
+    """Test that the simulator's per-bet odds agree with the odds tables the games quote."""
+    from quantum_games import odds
+
+    env(QISKIT_BACKEND="local:analytic", ODDS_SHOTS="4000")
+    odds.clear_odds_cache()
+    table = odds.compute_odds()["entangled_wager"]
+
+    for row in table[::37]:
+        expected = entangled_correlation_probability(row["qa"], row["qb"])
+        assert abs(row["p_correlated"] - expected) < 0.03
@@ -0,0 +1,83 @@
+"""Tests for the Slots game and its vectorized paytable."""
+
+import math
+
+import numpy as np
+import pytest
+from quantum_games.games import compute_payout, play_slots
+from quantum_games.ledger import AuditLedger
+from quantum_games.paytable import Paytable
+from quantum_games.results import Counts
+from quantum_games.verify import verify_record
+
+
+def spin_pay(paytable, value):
+    """Reference per-spin pay, one rule at a time."""
+    bits = [(value >> r) & 1 for r in range(paytable.n_reels)]
+    pay = sum(line_pay for reels, line_pay in paytable.lines if all(bits[r] for r in reels))
+    pay /= max(len(paytable.lines), 1)
+    return pay + paytable.scatter[sum(bits)]
+
+
+def test_paytable_matches_per_spin_reference():
+    """Test the mask/popcount evaluation against a per-shot loop."""
+    paytable = Paytable(6, [([0, 1, 2], 8.0), ([3, 4, 5], 8.0), ([0, 5], 2.0)], {4: 1.5, 6: 50.0})
+    samples = np.random.default_rng(7).integers(0, 64, size=5000, dtype=np.uint64)
+    counts = Counts.from_samples(samples, 6)
+
+    expected = sum(spin_pay(paytable, int(v)) for v in samples) / len(samples)
+    assert paytable.evaluate(counts)["return_multiplier"] == pytest.approx(expected)
+    assert paytable.evaluate(counts.to_dict()) == paytable.evaluate(counts)
+
+
+@pytest.mark.parametrize("n_reels", [1, 3, 8, 20])
+def test_default_paytable_return(n_reels):
+    """Test that fair reels return 87.5% of the bet at every machine size."""
+    paytable = Paytable.default(n_reels)
+    outcomes = np.arange(1 << n_reels, dtype=np.uint64)
+
+    assert paytable.multipliers(outcomes).mean() == pytest.approx(0.875)
+
+
+def test_play_slots_records_and_verifies(tmp_path, env):
+    """Test a wide round end to end: payout, ledger round trip and audit replay."""
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0")
+    result = play_slots(20, shots=20000)
+
+    assert result["game_type"] == "slots"
+    assert result["counts"].shots == 20000
+    assert compute_payout(result, 10.0) == pytest.approx(10.0 * result["return_multiplier"])
+
+    ledger = AuditLedger(str(tmp_path), segment_bytes=1 << 20)
+    ledger.append(result, compute_payout(result, 1.0))
+    ledger.close()
+    record = next(AuditLedger(str(tmp_path), read_only=True).find_by_time())
+
+    assert record["params"]["angles"] == result["params"]["angles"]
+    assert record["counts"] == result["counts"]
+    assert verify_record(record) == {}
+
+
+def test_play_slots_rejects_loaded_reels():
+    """Test that reels can't be rotated past the fair angle."""
+    with pytest.raises(ValueError):
+        play_slots(3, angles=[math.pi, 0.1, 0.1])
+    with pytest.raises(ValueError):
+        play_slots(3, angles=[0.1, 0.1])
+
+
+def test_custom_paytable_refused_when_ledgered(tmp_path, monkeypatch, env):
+    """Test that rules the verifier can't replay are refused for ledgered rounds."""
+    from quantum_games import ledger as ledger_module
+
+    custom = Paytable(3, [([0, 1, 2], 9.0)])
+    env(QISKIT_BACKEND="local:analytic", BATCH_WINDOW_MS="0")
+    assert play_slots(3, shots=100, paytable=custom)["game_type"] == "slots"
+
+    env(AUDIT_LEDGER_DIR=str(tmp_path))
+    monkeypatch.setattr(ledger_module, "_ledger", None)
+    with pytest.raises(ValueError, match="paytable"):
+        play_slots(3, shots=100, paytable=custom)
+    assert play_slots(3, shots=100, paytable=Paytable.default(3))["game_type"] == "slots"
+    ledger_module.get_audit_ledger().close()
+    monkeypatch.setattr(ledger_module, "_ledger", None)
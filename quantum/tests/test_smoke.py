@@ -89,3 +89,31 @@ def test_filter_circuit_theta_scaling():
     # But should be capped at pi/2
     import math
     assert metadata10["theta"] <= math.pi / 2
+
+
+def test_circuit_hash_versions():
+    """Test that the structural hash is versioned and legacy hashes still work."""
+    circuit, _ = make_filter_circuit(5)
+    
+    current = get_circuit_hash(circuit)
+    legacy = get_circuit_hash(circuit, version=1)
+    
+    assert current != legacy
+    assert len(legacy) == 64
+    assert legacy == get_circuit_hash(make_filter_circuit(5)[0], version=1)
+    
+    with pytest.raises(ValueError):
+        get_circuit_hash(circuit, version=99)
+
+
+def test_circuit_fingerprint_normalizes_params():
+    """Test that float noise below the fingerprint precision is ignored."""
+    from quantum_games.circuits import circuit_fingerprint
+    
+    circuit1, _ = make_entangled_pair(0.5)
+    circuit2, _ = make_entangled_pair(0.5 + 1e-13)
+    circuit3, _ = make_entangled_pair(0.6)
+    
+    assert circuit_fingerprint(circuit1) == circuit_fingerprint(circuit2)
+    assert circuit_fingerprint(circuit1) != circuit_fingerprint(circuit3)
+    assert "cx()[0,1][]" in circuit_fingerprint(circuit1)
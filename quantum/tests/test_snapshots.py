@@ -0,0 +1,127 @@
+"""Tests for shared on-disk backend snapshots."""
+
+import time
+import pytest
+from qiskit_ibm_runtime import IBMBackend
+from qiskit_ibm_runtime.fake_provider import FakeManilaV2
+from quantum_games import service, snapshots
+from quantum_games.snapshots import BackendSnapshot, SnapshotStore
+
+
+@pytest.fixture
+def manila():
+    return BackendSnapshot.from_backend(FakeManilaV2())
+
+
+@pytest.fixture
+def snapshot_env(tmp_path, env):
+    """Point BACKEND_SNAPSHOT_DIR at a temporary directory and clear cached backends."""
+    env(BACKEND_SNAPSHOT_DIR=str(tmp_path), BACKEND_CACHE_TTL="60")
+    yield SnapshotStore(str(tmp_path))
+    for name in ("fake_manila", "ibm:fake_manila", "snapshot:fake_manila"):
+        service._close_sampler(name)
+        service._backend_cache.pop(name, None)
+
+
+def test_round_trip(tmp_path, manila):
+    """Test that a saved snapshot loads back with the same calibration and target."""
+    store = SnapshotStore(str(tmp_path))
+    store.save(manila)
+    loaded = store.load("fake_manila")
+
+    assert loaded.version == manila.version != ""
+    assert loaded.target.num_qubits == 5
+    assert loaded.properties.t1(0) == manila.properties.t1(0)
+    assert store.header("fake_manila")["fetched_at"] == pytest.approx(manila.fetched_at)
+
+
+def test_corrupt_snapshot_is_ignored(tmp_path, manila):
+    """Test that a damaged file reads as missing instead of failing."""
+    store = SnapshotStore(str(tmp_path))
+    store.save(manila)
+    with open(store.path("fake_manila"), "r+b") as f:
+        f.truncate(200)
+
+    assert store.load("fake_manila") is None
+    with pytest.raises(ValueError):
+        store.path("../etc/passwd")
+
+
+def test_one_refresh_across_processes(tmp_path, manila):
+    """Test that fresh snapshots aren't refetched and a held lock serves the stale one."""
+    fcntl = pytest.importorskip("fcntl")
+    store = SnapshotStore(str(tmp_path))
+    fetches = []
+
+    def fetch():
+        fetches.append(1)
+        return BackendSnapshot.from_backend(FakeManilaV2())
+
+    first = store.get("fake_manila", fetch, ttl=60)
+    assert store.get("fake_manila", fetch, ttl=60).version == first.version
+    assert len(fetches) == 1
+
+    # Stale, but another process holds the refresh lock: keep serving the old snapshot
+    manila.fetched_at = time.time() - 120
+    store.save(manila)
+    with open(store.path("fake_manila") + ".lock", "a") as held:
+        fcntl.flock(held, fcntl.LOCK_EX)
+        stale = store.get("fake_manila", fetch, ttl=60)
+        fcntl.flock(held, fcntl.LOCK_UN)
+    assert stale.age > 60 and len(fetches) == 1
+
+    assert store.get("fake_manila", fetch, ttl=60).age < 60
+    assert len(fetches) == 2
+
+
+def test_ibm_backend_from_snapshot(snapshot_env, manila, monkeypatch):
+    """Test that a worker builds its IBM backend from the snapshot without fetching it."""
+    class StubService:
+        _active_api_client = None
+
+        def backend(self, name):
+            raise AssertionError("backend should come from the snapshot")
+
+    monkeypatch.setattr(service, "get_service", lambda: StubService())
+    snapshot_env.save(manila)
+
+    backend = service.get_backend("ibm:fake_manila")
+    assert isinstance(backend, IBMBackend)
+    assert backend.target.num_qubits == 5
+    assert backend.properties().last_update_date.isoformat() == manila.version
+
+
+def test_offline_snapshot_backend(snapshot_env, manila):
+    """Test that snapshot: backends simulate a stored backend offline."""
+    from qiskit import transpile
+    from quantum_games.circuits import make_filter_circuit
+
+    with pytest.raises(ValueError):
+        service.get_backend("snapshot:fake_manila")
+
+    snapshot_env.save(manila)
+    backend = service.get_backend("snapshot:fake_manila")
+    circuit = transpile(make_filter_circuit(3)[0], backend)
+    result = service.run_sampler(circuit, shots=50, backend_name="snapshot:fake_manila")
+
+    assert backend.num_qubits == 5
+    assert result["counts"].shots == 50
+
+
+def test_unchecked_runtime_fetches_backend(manila, monkeypatch):
+    """Test that runtime internals are only touched on versions the adapter was checked against."""
+    fetched = []
+
+    class StubService:
+        @property
+        def _active_api_client(self):
+            raise AssertionError("internals used on an unchecked runtime")
+
+        def backend(self, name, instance=None):
+            fetched.append(name)
+            return FakeManilaV2()
+
+    monkeypatch.setattr(snapshots, "_runtime_version", lambda: "0.99.0")
+    backend = manila.to_backend(StubService())
+
+    assert fetched == ["fake_manila"] and backend.num_qubits == 5
@@ -0,0 +1,44 @@
+"""Tests for parameterized circuit templates."""
+
+import math
+from quantum_games.circuits import (
+    filter_theta,
+    make_filter_circuit,
+    make_entangled_pair,
+    make_slots_circuit,
+    get_circuit_hash
+)
+from quantum_games.service import run_sampler
+from quantum_games.templates import get_template, get_transpiled_template, make_pub, template_hash
+
+
+def test_templates_are_built_once():
+    """Test that templates are cached."""
+    assert get_template("filter") is get_template("filter")
+    assert len(get_template("slots", 4).parameters) == 4
+
+
+def test_bound_template_hash_matches_builders():
+    """Test that binding a template reproduces the builder circuits' audit hash."""
+    theta = filter_theta(5)
+    assert template_hash("filter", (theta,)) == get_circuit_hash(make_filter_circuit(5)[0])
+
+    phase = 0.3 * math.pi
+    assert template_hash("entangled_pair", (phase,)) == get_circuit_hash(make_entangled_pair(phase)[0])
+
+    angles = (0.1, 0.2, 0.3)
+    assert template_hash("slots", angles, 3) == get_circuit_hash(make_slots_circuit(3, list(angles))[0])
+
+
+def test_local_backends_skip_transpilation():
+    """Test that local engines receive the logical template."""
+    assert get_transpiled_template("filter", "local:analytic") is get_template("filter")
+
+
+def test_sweep_runs_as_single_pub():
+    """Test that a 2D parameter sweep returns one histogram per row."""
+    thetas = [[filter_theta(q)] for q in range(1, 21)]
+    result = run_sampler([make_pub("filter", thetas, "local:analytic")], shots=200, backend_name="local:analytic")
+
+    assert len(result["counts"]) == 20
+    assert all(sum(counts.values()) == 200 for counts in result["counts"])
@@ -0,0 +1,55 @@
+"""Tests for bulk audit verification."""
+
+import io
+import json
+from quantum_games.games import compute_payout, play_batch
+from quantum_games.ledger import AuditLedger
+from quantum_games.settings import reload_settings
+from quantum_games.verify import verify_ledger, verify_record
+
+
+def write_ledger(directory, monkeypatch):
+    monkeypatch.setenv("QISKIT_BACKEND", "local:analytic")
+    reload_settings()
+    plays = [{"game": "filter", "qcount": q} for q in range(1, 21)]
+    plays += [{"game": "entangled_wager", "qa": a, "qb": 21 - a} for a in range(1, 21)]
+    results = play_batch(plays, shots=100)
+
+    # One tampered play: outcome flipped after the fact
+    results[3] = dict(results[3], outcome="win" if results[3]["outcome"] == "lose" else "lose")
+
+    ledger = AuditLedger(directory, segment_bytes=2048)
+    for result in results:
+        ledger.append(result, compute_payout(result, 1.0))
+    ledger.close()
+    return results
+
+
+def test_verify_record_detects_hash_mismatch(tmp_path, monkeypatch):
+    """Test that a forged circuit hash is reported."""
+    write_ledger(str(tmp_path), monkeypatch)
+    record = next(AuditLedger(str(tmp_path), read_only=True).find_by_time())
+
+    assert verify_record(record) == {}
+    record["audit"]["circuit_hash"] = "00" * 32
+    assert set(verify_record(record)) == {"circuit_hash"}
+
+
+def test_verify_ledger_reports_and_resumes(tmp_path, monkeypatch):
+    """Test the mismatch report and checkpoint resume."""
+    directory = str(tmp_path / "ledger")
+    results = write_ledger(directory, monkeypatch)
+    checkpoint = str(tmp_path / "verify.json")
+
+    report = io.StringIO()
+    summary = verify_ledger(directory, report, workers=2, checkpoint_path=checkpoint, chunk_records=7)
+
+    assert summary["records"] == len(results)
+    assert summary["mismatches"] == 1
+    mismatch = json.loads(report.getvalue())
+    assert mismatch["job_id"] == results[3]["audit"]["job_id"]
+    assert "outcome" in mismatch["problems"]
+
+    # Nothing left to do on a rerun from the checkpoint
+    again = verify_ledger(directory, io.StringIO(), workers=2, checkpoint_path=checkpoint)
+    assert again["records"] == len(results)